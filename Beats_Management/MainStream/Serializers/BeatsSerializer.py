@@ -18,6 +18,23 @@ class BeatsSerializer(serializers.Serializer):
             return obj.supplier.get_user_details().artist.name
 
 
+class BeatCatalogCardSerializer(serializers.Serializer):
+    id = serializers.IntegerField(source="submission_id")
+    artist = serializers.CharField()
+    title = serializers.CharField()
+    beats_artwork = serializers.ImageField()
+    genre = serializers.CharField()
+    sub_genre = serializers.CharField()
+    moods = serializers.ListField(child=serializers.CharField())
+    files_count = serializers.IntegerField()
+    likes_count = serializers.IntegerField()
+    downloads_count = serializers.IntegerField()
+
+    class Meta:
+        fields = ("id", "artist", "title", "beats_artwork", "genre", "sub_genre", "moods", "files_count",
+                  "likes_count", "downloads_count")
+
+
 class BeatsAudioFileSerializer(serializers.Serializer):
     id = serializers.IntegerField()
     file = serializers.FileField(source="file.file")
@@ -42,6 +59,28 @@ class BeatsAudioFileSerializer(serializers.Serializer):
                   "bpm_start_value", "bpm_end_value", "bpm_type", "key", "key_scale", "key_type", "beat_type", "source")
 
 
+class LibraryBeatAudioFileSerializer(BeatsAudioFileSerializer):
+    is_liked = serializers.SerializerMethodField(method_name="get_is_liked")
+    is_downloaded = serializers.SerializerMethodField(method_name="get_is_downloaded")
+    in_collection = serializers.SerializerMethodField(method_name="get_in_collection")
+
+    class Meta:
+        fields = BeatsAudioFileSerializer.Meta.fields + ("is_liked", "is_downloaded", "in_collection")
+
+    def get_flag(self, obj, flag):
+        library = self.context.get("library")
+        return library(obj.id)[flag] if library else False
+
+    def get_is_liked(self, obj):
+        return self.get_flag(obj, "is_liked")
+
+    def get_is_downloaded(self, obj):
+        return self.get_flag(obj, "is_downloaded")
+
+    def get_in_collection(self, obj):
+        return self.get_flag(obj, "in_collection")
+
+
 class BeatSerializer(serializers.Serializer):
     id = serializers.IntegerField()
     artist = serializers.SerializerMethodField(method_name="get_artist")
@@ -69,10 +108,11 @@ class BeatSerializer(serializers.Serializer):
     def get_demo_file(obj):
         return BeatsAudioFileSerializer(obj.beat.demo_file).data
 
-    @staticmethod
-    def get_audio_files(obj):
-        audio_files = obj.beat.audio_files.all()
-        return BeatsAudioFileSerializer(audio_files, many=True).data
+    def get_audio_files(self, obj):
+        audio_files = self.context.get("audio_files")
+        if audio_files is None:
+            audio_files = obj.beat.audio_files.all()
+        return LibraryBeatAudioFileSerializer(audio_files, many=True, context=self.context).data
 
     @staticmethod
     def get_artist(obj):
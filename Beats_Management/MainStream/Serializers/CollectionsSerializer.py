@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from Beats_Management.caches import beat_library
 from Beats_Management.models import BeatCollections, BeatAudioFiles, BeatCollectionFiles
 from Utilities import generate_humanize_time
 from Utilities.Enums import FileStatus, SubmissionStatus
@@ -29,7 +30,7 @@ class BeatsCollectionsSerializer(serializers.ModelSerializer):
 
         user = self.context.get("user")
 
-        collection = user.collections.filter(name=name, member=user).first()
+        collection = user.beat_collections.filter(name=name, member=user).first()
 
         if collection:
             raise serializers.ValidationError("collection already exists")
@@ -81,12 +82,12 @@ class BeatsCollectionAddSerializer(serializers.Serializer):
 
         beat = audio_file.beats.first()
 
-        if beat.id != beat_id and beat.submissions().first().status != SubmissionStatus.APPROVED.value:
+        if beat.id != beat_id and not beat.beat_submissions.filter(status=SubmissionStatus.APPROVED.value).exists():
             raise serializers.ValidationError("audio file not found.")
 
         user = self.context.get("user")
 
-        collection = user.collections.filter(pk=collection_id, name=collection_name).first()
+        collection = user.beat_collections.filter(pk=collection_id, name=collection_name).first()
 
         if not collection:
             raise serializers.ValidationError("collection not found")
@@ -97,7 +98,9 @@ class BeatsCollectionAddSerializer(serializers.Serializer):
         return attrs
 
     def create(self, validated_data):
-        return BeatCollectionFiles.objects.get_or_create(**validated_data)
+        collection_file = BeatCollectionFiles.objects.get_or_create(**validated_data)
+        beat_library.invalidate(validated_data["collection"].member_id)
+        return collection_file
 
 
 class BeatsCollectionRemoveSerializer(serializers.Serializer):
@@ -142,6 +145,7 @@ class BeatsCollectionRemoveSerializer(serializers.Serializer):
             raise serializers.ValidationError("file not found in given collection")
 
         collection_file.delete()
+        beat_library.invalidate(collection_file.collection.member_id)
 
         return attrs
 
@@ -154,7 +158,7 @@ class BeatsViewCollectionsFilesSerializer(serializers.Serializer):
     file_name = serializers.CharField(source="audio_file.file.file_name")
     beat_name = serializers.CharField(source="beat.title")
     artist = serializers.SerializerMethodField(method_name="get_artist")
-    beats_artwork = serializers.FileField(source="beat.artwork")
+    beats_artwork = serializers.FileField(source="beat.beats_artwork")
     created_at = serializers.SerializerMethodField(method_name="get_created_at")
 
     class Meta:
@@ -167,7 +171,7 @@ class BeatsViewCollectionsFilesSerializer(serializers.Serializer):
 
     @staticmethod
     def get_artist(obj):
-        submissions = obj.beat.submissions.all()[0]
+        submissions = obj.beat.beat_submissions.all()[0]
         if submissions.supplier.is_admin:
             return submissions.supplier.get_user_details().name
         if submissions.supplier.is_supplier:
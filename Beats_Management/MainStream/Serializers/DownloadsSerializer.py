@@ -1,6 +1,8 @@
 from django.db import transaction
 from rest_framework import serializers
 
+from Beats_Management.caches import beat_library
+from Beats_Management.counters import beat_counters, beat_file_counters
 from Beats_Management.models import BeatAudioFiles, Beats, BeatDownloads, BeatFileDownloads
 from Utilities import generate_humanize_time
 from Utilities.Enums import FileStatus, SubmissionStatus
@@ -12,6 +14,7 @@ class BeatsDownloadsSerializer(serializers.Serializer):
         error_messages={"required": "beat_id is required", "blank": "beat_id cannot be blank"}
     )
     audio_file_id = serializers.IntegerField(
+        required=False,
         error_messages={"required": "audio_file_id is required", "blank": "audio_file_id cannot be blank"}
     )
     complete_beat = serializers.BooleanField(
@@ -50,17 +53,17 @@ class BeatsDownloadsSerializer(serializers.Serializer):
 
             beat = audio_file.beats.first()
 
-            if beat.id != beat_id and beat.submissions.all().first().status != SubmissionStatus.APPROVED.value:
+            if beat.id != beat_id and not beat.beat_submissions.filter(status=SubmissionStatus.APPROVED.value).exists():
                 raise serializers.ValidationError("audio file not found in beat.")
 
             audio_files.append(audio_file)
         else:
             beat = Beats.objects.filter(pk=beat_id).first()
 
-            if not beat or beat.submissions.all().first().status != SubmissionStatus.APPROVED.value:
+            if not beat or not beat.beat_submissions.filter(status=SubmissionStatus.APPROVED.value).exists():
                 raise serializers.ValidationError("beat not found.")
 
-            audio_files.extend(beat.audio_files.all())
+            audio_files.extend(beat.audio_files.select_related("file").filter(status=FileStatus.APPROVED.value))
 
         attrs["audio_files"] = audio_files
         attrs["beat"] = beat
@@ -73,13 +76,17 @@ class BeatsDownloadsSerializer(serializers.Serializer):
             beat = validated_data.get("beat")
             member = validated_data.get("member")
 
-            beat.downloads_count += 1
-            beat.save(update_fields=["downloads_count"])
+            beat_counters.add(beat.pk, "downloads_count")
             download = BeatDownloads.objects.get_or_create(beat=beat, member=member)[0]
+            downloaded = set(BeatFileDownloads.objects.filter(download=download, audio_file__in=audio_files).
+                             values_list("audio_file_id", flat=True))
+            BeatFileDownloads.objects.bulk_create(
+                [BeatFileDownloads(download=download, audio_file=audio_file)
+                 for audio_file in audio_files if audio_file.pk not in downloaded],
+                ignore_conflicts=True)
+            beat_library.invalidate(member.pk)
             for audio_file in audio_files:
-                audio_file.downloads_count += 1
-                audio_file.save(update_fields=["downloads_count"])
-                BeatFileDownloads.objects.get_or_create(download=download, audio_file=audio_file)
+                beat_file_counters.add(audio_file.pk, "downloads_count", group=beat.pk)
 
         return download
 
@@ -89,14 +96,14 @@ class BeatsViewDownloadsSerializer(serializers.Serializer):
     beat_id = serializers.IntegerField(source="beat.id")
     artist = serializers.SerializerMethodField(method_name="get_artist")
     title = serializers.CharField(source="beat.title")
-    artwork = serializers.ImageField(source="beat.artwork")
+    artwork = serializers.ImageField(source="beat.beats_artwork")
 
     class Meta:
         fields = ("id", "beat_id", "artist", "title", "artwork")
 
     @staticmethod
     def get_artist(obj):
-        submissions = obj.beat.submissions.all()[0]
+        submissions = obj.beat.beat_submissions.all()[0]
         if submissions.supplier.is_admin:
             return submissions.supplier.get_user_details().name
         if submissions.supplier.is_supplier:
@@ -110,7 +117,7 @@ class BeatsViewFileDownloadsSerializer(serializers.Serializer):
     file_name = serializers.CharField(source="audio_file.file.file_name")
     beat_name = serializers.CharField(source="download.beat.title")
     artist = serializers.SerializerMethodField(method_name="get_artist")
-    artwork = serializers.FileField(source="download.beat.artwork")
+    artwork = serializers.FileField(source="download.beat.beats_artwork")
     created_at = serializers.SerializerMethodField(method_name="get_created_at")
 
     class Meta:
@@ -122,7 +129,7 @@ class BeatsViewFileDownloadsSerializer(serializers.Serializer):
 
     @staticmethod
     def get_artist(obj):
-        submissions = obj.download.beat.submissions.all()[0]
+        submissions = obj.download.beat.beat_submissions.all()[0]
         if submissions.supplier.is_admin:
             return submissions.supplier.get_user_details().name
         if submissions.supplier.is_supplier:
@@ -1,6 +1,8 @@
 from django.db import transaction
 from rest_framework import serializers
 
+from Beats_Management.caches import beat_library
+from Beats_Management.counters import beat_file_counters
 from Beats_Management.models import BeatAudioFiles, BeatLikes
 from Utilities import generate_humanize_time
 from Utilities.Validators import InputValidator
@@ -39,12 +41,6 @@ class BeatsLikesSerializer(serializers.Serializer):
         if beat.id != beat_id:
             raise serializers.ValidationError("audio file not found in beat.")
 
-        like = BeatLikes.objects.select_related("file").filter(file__id=audio_file_id, beat__id=beat_id,
-                                                           member=user).first()
-
-        if like:
-            raise serializers.ValidationError("Beat already liked.")
-
         attrs["audio_file"] = audio_file
         attrs["beat"] = beat
         attrs["member"] = user
@@ -56,10 +52,9 @@ class BeatsLikesSerializer(serializers.Serializer):
             beat = validated_data.get("beat")
             member = validated_data.get("member")
 
-            (like, created) = BeatLikes.objects.get_or_create(beat=beat, file=audio_file, member=member)
-            if created:
-                audio_file.likes_count += 1
-                audio_file.save(update_fields=["likes_count"])
+            like = BeatLikes.objects.create(beat=beat, file=audio_file, member=member)
+            beat_file_counters.add(audio_file.pk, "likes_count", group=beat.pk)
+            beat_library.invalidate(member.pk)
 
         return like
 
@@ -93,10 +88,11 @@ class BeatsUnLikesSerializer(serializers.Serializer):
         if not like:
             raise serializers.ValidationError("file not liked yet.")
 
-        like.file.likes_count -= 1
-        like.file.save(update_fields=["likes_count"])
-
-        like.delete()
+        # a concurrent unlike of the same like may have deleted it already, only the one that did decrements
+        deleted, _ = like.delete()
+        if deleted:
+            beat_file_counters.add(like.file_id, "likes_count", -1, group=like.beat_id)
+        beat_library.invalidate(user.pk)
         return attrs
 
 
@@ -119,7 +115,7 @@ class BeatsViewLikedFilesSerializer(serializers.Serializer):
 
     @staticmethod
     def get_artist(obj):
-        submissions = obj.beat.submissions.all()[0]
+        submissions = obj.beat.beat_submissions.all()[0]
         if submissions.supplier.is_admin:
             return submissions.supplier.get_user_details().name
         if submissions.supplier.is_supplier:
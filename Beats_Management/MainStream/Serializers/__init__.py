@@ -2,4 +2,5 @@ from .CollectionsSerializer import BeatsCollectionsSerializer, BeatsCollectionAd
       BeatsCollectionsDropdownSerializer, BeatsViewCollectionsFilesSerializer
 from .DownloadsSerializer import BeatsDownloadsSerializer, BeatsViewDownloadsSerializer, BeatsViewFileDownloadsSerializer
 from .LikesSerializer import BeatsLikesSerializer, BeatsUnLikesSerializer, BeatsViewLikedFilesSerializer
-from .BeatsSerializer import BeatsSerializer, BeatSerializer
+from .BeatsSerializer import BeatsSerializer, BeatSerializer, BeatCatalogCardSerializer, \
+    LibraryBeatAudioFileSerializer
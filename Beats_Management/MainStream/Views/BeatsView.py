@@ -1,4 +1,4 @@
-from django.db.models import Count
+from django.db.models import F
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -6,8 +6,15 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from Beats_Management.MainStream.Serializers import BeatsSerializer, BeatSerializer
-from Beats_Management.models import BeatsSubmissions
+from Beats_Management.MainStream.Serializers import BeatsSerializer, BeatSerializer, BeatCatalogCardSerializer, \
+    LibraryBeatAudioFileSerializer
+from Beats_Management.caches import beat_library
+from Beats_Management.counters import merge_card_counts
+from Beats_Management.indexes import beat_files_facets
+from Beats_Management.models import BeatAudioFiles, BeatsSubmissions, BeatCatalogCard
+from Utilities.AudioFilesPage import audio_files_page
+from Utilities.AudioFilesQuerySet import AudioFilesQuerySet
+from Utilities.CursorPagination import CursorPaginator
 from Utilities.Enums import BeatTypes, SubmissionStatus
 from Utilities.Permissions import MemberPermissions, AdminPermissions 
 
@@ -19,16 +26,14 @@ class GetBeatsView(APIView):
     @swagger_auto_schema(manual_parameters=[
         openapi.Parameter("beat_type", in_=openapi.IN_QUERY,
                           type=openapi.TYPE_STRING, required=True)
-    ], responses={200: BeatsSerializer(many=True)})
+    ], responses={200: BeatCatalogCardSerializer(many=True)})
     def get(request):
         """This function return the Discover Page Beats"""
         beat_type = request.GET.get("beat_type")
         if beat_type in BeatTypes.list():
-            beats = BeatsSubmissions.objects.prefetch_related("supplier", "supplier__supplier_details",
-                                                             "supplier__supplier_details__artist",
-                                                             "beat").filter(beat_type=beat_type,
-                                                                            status=SubmissionStatus.APPROVED.value)[:15]
-            beats_serializer = BeatsSerializer(beats, many=True)
+            beats = merge_card_counts(BeatCatalogCard.objects.annotate(beat_id=F("submission__beat_id")).filter(
+                beat_type=beat_type).order_by("-created_at", "-id")[:15])
+            beats_serializer = BeatCatalogCardSerializer(beats, many=True)
             return Response({'detail': beats_serializer.data}, status=status.HTTP_200_OK)
         return Response({"detail": "invalid beat_type."}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -48,34 +53,79 @@ class ViewBeatView(APIView):
         id_ = request.GET.get("id")
         beat_type = request.GET.get("beat_type")
         if beat_type in BeatTypes.list():
-            beat = (BeatsSubmissions.objects.prefetch_related("supplier", "supplier__supplier_details",
-                                                             "supplier__supplier_details__artist",
-                                                             "beat", "beat__demo_file", "beat__genre",
-                                                             "beat__sub_genre"
-                                                             ).filter(pk=id_, beat_type=beat_type,
-                                                                      status=SubmissionStatus.APPROVED.value
-                                                                      ).annotate(
-                files_count=Count('beat__audio_files'))).first()
+            beat = BeatsSubmissions.load_detail(id_, beat_type)
             if beat:
-                beat_serializer = BeatSerializer(beat)
-                return Response({'detail': beat_serializer.data}, status=status.HTTP_200_OK)
+                audio_files = BeatAudioFiles.objects.filter(beats=beat.beat_id)
+                try:
+                    audio_files, next_cursor = audio_files_page(request, audio_files, beat_files_facets.fields)
+                except ValueError as e:
+                    return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+                beat_serializer = BeatSerializer(beat, context={"library": beat_library.flags(request.user.id),
+                                                                "audio_files": audio_files})
+                return Response({'detail': beat_serializer.data, 'next_cursor': next_cursor},
+                                status=status.HTTP_200_OK)
             return Response({"detail": "beat not found."}, status=status.HTTP_404_NOT_FOUND)
         return Response({"detail": "invalid beat_type."}, status=status.HTTP_400_BAD_REQUEST)
 
 
+class ViewBeatFilesView(APIView):
+    permission_classes = [IsAuthenticated, MemberPermissions]
+
+    @staticmethod
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("id", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+        openapi.Parameter("beat_type", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+        openapi.Parameter("sort", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                          enum=list(AudioFilesQuerySet.sort_keys),
+                          description="likes and downloads order by counters flushed every few seconds"),
+        openapi.Parameter("order", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=["asc", "desc"]),
+        *[openapi.Parameter(facet, in_=openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                            description="comma separated values") for facet in beat_files_facets.facets],
+        openapi.Parameter("bpm_min", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        openapi.Parameter("bpm_max", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        openapi.Parameter("cursor", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+        openapi.Parameter("page_size", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    ], responses={200: LibraryBeatAudioFileSerializer(many=True)})
+    def get(request):
+        """This function returns a page of the audio files of an approved beat, sorted and filtered"""
+        beat_type = request.GET.get("beat_type")
+        if beat_type not in BeatTypes.list():
+            return Response({"detail": "invalid beat_type."}, status=status.HTTP_400_BAD_REQUEST)
+        beat_id = BeatsSubmissions.objects.filter(pk=request.GET.get("id"), beat_type=beat_type,
+                                                  status=SubmissionStatus.APPROVED.value). \
+            values_list("beat_id", flat=True).first()
+        if beat_id is None:
+            return Response({"detail": "beat not found."}, status=status.HTTP_404_NOT_FOUND)
+        try:
+            audio_files, next_cursor = audio_files_page(request, BeatAudioFiles.objects.filter(beats=beat_id),
+                                                        beat_files_facets.fields)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        files_serializer = LibraryBeatAudioFileSerializer(audio_files, many=True,
+                                              context={"library": beat_library.flags(request.user.id)})
+        return Response({"detail": files_serializer.data, "next_cursor": next_cursor}, status=status.HTTP_200_OK)
+
+
 class GetAllBeatsView(APIView):
     permission_classes = [IsAuthenticated, MemberPermissions | AdminPermissions]
 
     @staticmethod
-    @swagger_auto_schema(responses={200: BeatsSerializer(many=True)})
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("cursor", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+        openapi.Parameter("page_size", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    ], responses={200: BeatsSerializer(many=True)})
     def get(request):
         """This function return the Discover Page Beats"""
         beats = BeatsSubmissions.objects.prefetch_related("supplier", "supplier__supplier_details",
                                                          "supplier__supplier_details__artist",
                                                          "beat").filter(beat_type=BeatTypes.BEAT.value,
                                                                         status=SubmissionStatus.APPROVED.value)
+        try:
+            beats, next_cursor = CursorPaginator.from_request(request, beats).get_page()
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         beats_serializer = BeatsSerializer(beats, many=True)
-        return Response({'detail': beats_serializer.data}, status=status.HTTP_200_OK)
+        return Response({'detail': beats_serializer.data, 'next_cursor': next_cursor}, status=status.HTTP_200_OK)
 
 
 # class GetPresetView(APIView):
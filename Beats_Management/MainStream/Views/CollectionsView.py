@@ -7,6 +7,7 @@ from rest_framework.views import APIView
 
 from Beats_Management.MainStream.Serializers import BeatsCollectionsSerializer, BeatsCollectionAddSerializer, \
     BeatsCollectionRemoveSerializer, BeatsCollectionsDropdownSerializer, BeatsViewCollectionsFilesSerializer
+from Beats_Management.caches import beat_library
 from Beats_Management.models import BeatCollectionFiles
 from Utilities import extract_error_messages, group_by_attribute
 from Utilities.Enums import SubmissionStatus
@@ -20,7 +21,7 @@ class CollectionsDropDownView(APIView):
     @swagger_auto_schema(responses={200: BeatsCollectionsDropdownSerializer(many=True)})
     def get(request):
         """This function return the My Library Page Collections"""
-        collections = request.user.collections.only("id", "name")
+        collections = request.user.beat_collections.only("id", "name", "member")
         collections_serializer = BeatsCollectionsDropdownSerializer(collections, many=True)
         return Response({'detail': collections_serializer.data}, status=status.HTTP_200_OK)
 
@@ -41,18 +42,18 @@ class ViewCollectionView(APIView):
             return Response({"detail": "product_type is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         collections_details = BeatCollectionFiles.objects. \
-            select_related("beat", "collection", "audio_file"). \
-            prefetch_related("beat__submissions",
-                             "beat__submissions__supplier",
-                             "beat__submissions__supplier__supplier_details",
-                             "beat__submissions__supplier__supplier_details__artist"). \
-            filter(collection__member=request.user, beat__submissions__beat_type=product_type,
-                   beat__submissions__status=SubmissionStatus.APPROVED.value). \
+            select_related("beat", "collection", "audio_file", "audio_file__file"). \
+            prefetch_related("beat__beat_submissions",
+                             "beat__beat_submissions__supplier",
+                             "beat__beat_submissions__supplier__supplier_details",
+                             "beat__beat_submissions__supplier__supplier_details__artist"). \
+            filter(collection__member=request.user, beat__beat_submissions__beat_type=product_type,
+                   beat__beat_submissions__status=SubmissionStatus.APPROVED.value). \
             order_by("-created_at")
 
         collections_details_serializer = BeatsViewCollectionsFilesSerializer(collections_details, many=True)
 
-        collections = request.user.collections.only("id", "name", "description")
+        collections = request.user.beat_collections.only("id", "name", "description", "member")
         collections_serializer = BeatsCollectionsSerializer(collections, many=True)
 
         return Response({'detail': {
@@ -69,7 +70,7 @@ class CollectionsView(APIView):
     @swagger_auto_schema(responses={200: BeatsCollectionsSerializer(many=True)})
     def get(request):
         """This function return the Collections"""
-        collections = request.user.collections.only("id", "name", "description")
+        collections = request.user.beat_collections.only("id", "name", "description", "member")
         collections_serializer = BeatsCollectionsSerializer(collections, many=True)
         return Response({'detail': collections_serializer.data}, status=status.HTTP_200_OK)
 
@@ -99,10 +100,11 @@ class CollectionsView(APIView):
         """This function deletes the collection based on given id and name"""
         collection_id = request.GET.get("collection_id")
         collection_name = request.GET.get("collection_name")
-        collection = request.user.collections.filter(id=collection_id, name=collection_name).first()
+        collection = request.user.beat_collections.filter(id=collection_id, name=collection_name).first()
         if collection:
             try:
                 collection.delete()
+                beat_library.invalidate(request.user.id)
                 return Response({"detail": "collection deleted successfully"}, status=status.HTTP_201_CREATED)
             except Exception as e:
                 return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
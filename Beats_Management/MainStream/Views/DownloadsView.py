@@ -1,3 +1,7 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils.http import content_disposition_header
+from django.utils.text import get_valid_filename
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -11,6 +15,7 @@ from Beats_Management.models import BeatDownloads, BeatFileDownloads
 from Utilities import extract_error_messages
 from Utilities.Enums import SubmissionStatus
 from Utilities.Permissions import MemberPermissions
+from Utilities.ZipStream import stream_zip, audio_file_entries
 
 
 class ViewDownloadsView(APIView):
@@ -30,13 +35,13 @@ class ViewDownloadsView(APIView):
             return Response({"detail": "product_type is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         downloads = BeatDownloads.objects.select_related("beat"). \
-            prefetch_related("beat__submissions",
-                             "beat__submissions__supplier",
-                             "beat__submissions__supplier__supplier_details",
-                             "beat__submissions__supplier__supplier_details__artist").filter(
+            prefetch_related("beat__beat_submissions",
+                             "beat__beat_submissions__supplier",
+                             "beat__beat_submissions__supplier__supplier_details",
+                             "beat__beat_submissions__supplier__supplier_details__artist").filter(
             member=request.user,
-            beat__submissions__beat_type=product_type,
-            beat__submissions__status=SubmissionStatus.APPROVED.value,
+            beat__beat_submissions__beat_type=product_type,
+            beat__beat_submissions__status=SubmissionStatus.APPROVED.value,
         ).only("id", "beat")
         downloads_serializer = BeatsViewDownloadsSerializer(downloads, many=True)
         return Response({'detail': downloads_serializer.data}, status=status.HTTP_200_OK)
@@ -64,15 +69,15 @@ class ViewFileDownloadsView(APIView):
             return Response({"detail": "beat_id is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         downloads = BeatFileDownloads.objects. \
-            select_related("download", "download__beat"). \
-            prefetch_related("download__beat__submissions",
-                             "download__beat__submissions__supplier",
-                             "download__beat__submissions__supplier__supplier_details",
-                             "download__beat__submissions__supplier__supplier_details__artist"). \
+            select_related("download", "download__beat", "audio_file", "audio_file__file"). \
+            prefetch_related("download__beat__beat_submissions",
+                             "download__beat__beat_submissions__supplier",
+                             "download__beat__beat_submissions__supplier__supplier_details",
+                             "download__beat__beat_submissions__supplier__supplier_details__artist"). \
             filter(download__id=download_id,
                    download__beat__id=beat_id,
                    download__member=request.user,
-                   download__beat__submissions__status=SubmissionStatus.APPROVED.value,
+                   download__beat__beat_submissions__status=SubmissionStatus.APPROVED.value,
                    ). \
             order_by("-created_at")
         downloads_serializer = BeatsViewFileDownloadsSerializer(downloads, many=True)
@@ -94,3 +99,30 @@ class DownloadsView(APIView):
                             status=status.HTTP_400_BAD_REQUEST)
         downloads_serializer.save()
         return Response({'detail': "downloads started successfully."}, status=status.HTTP_201_CREATED)
+
+
+class DownloadArchiveView(APIView):
+    permission_classes = [IsAuthenticated, MemberPermissions]
+
+    @staticmethod
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("beat_id", in_=openapi.IN_QUERY,
+                          type=openapi.TYPE_INTEGER, required=True),
+    ], responses={200: "zip archive of the beat audio files", 400: "beat not found."})
+    def get(request):
+        """This function records the download of a complete beat and streams its approved audio files as a zip"""
+        data = {"beat_id": request.GET.get("beat_id"), "complete_beat": True}
+        downloads_serializer = BeatsDownloadsSerializer(data=data, context={"user": request.user})
+        downloads_serializer.is_valid()
+        if downloads_serializer.errors:
+            return Response({"detail": extract_error_messages(downloads_serializer.errors)},
+                            status=status.HTTP_400_BAD_REQUEST)
+        downloads_serializer.save()
+
+        beat = downloads_serializer.validated_data.get("beat")
+        entries = audio_file_entries(downloads_serializer.validated_data.get("audio_files"))
+        response = StreamingHttpResponse(stream_zip(entries, settings.MEDIA_STREAM_CHUNK_SIZE),
+                                         content_type="application/zip")
+        response["Content-Disposition"] = content_disposition_header(
+            True, f"{get_valid_filename(beat.title) or 'beat'}.zip")
+        return response
@@ -1,3 +1,4 @@
+from django.db import IntegrityError
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -27,12 +28,12 @@ class ViewLikesView(APIView):
             return Response({"detail": "product_type is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         likes = BeatLikes.objects. \
-            select_related("beat", "file"). \
-            prefetch_related("beat__submissions",
-                             "beat__submissions__supplier",
-                             "beat__submissions__supplier__supplier_details",
-                             "beat__submissions__supplier__supplier_details__artist"). \
-            filter(beat__submissions__beat_type=product_type, member=request.user). \
+            select_related("beat", "file", "file__file"). \
+            prefetch_related("beat__beat_submissions",
+                             "beat__beat_submissions__supplier",
+                             "beat__beat_submissions__supplier__supplier_details",
+                             "beat__beat_submissions__supplier__supplier_details__artist"). \
+            filter(beat__beat_submissions__beat_type=product_type, member=request.user). \
             order_by("-created_at")
         likes_serializer = BeatsViewLikedFilesSerializer(likes, many=True)
         return Response({'detail': likes_serializer.data}, status=status.HTTP_200_OK)
@@ -51,7 +52,10 @@ class LikeView(APIView):
         if like_serializer.errors:
             return Response({"detail": extract_error_messages(like_serializer.errors)},
                             status=status.HTTP_400_BAD_REQUEST)
-        like_serializer.save()
+        try:
+            like_serializer.save()
+        except IntegrityError:
+            return Response({"detail": ["Beat already liked."]}, status=status.HTTP_400_BAD_REQUEST)
         return Response({'detail': "file liked successfully."}, status=status.HTTP_200_OK)
 
 
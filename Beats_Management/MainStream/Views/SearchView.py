@@ -0,0 +1,97 @@
+from django.db.models import F
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from Beats_Management.MainStream.Serializers.BeatsSerializer import BeatsAudioFileSerializer, \
+    BeatCatalogCardSerializer
+from Beats_Management.counters import merge_card_counts
+from Beats_Management.indexes import beat_files_facets, beats_text_search
+from Beats_Management.models import BeatAudioFiles, BeatCatalogCard
+from Utilities.Enums import BeatTypes
+from Utilities.Permissions import MemberPermissions
+
+
+class SearchBeatFilesView(APIView):
+    permission_classes = [IsAuthenticated, MemberPermissions]
+    max_page_size = 100
+
+    @staticmethod
+    @swagger_auto_schema(manual_parameters=[
+        *[openapi.Parameter(facet, in_=openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                            description="comma separated values") for facet in beat_files_facets.facets],
+        openapi.Parameter("bpm_min", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        openapi.Parameter("bpm_max", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        openapi.Parameter("page", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        openapi.Parameter("page_size", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    ], responses={200: BeatsAudioFileSerializer(many=True)})
+    def get(request):
+        """This function searches the approved audio files by facets and returns the live facet counts"""
+        filters = {facet: [value for values in request.GET.getlist(facet) for value in values.split(",") if value]
+                   for facet in beat_files_facets.facets}
+        try:
+            bpm_min = int(request.GET["bpm_min"]) if request.GET.get("bpm_min") else None
+            bpm_max = int(request.GET["bpm_max"]) if request.GET.get("bpm_max") else None
+            page = max(int(request.GET.get("page", 1)), 1)
+            page_size = max(min(int(request.GET.get("page_size", 20)), SearchBeatFilesView.max_page_size), 1)
+        except ValueError:
+            return Response({"detail": "invalid search parameters."}, status=status.HTTP_400_BAD_REQUEST)
+
+        ids, count, facets = beat_files_facets.search(filters, bpm_min, bpm_max,
+                                                      offset=(page - 1) * page_size, limit=page_size)
+        files = BeatAudioFiles.objects.select_related("file", "genre", "sub_genre", "instrument", "sub_instrument",
+                                                      "mood", "bpm", "key").in_bulk(ids)
+        files_serializer = BeatsAudioFileSerializer([files[id_] for id_ in ids if id_ in files], many=True)
+        return Response({"detail": files_serializer.data, "count": count, "facets": facets},
+                        status=status.HTTP_200_OK)
+
+
+class SearchBeatsView(APIView):
+    permission_classes = [IsAuthenticated, MemberPermissions]
+    max_page_size = 100
+
+    @staticmethod
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("q", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+        openapi.Parameter("beat_type", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+        openapi.Parameter("page", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        openapi.Parameter("page_size", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    ], responses={200: BeatCatalogCardSerializer(many=True)})
+    def get(request):
+        """This function returns the approved beats matching the query by title and description, best first"""
+        beat_type = request.GET.get("beat_type")
+        if beat_type and beat_type not in BeatTypes.list():
+            return Response({"detail": "invalid beat_type."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            page = max(int(request.GET.get("page", 1)), 1)
+            page_size = max(min(int(request.GET.get("page_size", 20)), SearchBeatsView.max_page_size), 1)
+        except ValueError:
+            return Response({"detail": "invalid search parameters."}, status=status.HTTP_400_BAD_REQUEST)
+
+        ids, count = beats_text_search.search(request.GET.get("q", ""), beat_type,
+                                              offset=(page - 1) * page_size, limit=page_size)
+        beats = BeatCatalogCard.objects.annotate(beat_id=F("submission__beat_id")).in_bulk(
+            ids, field_name="submission_id")
+        merge_card_counts(beats.values())
+        beats_serializer = BeatCatalogCardSerializer([beats[id_] for id_ in ids if id_ in beats], many=True)
+        return Response({"detail": beats_serializer.data, "count": count}, status=status.HTTP_200_OK)
+
+
+class BeatsTypeaheadView(APIView):
+    permission_classes = [IsAuthenticated, MemberPermissions]
+
+    @staticmethod
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("q", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+        openapi.Parameter("beat_type", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+    ], responses={200: "list of beat titles"})
+    def get(request):
+        """This function returns the beat titles completing the typed query"""
+        beat_type = request.GET.get("beat_type")
+        if beat_type and beat_type not in BeatTypes.list():
+            return Response({"detail": "invalid beat_type."}, status=status.HTTP_400_BAD_REQUEST)
+        titles = beats_text_search.typeahead(request.GET.get("q", ""), beat_type)
+        return Response({"detail": titles}, status=status.HTTP_200_OK)
@@ -1,5 +1,6 @@
 from .Views.CollectionsView import CollectionsView, CollectionsAddView, CollectionsRemoveView, \
     CollectionsDropDownView, ViewCollectionView
-from .Views.DownloadsView import DownloadsView, ViewDownloadsView, ViewFileDownloadsView
+from .Views.DownloadsView import DownloadsView, ViewDownloadsView, ViewFileDownloadsView, DownloadArchiveView
 from .Views.LikeView import LikeView, UnlikeView, ViewLikesView
-from .Views.BeatsView import GetBeatsView, ViewBeatView,GetAllBeatsView
+from .Views.BeatsView import GetBeatsView, ViewBeatView,GetAllBeatsView, ViewBeatFilesView
+from .Views.SearchView import SearchBeatFilesView, SearchBeatsView, BeatsTypeaheadView
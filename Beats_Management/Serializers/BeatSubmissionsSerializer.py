@@ -4,8 +4,9 @@ from django.db import transaction
 from rest_framework import serializers
 
 from Beats_Management.Serializers.FindApprovalPerson import find_approval_person
-from Beats_Management.models import BeatGenre, BeatFile, Beats, BeatsSubmissions, BeatMood, BeatInstrument, BeatKey, BeatBPM, \
-    BeatAudioFiles
+from Beats_Management.caches import beat_taxonomy
+from Beats_Management.models import BeatFile, Beats, BeatsSubmissions, BeatKey, BeatBPM, BeatAudioFiles
+from Upload_Management.models import UploadSession
 from Utilities.Enums import BPMTypes, FlatKeys, SharpKeys, KeyScaleTypes, KeyTypes, BeatTypes, SourceTypes, \
     SubmissionStatus, TypeTypes, FileStatus, Boolean , BeatFileTypes
 from Utilities.Validators import InputValidator
@@ -27,7 +28,7 @@ def validate_image_file(file):
     return file
 
 
-def validate_audio_file_data(attrs):
+def validate_audio_file_data(attrs, taxonomy=None):
     file = attrs.get("file")
     file_name = attrs.get("file_name")
     file_extension = attrs.get("file_extension")
@@ -46,8 +47,8 @@ def validate_audio_file_data(attrs):
     file_type = attrs.get("file_type")
     file_source = attrs.get("file_source")
 
-    if not file:
-        raise serializers.ValidationError("file is required")
+    if not file and not attrs.get("upload_id"):
+        raise serializers.ValidationError("file or upload_id is required")
 
     if not InputValidator(file_name).is_valid():
         raise serializers.ValidationError("file_name is required")
@@ -64,12 +65,15 @@ def validate_audio_file_data(attrs):
     if not InputValidator(file_sub_genre).is_valid():
         raise serializers.ValidationError("file_sub_genre is required")
 
-    genre = BeatGenre.objects.prefetch_related("sub_genre").filter(name=file_genre).first()
+    if taxonomy is None:
+        taxonomy = beat_taxonomy.lookup()
+
+    genre = taxonomy.genre(file_genre)
 
     if not genre:
         raise serializers.ValidationError("invalid genre")
 
-    sub_genre = genre.sub_genre.filter(name=file_sub_genre).first()
+    sub_genre = taxonomy.sub_genre(genre, file_sub_genre)
 
     if not sub_genre:
         raise serializers.ValidationError(f"invalid sub_genre under {genre.name}")
@@ -80,12 +84,12 @@ def validate_audio_file_data(attrs):
     if not InputValidator(file_sub_instrument).is_valid():
         raise serializers.ValidationError("file_sub_instrument is required")
 
-    instrument = BeatInstrument.objects.prefetch_related("sub_instrument").filter(name=file_instrument).first()
+    instrument = taxonomy.instrument(file_instrument)
 
     if not instrument:
         raise serializers.ValidationError("invalid instrument")
 
-    sub_instrument = instrument.sub_instrument.filter(name=file_sub_instrument).first()
+    sub_instrument = taxonomy.sub_instrument(instrument, file_sub_instrument)
 
     if not sub_instrument:
         raise serializers.ValidationError(f"invalid sub_instrument under {instrument.name}")
@@ -93,7 +97,7 @@ def validate_audio_file_data(attrs):
     if not InputValidator(file_mood).is_valid():
         raise serializers.ValidationError("file_mood is required")
 
-    mood = BeatMood.objects.filter(name=file_mood).first()
+    mood = taxonomy.mood(file_mood)
 
     if not mood:
         raise serializers.ValidationError("invalid mood")
@@ -169,13 +173,44 @@ def validate_audio_file_data(attrs):
     return attrs
 
 
+class AudioFileListSerializer(serializers.ListSerializer):
+    def create(self, validated_data):
+        """This function creates the files, keys, BPMs and audio files of every item with one bulk insert per table"""
+        with transaction.atomic():
+            files = BeatFile.objects.bulk_create([
+                BeatFile(file=item.get("file"), file_name=item.get("file_name"), file_size=item.get("file_size"),
+                         file_extension=item.get("file_extension"))
+                for item in validated_data])
+            keys = BeatKey.objects.bulk_create([
+                BeatKey(key=item.get("file_key"), key_scale=item.get("file_key_scale"),
+                        key_type=item.get("file_key_type"))
+                for item in validated_data])
+            bpms = BeatBPM.objects.bulk_create([
+                BeatBPM(start_value=int(item.get("file_bpm_start_value")), end_value=int(item.get("file_bpm_end_value")),
+                        bpm_type=item.get("file_bpm_type"))
+                for item in validated_data])
+            return BeatAudioFiles.objects.bulk_create([
+                BeatAudioFiles(file=file, genre=item.get("genre"), sub_genre=item.get("sub_genre"),
+                               instrument=item.get("instrument"), sub_instrument=item.get("sub_instrument"),
+                               mood=item.get("mood"), bpm=bpm, key=key, beat_type=item.get("file_type"),
+                               source=item.get("file_source"))
+                for item, file, key, bpm in zip(validated_data, files, keys, bpms)])
+
+
 class AudioFileSerializer(serializers.Serializer):
     file = serializers.FileField(
+        required=False,
         error_messages={
             "required": "file is required",
             "blank": "file cannot be blank"
         }
     )
+    upload_id = serializers.UUIDField(
+        required=False,
+        error_messages={
+            "invalid": "invalid upload_id"
+        }
+    )
     file_name = serializers.CharField(
         error_messages={
             "required": "file_name is required",
@@ -303,7 +338,8 @@ class AudioFileSerializer(serializers.Serializer):
         with transaction.atomic():
             file = BeatFile.objects.create(file=file, file_name=file_name, file_size=file_size, file_extension=file_extension )
             file_key = BeatKey.objects.create(key=file_key, key_scale=file_key_scale, key_type=file_key_type)
-            file_bpm = BeatBPM.objects.create(start_value=file_bpm_start_value, end_value=file_bpm_end_value, bpm_type=file_bpm_type)
+            file_bpm = BeatBPM.objects.create(start_value=int(file_bpm_start_value), end_value=int(file_bpm_end_value),
+                                              bpm_type=file_bpm_type)
 
             audio_file = BeatAudioFiles.objects.create(file=file, genre=file_genre, sub_genre=file_sub_genre,
                                                    instrument=file_instrument, sub_instrument=file_sub_instrument,
@@ -311,6 +347,9 @@ class AudioFileSerializer(serializers.Serializer):
                                                    source=file_source)
             return audio_file
 
+    class Meta:
+        list_serializer_class = AudioFileListSerializer
+
 
 class DemoFileSerializer(AudioFileSerializer):
     class Meta:
@@ -366,11 +405,18 @@ class BeatSubmissionsSerializer(serializers.Serializer):
     )
     beat_demo = DemoFileSerializer()
     beat_artwork_file = serializers.FileField(
+        required=False,
         error_messages={
             "required": "beat_artwork_file is required",
             "blank": "beat_artwork_file cannot be blank"
         }
     )
+    beat_artwork_upload_id = serializers.UUIDField(
+        required=False,
+        error_messages={
+            "invalid": "invalid beat_artwork_upload_id"
+        }
+    )
 
     beat_audio_files = serializers.ListField(
         error_messages={
@@ -398,6 +444,7 @@ class BeatSubmissionsSerializer(serializers.Serializer):
         beat_description = attrs.get("beat_description")
         beat_demo = attrs.get("beat_demo")
         beat_artwork_file = attrs.get("beat_artwork_file")
+        beat_artwork_upload_id = attrs.get("beat_artwork_upload_id")
         beat_audio_files = attrs.get("beat_audio_files")
         beat_type = attrs.get("beat_type")
 
@@ -422,44 +469,56 @@ class BeatSubmissionsSerializer(serializers.Serializer):
         if beat_demo is None:
             raise serializers.ValidationError("beat_demo is required")
 
-        if not beat_artwork_file:
-            raise serializers.ValidationError("beat_artwork_file is required")
+        if not beat_artwork_file and not beat_artwork_upload_id:
+            raise serializers.ValidationError("beat_artwork_file or beat_artwork_upload_id is required")
 
         if not InputValidator(beat_moods).has_valid_length(3, 3):
             raise serializers.ValidationError("beat_mood must be 3")
 
-        moods = BeatMood.objects.filter(name__in=beat_moods)
+        taxonomy = beat_taxonomy.lookup()
+        moods = [taxonomy.mood(name) for name in beat_moods]
 
-        if len(moods) < len(beat_moods):
+        if None in moods or len({mood.pk for mood in moods}) != len(moods):
             raise serializers.ValidationError("provide valid moods")
 
         # TODO Uncomment audio file limit
         # if not InputValidator(beat_audio_files).has_valid_length(min_length=100):
         #     raise serializers.ValidationError("audio_files must be at least 100")
 
-        genre = BeatGenre.objects.prefetch_related("sub_genre").filter(name=beat_genre).first()
+        genre = taxonomy.genre(beat_genre)
 
         if genre is None:
             raise serializers.ValidationError("beat_genre does not exist")
 
-        sub_genre = genre.sub_genre.filter(name=beat_sub_genre).first()
+        sub_genre = taxonomy.sub_genre(genre, beat_sub_genre)
 
         if sub_genre is None:
             raise serializers.ValidationError("beat_sub_genre does not exist")
 
+        upload_ids = [item.get("upload_id") for item in [*beat_audio_files, beat_demo] if not item.get("file")]
+        if not beat_artwork_file:
+            upload_ids.append(beat_artwork_upload_id)
+
+        if len(upload_ids) != len(set(upload_ids)):
+            raise serializers.ValidationError("an upload can only be used once")
+
         with transaction.atomic():
-            audio_files_serializer = AudioFileSerializer(data=beat_audio_files, many=True)
-            audio_files_serializer.is_valid()
-            if audio_files_serializer.errors:
-                raise serializers.ValidationError(audio_files_serializer.errors)
-            audio_files = audio_files_serializer.save()
-
-            beat_demo_serializer = AudioFileSerializer(data=beat_demo)
-            beat_demo_serializer.is_valid()
-            if beat_demo_serializer.errors:
-                raise serializers.ValidationError(beat_demo_serializer.errors)
-            beat_demo = beat_demo_serializer.save()
+            uploads = UploadSession.attach(self.context.get("supplier"), upload_ids)
+
+            if uploads is None:
+                raise serializers.ValidationError("uploads must be finalized before they are submitted")
+
+            for item in [*beat_audio_files, beat_demo]:
+                if not item.get("file"):
+                    item["file"] = uploads[item.get("upload_id")].file.name
+
+            if not beat_artwork_file:
+                beat_artwork_file = uploads[beat_artwork_upload_id].file.name
+
+            audio_files = AudioFileSerializer(many=True).create([*beat_audio_files, beat_demo])
+            beat_demo = audio_files.pop()
 
+        attrs["beat_artwork_file"] = beat_artwork_file
         attrs["moods"] = moods
         attrs["genre"] = genre
         attrs["sub_genre"] = sub_genre
@@ -637,27 +696,28 @@ class BeatRevisedAudioFileSerializer(serializers.Serializer):
         beat_type = attrs.get("beat_type")
         is_demo_file = attrs.get("is_demo_file")
 
-        mood = BeatMood.objects.filter(name=file_mood).first()
+        taxonomy = beat_taxonomy.lookup()
+        mood = taxonomy.mood(file_mood)
 
         if not mood:
             raise serializers.ValidationError("invalid mood")
 
-        instrument = BeatInstrument.objects.prefetch_related("sub_instrument").filter(name=file_instrument).first()
+        instrument = taxonomy.instrument(file_instrument)
 
         if not instrument:
             raise serializers.ValidationError("invalid instrument")
 
-        genre = BeatGenre.objects.prefetch_related("sub_genre").filter(name=file_genre).first()
+        genre = taxonomy.genre(file_genre)
 
         if not genre:
             raise serializers.ValidationError("invalid genre")
 
-        sub_instrument = instrument.sub_instrument.filter(name=file_sub_instrument).first()
+        sub_instrument = taxonomy.sub_instrument(instrument, file_sub_instrument)
 
         if not sub_instrument:
             raise serializers.ValidationError(f"invalid sub_instrument under {instrument.name}")
 
-        sub_genre = genre.sub_genre.filter(name=file_sub_genre).first()
+        sub_genre = taxonomy.sub_genre(genre, file_sub_genre)
 
         if not sub_genre:
             raise serializers.ValidationError(f"invalid sub_genre under {genre.name}")
@@ -683,7 +743,7 @@ class BeatRevisedAudioFileSerializer(serializers.Serializer):
             if not file:
                 raise serializers.ValidationError("Beat demo file does not exist")
 
-        attrs = validate_audio_file_data(attrs)
+        attrs = validate_audio_file_data(attrs, taxonomy)
 
         attrs['submitted_file'] = file
         return attrs
@@ -718,10 +778,10 @@ class BeatRevisedAudioFileSerializer(serializers.Serializer):
 
             if submitted_file.bpm.bpm_type != file_bpm_type:
                 submitted_file.bpm.bpm_type = file_bpm_type
-            if submitted_file.bpm.start_value != file_bpm_start_value:
-                submitted_file.bpm.start_value = file_bpm_start_value
-            if submitted_file.bpm.end_value != file_bpm_end_value:
-                submitted_file.bpm.end_value = file_bpm_end_value
+            if submitted_file.bpm.start_value != int(file_bpm_start_value):
+                submitted_file.bpm.start_value = int(file_bpm_start_value)
+            if submitted_file.bpm.end_value != int(file_bpm_end_value):
+                submitted_file.bpm.end_value = int(file_bpm_end_value)
             submitted_file.bpm.save()
 
             if submitted_file.file.file != file:
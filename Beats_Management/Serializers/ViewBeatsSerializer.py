@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from Beats_Management.models import BeatsSubmissions, BeatAudioFiles
+from Utilities.Enums import FileStatus
 
 
 class BeatAudioFileSerializer(serializers.Serializer):
@@ -100,3 +101,33 @@ class ViewBeatsSerializer(serializers.Serializer):
             "beat_artwork", "beat_audio_files", "beat_demo_file", "beat_demo_file_name", "beat_demo_file_size",
             "beat_supplier", "beat_type", "status", "approval_person"
         )
+
+
+class ReviewQueueBeatsSerializer(serializers.Serializer):
+    request_id = serializers.IntegerField(source="id", read_only=True)
+    beat_id = serializers.IntegerField(source="beat.id", read_only=True)
+    beat_title = serializers.CharField(source="beat.title")
+    beat_type = serializers.CharField()
+    beat_supplier = serializers.SerializerMethodField(method_name="get_beat_supplier", source="supplier")
+    beat_files = serializers.SerializerMethodField(method_name="get_beat_files")
+    status = serializers.CharField()
+    created_at = serializers.DateTimeField()
+
+    @staticmethod
+    def get_beat_supplier(obj):
+        supplier = obj.supplier
+        if supplier is None:
+            return None
+        details = supplier.get_user_details()
+        if supplier.is_admin:
+            return {'id': supplier.id, 'name': details.name}
+        return {'id': supplier.id, 'name': details.first_name}
+
+    @staticmethod
+    def get_beat_files(obj):
+        return {file_status.lower(): getattr(obj, f"files_{file_status.lower()}") for file_status in FileStatus.list()}
+
+    class Meta:
+        model = BeatsSubmissions
+        fields = ("request_id", "beat_id", "beat_title", "beat_type", "beat_supplier", "beat_files", "status",
+                  "created_at")
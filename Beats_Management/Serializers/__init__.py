@@ -6,4 +6,4 @@ from Beats_Management.Serializers.MoodSerializer import BeatMoodsDropdownSeriali
 from Beats_Management.Serializers.BeatSubmissionsSerializer import BeatSubmissionsSerializer, \
     BeatRevisedAudioFileSerializer
 from Beats_Management.Serializers.PluginSerializer import PluginDropdownSerializer, PluginSerializer
-from Beats_Management.Serializers.ViewBeatsSerializer import ViewBeatsSerializer
+from Beats_Management.Serializers.ViewBeatsSerializer import ViewBeatsSerializer, ReviewQueueBeatsSerializer
@@ -6,8 +6,11 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from Beats_Management.Serializers import BeatSubmissionsSerializer, ViewBeatsSerializer, BeatRevisedAudioFileSerializer
+from Beats_Management.Serializers import BeatSubmissionsSerializer, ViewBeatsSerializer, BeatRevisedAudioFileSerializer, \
+    ReviewQueueBeatsSerializer
 from Beats_Management.models import BeatsSubmissions
+from User_Management.models import ReviewerLoad
+from Utilities.CursorPagination import CursorPaginator
 from Utilities.Enums import BeatTypes, SubmissionStatus, FileStatus, Boolean
 from Utilities.Permissions import AdminPermissions, StaffPermissions, SupplierPermissions
 
@@ -21,8 +24,9 @@ class BeatsSubmissionsView(APIView):
     def post(request):
         """This function handles beat-submissions"""
         try:
+            data = request.data
             with transaction.atomic():
-                beats_submissions_serializer = BeatSubmissionsSerializer(data=request.data,
+                beats_submissions_serializer = BeatSubmissionsSerializer(data=data,
                                                                          context={"supplier": request.user})
                 beats_submissions_serializer.is_valid()
 
@@ -60,7 +64,7 @@ class ViewBeatsView(APIView):
                 queryset['beat_type'] = beat_type
             if request.user.is_supplier or request.user.is_admin:
                 queryset['supplier'] = request.user
-            beat = BeatsSubmissions.objects.select_related("beat", "supplier").filter(**queryset)
+            beat = BeatsSubmissions.with_review_details().filter(**queryset)
             view_beats_serializer = ViewBeatsSerializer(beat, many=True)
             return Response({"detail": view_beats_serializer.data}, status=status.HTTP_200_OK)
         return Response({"detail": "invalid beat type"}, status=status.HTTP_404_NOT_FOUND)
@@ -358,10 +362,10 @@ class ViewSubmittedBeatsView(APIView):
         if beat_type in BeatTypes.list():
             if beat_type:
                 queryset['beat_type'] = beat_type
-            beat = BeatsSubmissions.objects.select_related("beat", "supplier"). \
+            beat = BeatsSubmissions.with_review_details(). \
                 filter(**queryset, status=SubmissionStatus.SUBMITTED)
         else:
-            beat = BeatsSubmissions.objects.select_related("beat", "supplier"). \
+            beat = BeatsSubmissions.with_review_details(). \
                 filter(**queryset, status=SubmissionStatus.SUBMITTED)
         view_beats_serializer = ViewBeatsSerializer(beat, many=True)
         return Response({"detail": view_beats_serializer.data}, status=status.HTTP_200_OK)
@@ -449,3 +453,35 @@ class RejectBeatView(APIView):
                 return Response({"detail": "beat rejected successfully!"}, status=status.HTTP_200_OK)
             return Response({"detail": "beat not found!"}, status=status.HTTP_404_NOT_FOUND)
         return Response({"detail": "invalid beat type"}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class ReviewQueueBeatsView(APIView):
+    permission_classes = [IsAuthenticated, StaffPermissions]
+
+    @staticmethod
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter("beat_type", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter("status", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter("cursor", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter("page_size", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
+        responses={200: ReviewQueueBeatsSerializer(many=True)})
+    def get(request):
+        """This function returns the open beat submissions assigned to the staff member, oldest first"""
+        beat_type = request.GET.get("beat_type")
+        submission_status = request.GET.get("status")
+        if submission_status and submission_status not in ReviewerLoad.OPEN_STATUSES:
+            return Response({"detail": "invalid status."}, status=status.HTTP_400_BAD_REQUEST)
+        if beat_type and beat_type not in BeatTypes.list():
+            return Response({"detail": "invalid beat type."}, status=status.HTTP_400_BAD_REQUEST)
+        submissions = BeatsSubmissions.review_queue(request.user, [submission_status] if submission_status else None)
+        if beat_type:
+            submissions = submissions.filter(beat_type=beat_type)
+        try:
+            submissions, next_cursor = CursorPaginator.from_request(request, submissions, ascending=True).get_page()
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        review_queue_serializer = ReviewQueueBeatsSerializer(submissions, many=True)
+        return Response({"detail": review_queue_serializer.data, "next_cursor": next_cursor},
+                        status=status.HTTP_200_OK)
@@ -7,6 +7,7 @@ from rest_framework.views import APIView
 
 from Beats_Management.Serializers import InstrumentSerializer, SubInstrumentSerializer, \
     CreateSubInstrumentSerializer, InstrumentDropdownSerializer
+from Beats_Management.caches import beat_taxonomy
 from Beats_Management.models import BeatInstrument
 from Utilities import extract_error_messages
 from Utilities.Permissions import AdminPermissions, SupplierPermissions
@@ -19,9 +20,9 @@ class BeatInstrumentsDropdownView(APIView):
     @swagger_auto_schema(responses={200: InstrumentDropdownSerializer(many=True)})
     def get(request):
         """This function return the instrument dropdown list."""
-        instrument = BeatInstrument.objects.prefetch_related("sub_instrument").all()
-        instrument_serializer = InstrumentDropdownSerializer(instrument, many=True)
-        return Response({'detail': instrument_serializer.data}, status=status.HTTP_200_OK)
+        instruments = beat_taxonomy.dropdown("instruments", lambda: InstrumentDropdownSerializer(
+            BeatInstrument.objects.prefetch_related("sub_instrument").all(), many=True).data)
+        return Response({'detail': instruments}, status=status.HTTP_200_OK)
 
 
 class BeatInstrumentsView(APIView):
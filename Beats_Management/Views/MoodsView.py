@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from Beats_Management.Serializers import BeatMoodSerializer, BeatMoodsDropdownSerializer
+from Beats_Management.caches import beat_taxonomy
 from Beats_Management.models import BeatMood
 from Utilities import extract_error_messages
 from Utilities.Permissions import AdminPermissions, SupplierPermissions
@@ -18,9 +19,9 @@ class BeatMoodsDropdownView(APIView):
     @swagger_auto_schema(responses={200: BeatMoodsDropdownSerializer(many=True)})
     def get(request):
         """This function return the moodsDropdown list."""
-        moods = BeatMood.objects.all()
-        moods_serializer = BeatMoodsDropdownSerializer(moods, many=True)
-        return Response({'detail': moods_serializer.data}, status=status.HTTP_200_OK)
+        moods = beat_taxonomy.dropdown("moods", lambda: BeatMoodsDropdownSerializer(
+            BeatMood.objects.all(), many=True).data)
+        return Response({'detail': moods}, status=status.HTTP_200_OK)
 
 
 class BeatMoodsView(APIView):
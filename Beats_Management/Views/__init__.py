@@ -3,5 +3,5 @@ from Beats_Management.Views.InstrumentsView import BeatSubInstrumentsView, BeatI
 from Beats_Management.Views.MoodsView import BeatMoodsDropdownView, BeatMoodsView
 from Beats_Management.Views.BeatsViews import ViewBeatsView, BeatsSubmissionsView, SendRevisionBeatsView, \
     ResolveRevisionBeatsView, ApproveRevisionBeatsView, RejectRevisionBeatsView, BeatSubmitForReviewView, \
-    ApproveBeatView, RejectBeatView, ViewSubmittedBeatsView
+    ApproveBeatView, RejectBeatView, ViewSubmittedBeatsView, ReviewQueueBeatsView
 from Beats_Management.Views.PluginsView import PluginsDropdownView, PluginsView
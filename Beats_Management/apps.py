@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BeatManagementConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "Beats_Management"
+
+    def ready(self):
+        from Beats_Management import signals  # noqa: F401
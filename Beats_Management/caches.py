@@ -0,0 +1,24 @@
+from Beats_Management.models import BeatGenre, BeatSubGenre, BeatInstrument, BeatSubInstrument, BeatMood, \
+    BeatLikes, BeatFileDownloads, BeatCollectionFiles
+from Utilities.MemberLibrary import MemberLibraryCache
+from Utilities.TaxonomyCache import TaxonomyCache
+
+beat_taxonomy = TaxonomyCache("beats", BeatGenre, BeatSubGenre, BeatInstrument, BeatSubInstrument, BeatMood)
+
+
+def liked_files(member_id):
+    return BeatLikes.objects.filter(member_id=member_id, file__isnull=False).values_list("file_id", flat=True)
+
+
+def downloaded_files(member_id):
+    return BeatFileDownloads.objects.filter(download__member_id=member_id, audio_file__isnull=False). \
+        values_list("audio_file_id", flat=True)
+
+
+def collected_files(member_id):
+    return BeatCollectionFiles.objects.filter(collection__member_id=member_id, audio_file__isnull=False). \
+        values_list("audio_file_id", flat=True)
+
+
+beat_library = MemberLibraryCache("beats", is_liked=liked_files, is_downloaded=downloaded_files,
+                                  in_collection=collected_files)
@@ -0,0 +1,18 @@
+from Beats_Management.models import Beats, BeatAudioFiles, BeatCatalogCard
+from Utilities.Counters import CounterBuffer
+
+
+def refresh_card_counts(beat_ids):
+    for beat in Beats.objects.filter(pk__in=beat_ids):
+        BeatCatalogCard.refresh_counts(beat)
+
+
+beat_counters = CounterBuffer("beats", Beats, on_flush=lambda ids, groups: refresh_card_counts(ids))
+beat_file_counters = CounterBuffer("beat-files", BeatAudioFiles,
+                                   on_flush=lambda ids, groups: refresh_card_counts(groups))
+
+
+def merge_card_counts(cards):
+    """This function adds the downloads and likes not flushed yet to catalog cards annotated with beat_id"""
+    beat_counters.merge(cards, "downloads_count", key=lambda card: card.beat_id)
+    return beat_file_counters.merge(cards, "likes_count", key=lambda card: card.beat_id, grouped=True)
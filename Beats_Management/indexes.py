@@ -0,0 +1,32 @@
+from Beats_Management.models import BeatAudioFiles, BeatsSubmissions
+from Utilities.Enums import SubmissionStatus
+from Utilities.FacetIndex import FacetIndex
+from Utilities.SearchIndex import TextSearchIndex
+
+
+def approved_beat_files():
+    return BeatAudioFiles.objects.filter(beats__beat_submissions__status=SubmissionStatus.APPROVED.value)
+
+
+beat_files_facets = FacetIndex("beat-files", approved_beat_files, {
+    "genre": "genre_id",
+    "sub_genre": "sub_genre_id",
+    "instrument": "instrument_id",
+    "sub_instrument": "sub_instrument_id",
+    "mood": "mood_id",
+    "key": "key__key",
+    "scale": "key__key_scale",
+    "source": "source",
+    "type": "beat_type",
+})
+
+
+def approved_beat_submissions():
+    return BeatsSubmissions.objects.filter(status=SubmissionStatus.APPROVED.value, beat__isnull=False)
+
+
+beats_text_search = TextSearchIndex("Beats_Management_search", approved_beat_submissions, {
+    "title": "beat__title",
+    "description": "beat__description",
+    "type": "beat_type",
+})
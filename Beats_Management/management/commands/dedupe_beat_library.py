@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from Beats_Management.counters import refresh_card_counts
+from Beats_Management.models import BeatAudioFiles, BeatCollectionFiles, BeatDownloads, BeatFileDownloads, BeatLikes
+from Utilities.Dedupe import delete_duplicates, recount
+
+
+class Command(BaseCommand):
+    help = "Deletes duplicate beat likes, downloads and collection files, keeping the oldest row of each"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="only report the duplicate groups")
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        with transaction.atomic():
+            downloads = delete_duplicates(BeatDownloads, ["member", "beat"],
+                                          children=[(BeatFileDownloads, "download", "audio_file")], dry_run=dry_run)
+            likes = delete_duplicates(BeatLikes, ["member", "file", "beat"], dry_run=dry_run)
+            collection_files = delete_duplicates(BeatCollectionFiles, ["collection", "audio_file", "beat"],
+                                                 dry_run=dry_run)
+            if not dry_run:
+                recount(BeatAudioFiles, [like["file"] for like in likes], "likes_count", BeatLikes, "file")
+                refresh_card_counts({like["beat"] for like in likes})
+
+        prefix = "found" if dry_run else "deduped"
+        self.stdout.write(f"{prefix} {len(downloads)} downloads, {len(likes)} likes and "
+                          f"{len(collection_files)} collection files")
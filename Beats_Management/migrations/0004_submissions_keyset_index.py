@@ -0,0 +1,17 @@
+# Generated by Django 4.2.1 on 2026-10-18 18:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Beats_Management', '0003_beats_exclusive_price_alter_beataudiofiles_beat_type_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='beatssubmissions',
+            index=models.Index(fields=['beat_type', 'status', 'created_at', 'id'], name='beat_sub_type_status_idx'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 4.2.1 on 2026-10-18 18:44
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def artist_name(supplier):
+    if supplier is None:
+        return ""
+    if supplier.usertype == "Admin" and hasattr(supplier, "adminOrStaff_details"):
+        return supplier.adminOrStaff_details.name
+    if supplier.usertype == "Supplier" and hasattr(supplier, "supplier_details"):
+        return supplier.supplier_details.artist.name
+    return ""
+
+
+def build_catalog_cards(apps, schema_editor):
+    BeatsSubmissions = apps.get_model("Beats_Management", "BeatsSubmissions")
+    BeatCatalogCard = apps.get_model("Beats_Management", "BeatCatalogCard")
+
+    submissions = BeatsSubmissions.objects.select_related("beat", "beat__genre", "beat__sub_genre", "supplier"). \
+        prefetch_related("beat__mood").filter(status="Approved", beat__isnull=False)
+    cards = []
+    for submission in submissions:
+        beat = submission.beat
+        counts = beat.audio_files.aggregate(files_count=models.Count("id"), likes_count=models.Sum("likes_count"))
+        cards.append(BeatCatalogCard(
+            submission=submission,
+            beat_type=submission.beat_type,
+            title=beat.title,
+            artist=artist_name(submission.supplier),
+            beats_artwork=beat.beats_artwork.name if beat.beats_artwork else None,
+            genre=beat.genre.name if beat.genre else "",
+            sub_genre=beat.sub_genre.name if beat.sub_genre else "",
+            moods=[mood.name for mood in beat.mood.all()],
+            files_count=counts["files_count"],
+            likes_count=counts["likes_count"] or 0,
+            downloads_count=beat.downloads_count,
+        ))
+    BeatCatalogCard.objects.bulk_create(cards)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Beats_Management', '0004_submissions_keyset_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BeatCatalogCard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_modified', models.DateTimeField(auto_now=True)),
+                ('beat_type', models.CharField(choices=[('Beat', 'Beat')], default='Beat', max_length=25)),
+                ('title', models.CharField(max_length=255)),
+                ('artist', models.CharField(blank=True, default='', max_length=255)),
+                ('beats_artwork', models.ImageField(blank=True, default=None, max_length=1000, null=True, upload_to='beats_artworks/')),
+                ('genre', models.CharField(blank=True, default='', max_length=255)),
+                ('sub_genre', models.CharField(blank=True, default='', max_length=255)),
+                ('moods', models.JSONField(blank=True, default=list)),
+                ('files_count', models.IntegerField(default=0)),
+                ('likes_count', models.IntegerField(default=0)),
+                ('downloads_count', models.IntegerField(default=0)),
+                ('submission', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='catalog_card', to='Beats_Management.beatssubmissions')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['beat_type', 'created_at', 'id'], name='beat_card_type_idx')],
+            },
+        ),
+        migrations.RunPython(build_catalog_cards, migrations.RunPython.noop),
+    ]
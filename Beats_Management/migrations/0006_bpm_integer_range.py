@@ -0,0 +1,47 @@
+# Generated by Django 4.2.1 on 2026-10-18 18:48
+
+from django.db import migrations, models
+
+
+def clean_bpm_values(apps, schema_editor):
+    """Strips the BPM values so the column cast cannot fail, and stops on values that are not integers
+
+    A value that is not a non negative integer has no safe replacement: rewriting it to 0 would match the
+    bpm_min=0 filters and sort first. The offending rows are listed so they can be fixed before migrating.
+    """
+    BeatBPM = apps.get_model("Beats_Management", "BeatBPM")
+    invalid = []
+    for bpm in BeatBPM.objects.all().only("id", "start_value", "end_value"):
+        values = [str(value).strip() for value in (bpm.start_value, bpm.end_value)]
+        if not all(value.isascii() and value.isdigit() for value in values):
+            invalid.append(f"id={bpm.id} start_value={bpm.start_value!r} end_value={bpm.end_value!r}")
+        elif values != [bpm.start_value, bpm.end_value]:
+            BeatBPM.objects.filter(id=bpm.id).update(start_value=values[0], end_value=values[1])
+    if invalid:
+        raise ValueError(f"{BeatBPM._meta.db_table} has BPM values that are not non negative integers, fix them "
+                         f"and migrate again: " + "; ".join(invalid))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Beats_Management', '0005_catalog_card'),
+    ]
+
+    operations = [
+        migrations.RunPython(clean_bpm_values, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='beatbpm',
+            name='end_value',
+            field=models.PositiveIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='beatbpm',
+            name='start_value',
+            field=models.PositiveIntegerField(),
+        ),
+        migrations.AddIndex(
+            model_name='beatbpm',
+            index=models.Index(fields=['start_value', 'end_value'], name='beat_bpm_range_idx'),
+        ),
+    ]
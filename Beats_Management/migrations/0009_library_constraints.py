@@ -0,0 +1,91 @@
+# Generated by Django 4.2.1 on 2026-10-18 19:03
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+# copied from Utilities.Dedupe so this migration keeps replaying the same way when that module changes
+def duplicate_groups(model, fields):
+    """This function returns the values of every group of rows sharing the fields, with the id of its oldest row"""
+    return model.objects.filter(**{f"{field}__isnull": False for field in fields}). \
+        values(*fields).annotate(keep=Min("id"), rows=Count("id")).filter(rows__gt=1).order_by()
+
+
+def delete_duplicates(model, fields, children=(), dry_run=False):
+    """This function keeps the oldest row of every duplicate group and deletes the others
+
+    ``children`` lists the (model, foreign key, unique field) of rows pointing at the deleted rows. They
+    are moved to the kept row, unless it already has a child with the same unique field value. Returns
+    the duplicate groups that were found.
+    """
+    groups = list(duplicate_groups(model, fields))
+    if dry_run:
+        return groups
+
+    for group in groups:
+        extra_ids = list(model.objects.filter(**{field: group[field] for field in fields}).
+                         exclude(id=group["keep"]).values_list("id", flat=True))
+        for child_model, foreign_key, unique_field in children:
+            for extra_id in extra_ids:
+                kept_values = child_model.objects.filter(**{foreign_key: group["keep"]}). \
+                    values_list(unique_field, flat=True)
+                moving = child_model.objects.filter(**{foreign_key: extra_id})
+                moving.filter(**{f"{unique_field}__in": kept_values}).delete()
+                moving.update(**{foreign_key: group["keep"]})
+        model.objects.filter(id__in=extra_ids).delete()
+    return groups
+
+
+def recount(model, ids, field, related_model, related_field):
+    """This function resets the counter field of the given rows to the number of related rows"""
+    for id_ in set(ids):
+        model.objects.filter(id=id_).update(**{field: related_model.objects.filter(**{related_field: id_}).count()})
+
+
+def delete_duplicate_library_rows(apps, schema_editor):
+    """Keeps the oldest like, download and collection file of every member so the unique constraints can be added"""
+    BeatAudioFiles = apps.get_model("Beats_Management", "BeatAudioFiles")
+    BeatDownloads = apps.get_model("Beats_Management", "BeatDownloads")
+    BeatFileDownloads = apps.get_model("Beats_Management", "BeatFileDownloads")
+    BeatLikes = apps.get_model("Beats_Management", "BeatLikes")
+    BeatCollectionFiles = apps.get_model("Beats_Management", "BeatCollectionFiles")
+
+    delete_duplicates(BeatDownloads, ["member", "beat"], children=[(BeatFileDownloads, "download", "audio_file")])
+    likes = delete_duplicates(BeatLikes, ["member", "file", "beat"])
+    recount(BeatAudioFiles, [like["file"] for like in likes], "likes_count", BeatLikes, "file")
+    delete_duplicates(BeatCollectionFiles, ["collection", "audio_file", "beat"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Beats_Management', '0008_unique_file_download'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_library_rows, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='beatcollectionfiles',
+            index=models.Index(fields=['collection', '-created_at'], name='beat_collection_file_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='beatdownloads',
+            index=models.Index(fields=['member', '-created_at'], name='beat_download_member_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='beatlikes',
+            index=models.Index(fields=['member', '-created_at'], name='beat_like_member_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='beatcollectionfiles',
+            constraint=models.UniqueConstraint(fields=('collection', 'audio_file', 'beat'), name='unique_beat_collection_file'),
+        ),
+        migrations.AddConstraint(
+            model_name='beatdownloads',
+            constraint=models.UniqueConstraint(fields=('member', 'beat'), name='unique_beat_download'),
+        ),
+        migrations.AddConstraint(
+            model_name='beatlikes',
+            constraint=models.UniqueConstraint(fields=('member', 'file', 'beat'), name='unique_beat_like'),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
+from django.db.models import Count, Q, Prefetch
 
-from User_Management.models import User, DateTimeModel
+from User_Management.models import User, DateTimeModel, ReviewerLoad
+from Utilities.AudioFilesQuerySet import AudioFilesQuerySet
 from Utilities.Enums import TypeTypes
 from Utilities.Enums.BPMTypes import BPMTypes
 from Utilities.Enums.FileStatus import FileStatus
@@ -45,10 +47,15 @@ class BeatSubInstrument(DateTimeModel):
 
 
 class BeatBPM(DateTimeModel):
-    start_value = models.CharField(max_length=10)
-    end_value = models.CharField(max_length=10)
+    start_value = models.PositiveIntegerField()
+    end_value = models.PositiveIntegerField()
     bpm_type = models.CharField(max_length=25, choices=BPMTypes.choices)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["start_value", "end_value"], name="beat_bpm_range_idx"),
+        ]
+
 
 class BeatKey(DateTimeModel):
     key = models.CharField(max_length=10, choices=SharpKeys.choices + FlatKeys.choices)
@@ -128,6 +135,8 @@ class BeatAudioFiles(DateTimeModel):
     message = models.CharField(max_length=1000, default=None, null=True, blank=True)
     status = models.CharField(max_length=25, choices=FileStatus.choices, default=FileStatus.UPLOADED.value)
 
+    objects = AudioFilesQuerySet.as_manager()
+
 
 class Beats(DateTimeModel):
     title = models.CharField(max_length=255)
@@ -194,6 +203,53 @@ class BeatsSubmissions(DateTimeModel):
     beat_type = models.CharField(max_length=25, choices=BeatTypes.choices, default=BeatTypes.BEAT.value)
     status = models.CharField(max_length=25, choices=SubmissionStatus.choices, default=SubmissionStatus.UPLOADED.value)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["beat_type", "status", "created_at", "id"], name="beat_sub_type_status_idx"),
+            models.Index(fields=["approval_person", "status", "created_at", "id"], name="beat_sub_review_queue_idx"),
+        ]
+
+    @classmethod
+    def review_queue(cls, staff, statuses=None):
+        """This function returns the open submissions assigned to the staff member with their file status counts
+
+        The counts are aggregated in the same query as the rows, one ``files_<status>`` column per file status.
+        """
+        files = {f"files_{file_status.lower()}": Count("beat__audio_files",
+                                                           filter=Q(beat__audio_files__status=file_status))
+                 for file_status in FileStatus.list()}
+        return cls.objects.select_related("beat", "supplier", "supplier__supplier_details",
+                                          "supplier__adminOrStaff_details"). \
+            filter(approval_person=staff, status__in=statuses or ReviewerLoad.OPEN_STATUSES).annotate(**files)
+
+    @classmethod
+    def with_review_details(cls):
+        """This function returns the submissions with everything the submission lists show
+
+        The beat, its demo file, the supplier and the approval person are joined, the moods and the audio files
+        prefetched, so a list runs the same number of queries whatever the number of submissions and files.
+        """
+        return cls.objects.select_related("beat", "beat__genre", "beat__sub_genre", "beat__demo_file",
+                                          *(f"beat__demo_file__{field}" for field in AudioFilesQuerySet.detail_fields),
+                                          "supplier", "supplier__supplier_details", "supplier__adminOrStaff_details",
+                                          "approval_person", "approval_person__adminOrStaff_details"). \
+            prefetch_related("beat__mood",
+                             Prefetch("beat__audio_files", queryset=BeatAudioFiles.objects.with_details()))
+
+    @classmethod
+    def load_detail(cls, pk, beat_type):
+        """This function loads an approved submission with everything its detail page shows
+
+        The submission, beat and supplier are joined and the moods prefetched. The audio files are paged
+        separately, see ``Utilities.AudioFilesPage``.
+        """
+        return cls.objects.select_related("beat", "beat__genre", "beat__sub_genre", "supplier",
+                                          "supplier__supplier_details", "supplier__supplier_details__artist",
+                                          "supplier__adminOrStaff_details"). \
+            prefetch_related("beat__mood"). \
+            filter(pk=pk, beat_type=beat_type, status=SubmissionStatus.APPROVED.value). \
+            annotate(files_count=Count("beat__audio_files")).first()
+
 
 class BeatDownloads(DateTimeModel):
     beat = models.ForeignKey(
@@ -211,6 +267,14 @@ class BeatDownloads(DateTimeModel):
         related_name="beat_downloads",
     )
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["member", "beat"], name="unique_beat_download"),
+        ]
+        indexes = [
+            models.Index(fields=["member", "-created_at"], name="beat_download_member_idx"),
+        ]
+
 
 class BeatFileDownloads(DateTimeModel):
     download = models.ForeignKey(
@@ -228,6 +292,11 @@ class BeatFileDownloads(DateTimeModel):
         related_name="beat_downloads",
     )
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["download", "audio_file"], name="unique_beat_file_download"),
+        ]
+
 
 class BeatLikes(DateTimeModel):
     beat = models.ForeignKey(
@@ -252,6 +321,14 @@ class BeatLikes(DateTimeModel):
         related_name="beat_likes",
     )
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["member", "file", "beat"], name="unique_beat_like"),
+        ]
+        indexes = [
+            models.Index(fields=["member", "-created_at"], name="beat_like_member_idx"),
+        ]
+
 
 class BeatCollections(DateTimeModel):
     name = models.CharField(max_length=255)
@@ -287,3 +364,78 @@ class BeatCollectionFiles(DateTimeModel):
         null=True,
         related_name="beat_collection_files",
     )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["collection", "audio_file", "beat"], name="unique_beat_collection_file"),
+        ]
+        indexes = [
+            models.Index(fields=["collection", "-created_at"], name="beat_collection_file_idx"),
+        ]
+
+
+class BeatCatalogCard(DateTimeModel):
+    """Denormalized discover-page card of an approved beat submission"""
+
+    submission = models.OneToOneField(
+        BeatsSubmissions,
+        on_delete=models.CASCADE,
+        related_name="catalog_card",
+    )
+    beat_type = models.CharField(max_length=25, choices=BeatTypes.choices, default=BeatTypes.BEAT.value)
+    title = models.CharField(max_length=255)
+    artist = models.CharField(max_length=255, default="", blank=True)
+    beats_artwork = models.ImageField(
+        upload_to="beats_artworks/", max_length=1000, default=None, null=True, blank=True
+    )
+    genre = models.CharField(max_length=255, default="", blank=True)
+    sub_genre = models.CharField(max_length=255, default="", blank=True)
+    moods = models.JSONField(default=list, blank=True)
+    files_count = models.IntegerField(default=0)
+    likes_count = models.IntegerField(default=0)
+    downloads_count = models.IntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["beat_type", "created_at", "id"], name="beat_card_type_idx"),
+        ]
+
+    @classmethod
+    def refresh(cls, submission):
+        """This function rebuilds the card of an approved submission and drops it otherwise"""
+        if submission.status != SubmissionStatus.APPROVED.value or submission.beat is None:
+            cls.objects.filter(submission=submission).delete()
+            return None
+
+        beat = submission.beat
+        counts = beat.audio_files.aggregate(files_count=models.Count("id"),
+                                            likes_count=models.Sum("likes_count"))
+        card, _ = cls.objects.update_or_create(submission=submission, defaults={
+            "beat_type": submission.beat_type,
+            "title": beat.title,
+            "artist": submission.supplier.get_artist_name() if submission.supplier else "",
+            "beats_artwork": beat.beats_artwork.name if beat.beats_artwork else None,
+            "genre": beat.genre.name if beat.genre else "",
+            "sub_genre": beat.sub_genre.name if beat.sub_genre else "",
+            "moods": [mood.name for mood in beat.mood.all()],
+            "files_count": counts["files_count"],
+            "likes_count": counts["likes_count"] or 0,
+            "downloads_count": beat.downloads_count,
+        })
+        return card
+
+    @classmethod
+    def refresh_beat(cls, beat):
+        """This function rebuilds the cards of every approved submission of a beat"""
+        for submission in beat.beat_submissions.select_related("supplier").filter(
+                status=SubmissionStatus.APPROVED.value):
+            cls.refresh(submission)
+
+    @classmethod
+    def refresh_counts(cls, beat):
+        """This function recomputes only the counters of the cards of a beat"""
+        counts = beat.audio_files.aggregate(files_count=models.Count("id"),
+                                            likes_count=models.Sum("likes_count"))
+        cls.objects.filter(submission__beat=beat).update(files_count=counts["files_count"],
+                                                         likes_count=counts["likes_count"] or 0,
+                                                         downloads_count=beat.downloads_count)
@@ -0,0 +1,171 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from Beats_Management.caches import beat_taxonomy
+from Beats_Management.indexes import beat_files_facets, beats_text_search
+from Beats_Management.models import Beats, BeatsSubmissions, BeatAudioFiles, BeatCatalogCard, BeatGenre, \
+    BeatSubGenre, BeatMood, BeatBPM, BeatKey, BeatInstrument, BeatSubInstrument
+from User_Management.caches import reviewer_pool
+from User_Management.models import Artist, AdminOrStaff
+from Utilities.Enums import SubmissionStatus
+
+CARD_SUBMISSION_FIELDS = {"status", "beat", "supplier", "beat_type"}
+
+
+@receiver(post_save, sender=BeatsSubmissions)
+def refresh_submission_card(sender, instance, created, update_fields=None, **kwargs):
+    if created and instance.status != SubmissionStatus.APPROVED.value:
+        return
+    if update_fields is None or CARD_SUBMISSION_FIELDS & set(update_fields):
+        BeatCatalogCard.refresh(instance)
+
+
+@receiver(post_save, sender=Beats)
+def refresh_beat_cards(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        return
+    if update_fields is not None and set(update_fields) == {"downloads_count"}:
+        BeatCatalogCard.refresh_counts(instance)
+    else:
+        BeatCatalogCard.refresh_beat(instance)
+
+
+@receiver(m2m_changed, sender=Beats.mood.through)
+@receiver(m2m_changed, sender=Beats.audio_files.through)
+def refresh_beat_cards_relations(sender, instance, action, reverse, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        for beat in Beats.objects.filter(pk__in=kwargs.get("pk_set") or []):
+            BeatCatalogCard.refresh_beat(beat)
+    else:
+        BeatCatalogCard.refresh_beat(instance)
+
+
+@receiver(post_save, sender=BeatAudioFiles)
+def refresh_audio_file_counts(sender, instance, created, **kwargs):
+    if created:
+        return
+    for beat in instance.beats.all():
+        BeatCatalogCard.refresh_counts(beat)
+
+
+@receiver(post_save, sender=BeatGenre)
+def rename_card_genre(sender, instance, created, **kwargs):
+    if not created:
+        BeatCatalogCard.objects.filter(submission__beat__genre=instance).update(genre=instance.name)
+
+
+@receiver(post_save, sender=BeatSubGenre)
+def rename_card_sub_genre(sender, instance, created, **kwargs):
+    if not created:
+        BeatCatalogCard.objects.filter(submission__beat__sub_genre=instance).update(sub_genre=instance.name)
+
+
+@receiver(post_save, sender=BeatMood)
+def rename_card_mood(sender, instance, created, **kwargs):
+    if not created:
+        for beat in instance.beats.all():
+            BeatCatalogCard.refresh_beat(beat)
+
+
+@receiver(post_save, sender=Artist)
+def rename_card_artist(sender, instance, created, **kwargs):
+    if not created:
+        BeatCatalogCard.objects.filter(submission__supplier__supplier_details__artist=instance). \
+            update(artist=instance.name)
+
+
+@receiver(post_save, sender=AdminOrStaff)
+def rename_card_admin(sender, instance, created, **kwargs):
+    if not created:
+        BeatCatalogCard.objects.filter(submission__supplier=instance.admin_user).update(artist=instance.name)
+
+
+@receiver(post_save, sender=BeatsSubmissions)
+def index_submission_files(sender, instance, created, update_fields=None, **kwargs):
+    if created and instance.status != SubmissionStatus.APPROVED.value:
+        return
+    if instance.beat_id and (update_fields is None or {"status", "beat"} & set(update_fields)):
+        beat_files_facets.refresh_on_commit(instance.beat.audio_files.values_list("id", flat=True))
+
+
+@receiver(post_save, sender=BeatAudioFiles)
+def index_audio_file(sender, instance, created, **kwargs):
+    if not created:
+        beat_files_facets.refresh_on_commit([instance.id])
+
+
+@receiver(post_delete, sender=BeatAudioFiles)
+def unindex_audio_file(sender, instance, **kwargs):
+    beat_files_facets.refresh_on_commit([instance.id])
+
+
+@receiver(m2m_changed, sender=Beats.audio_files.through)
+def index_beat_files(sender, instance, action, reverse, pk_set=None, **kwargs):
+    if action == "post_clear":
+        transaction.on_commit(beat_files_facets.invalidate)
+    elif action in ("post_add", "post_remove"):
+        beat_files_facets.refresh_on_commit([instance.id] if reverse else pk_set)
+
+
+@receiver(post_save, sender=BeatBPM)
+@receiver(post_save, sender=BeatKey)
+def index_audio_file_metadata(sender, instance, created, **kwargs):
+    if not created:
+        beat_files_facets.refresh_on_commit(instance.audio_files.values_list("id", flat=True))
+
+
+@receiver(post_delete, sender=BeatGenre)
+@receiver(post_delete, sender=BeatSubGenre)
+@receiver(post_delete, sender=BeatInstrument)
+@receiver(post_delete, sender=BeatSubInstrument)
+@receiver(post_delete, sender=BeatMood)
+def invalidate_files_index(sender, instance, **kwargs):
+    transaction.on_commit(beat_files_facets.invalidate)
+
+
+@receiver(post_save, sender=BeatsSubmissions)
+def index_submission_text(sender, instance, created, update_fields=None, **kwargs):
+    if created and instance.status != SubmissionStatus.APPROVED.value:
+        return
+    if update_fields is None or {"status", "beat", "beat_type"} & set(update_fields):
+        beats_text_search.refresh_on_commit([instance.id])
+
+
+@receiver(post_delete, sender=BeatsSubmissions)
+def unindex_submission_text(sender, instance, **kwargs):
+    beats_text_search.refresh_on_commit([instance.id])
+
+
+@receiver(post_save, sender=Beats)
+def index_beat_text(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and not {"title", "description"} & set(update_fields)):
+        return
+    beats_text_search.refresh_on_commit(instance.beat_submissions.values_list("id", flat=True))
+
+
+@receiver(post_save, sender=BeatGenre)
+@receiver(post_delete, sender=BeatGenre)
+@receiver(post_save, sender=BeatSubGenre)
+@receiver(post_delete, sender=BeatSubGenre)
+@receiver(post_save, sender=BeatInstrument)
+@receiver(post_delete, sender=BeatInstrument)
+@receiver(post_save, sender=BeatSubInstrument)
+@receiver(post_delete, sender=BeatSubInstrument)
+@receiver(post_save, sender=BeatMood)
+@receiver(post_delete, sender=BeatMood)
+def invalidate_taxonomy(sender, instance, **kwargs):
+    transaction.on_commit(beat_taxonomy.invalidate)
+
+
+@receiver(post_save, sender=BeatsSubmissions)
+def refresh_reviewer_load(sender, instance, created, update_fields=None, **kwargs):
+    if created or update_fields is None or {"status", "approval_person"} & set(update_fields):
+        reviewer_pool.refresh_loads_on_commit([instance.approval_person_id])
+
+
+@receiver(post_delete, sender=BeatsSubmissions)
+def release_reviewer_load(sender, instance, **kwargs):
+    reviewer_pool.refresh_loads_on_commit([instance.approval_person_id])
@@ -0,0 +1,21 @@
+from Beats_Management.caches import beat_taxonomy
+from Beats_Management.indexes import beat_files_facets, beats_text_search
+from Beats_Management.models import BeatGenre, BeatSubGenre, BeatInstrument, BeatSubInstrument, BeatMood, BeatBPM, \
+    BeatKey, BeatFile, BeatAudioFiles, Beats, BeatsSubmissions, BeatLikes, BeatDownloads, BeatFileDownloads, \
+    BeatCatalogCard
+from Utilities.Enums import BeatTypes
+from Utilities.SyntheticCatalog import SyntheticCatalog
+
+
+def refresh_beat_indexes():
+    beat_taxonomy.invalidate()
+    beat_files_facets.invalidate()
+    beats_text_search.rebuild()
+
+
+beat_catalog = SyntheticCatalog("beats", "beat", "beat_type", BeatTypes.list(), "beat_type", BeatTypes.list(),
+                                refresh_beat_indexes, genre=BeatGenre, sub_genre=BeatSubGenre,
+                                instrument=BeatInstrument, sub_instrument=BeatSubInstrument, mood=BeatMood,
+                                bpm=BeatBPM, key=BeatKey, file=BeatFile, audio_file=BeatAudioFiles, product=Beats,
+                                submission=BeatsSubmissions, like=BeatLikes, download=BeatDownloads,
+                                file_download=BeatFileDownloads, card=BeatCatalogCard)
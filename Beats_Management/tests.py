@@ -1,3 +1,206 @@
-from django.test import TestCase
+import random
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from Beats_Management.counters import beat_file_counters
+from Beats_Management.models import BeatGenre, BeatSubGenre, BeatInstrument, BeatSubInstrument, BeatMood, BeatBPM, \
+    BeatKey, BeatFile, BeatAudioFiles, Beats, BeatsSubmissions, BeatPlugin, BeatLikes, BeatDownloads, BeatCollections, \
+    BeatCollectionFiles, BeatCatalogCard
+from Beats_Management.synthetic import beat_catalog
+from User_Management.models import User, Supplier, Artist, MusicContentInformation
+from User_Management.synthetic import generate_users
+from Utilities.Enums import UserType, BeatTypes, SubmissionStatus
+from Utilities.QueryCountRegression import QueryCountRegressionMixin
+
+
+class BeatFixtureTestCase(TestCase):
+    """Creates a member, a supplier and the taxonomy rows beats are made of"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create(email="member@test.com", password="pw", usertype=UserType.MEMBER.value,
+                                         verified=True)
+        cls.supplier = User.objects.create(email="supplier@test.com", password="pw",
+                                           usertype=UserType.SUPPLIER.value, verified=True)
+        content_info = MusicContentInformation.objects.create(talent="talent", daw="daw")
+        artist = Artist.objects.create(name="artist", complete_residence_address="address", major_city="city",
+                                       country_or_state="state", bio="bio", content_info=content_info)
+        Supplier.objects.create(supplier_user=cls.supplier, first_name="first", last_name="last",
+                                username="supplier", artist=artist)
+        cls.genre = BeatGenre.objects.create(name="Trap")
+        cls.sub_genre = BeatSubGenre.objects.create(name="Drill", genre=cls.genre)
+        cls.instrument = BeatInstrument.objects.create(name="Drums")
+        cls.sub_instrument = BeatSubInstrument.objects.create(name="Kick", instrument=cls.instrument)
+        cls.mood = BeatMood.objects.create(name="Dark")
+
+    def create_beat(self, files_count):
+        beat = Beats.objects.create(title=f"beat {files_count}", genre=self.genre, sub_genre=self.sub_genre)
+        beat.mood.add(self.mood)
+        for index in range(files_count):
+            beat.audio_files.add(BeatAudioFiles.objects.create(
+                file=BeatFile.objects.create(file_name=f"file {index}.wav", file_size="10"), genre=self.genre,
+                sub_genre=self.sub_genre, instrument=self.instrument, sub_instrument=self.sub_instrument,
+                mood=self.mood, bpm=BeatBPM.objects.create(start_value=120, end_value=124, bpm_type="Range"),
+                key=BeatKey.objects.create(key="C", key_scale="Minor", key_type="Sharp"),
+                beat_type=BeatTypes.BEAT.value, source="Electronic"))
+        return BeatsSubmissions.objects.create(beat=beat, supplier=self.supplier, beat_type=BeatTypes.BEAT.value,
+                                               status=SubmissionStatus.APPROVED.value)
+
+
+class ViewBeatQueryCountTest(BeatFixtureTestCase):
+    """The beat detail page runs the same number of queries whatever the number of audio files"""
+
+    def view_beat(self, submission):
+        client = APIClient()
+        client.force_authenticate(self.member)
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/beatsapi/beats/view-beats",
+                                  {"id": submission.id, "beat_type": BeatTypes.BEAT.value})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["detail"]["audio_files"]), submission.beat.audio_files.count())
+        return len(queries)
+
+    def test_query_count_does_not_depend_on_files_count(self):
+        self.assertEqual(self.view_beat(self.create_beat(1)), self.view_beat(self.create_beat(12)))
+
+
+@override_settings(COUNTER_FLUSH_INTERVAL=3600)
+class LikeCountersTest(BeatFixtureTestCase):
+    """Likes and unlikes are buffered, read exactly in this process and counted once per deleted like"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.member)
+        self.beat = self.create_beat(1).beat
+        self.audio_file = self.beat.audio_files.get()
+        self.addCleanup(beat_file_counters.flush)
+
+    def post(self, action):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f"/beatsapi/mylibrary/likes/{action}",
+                                        {"beat_id": self.beat.id, "audio_file_id": self.audio_file.id}, format="json")
+        self.assertEqual(response.status_code, 200)
+
+    def likes_count(self):
+        audio_file = BeatAudioFiles.objects.get(pk=self.audio_file.pk)
+        return audio_file.likes_count, beat_file_counters.merge([audio_file], "likes_count")[0].likes_count
+
+    def test_likes_are_merged_until_flushed(self):
+        self.post("like")
+        self.assertEqual(self.likes_count(), (0, 1))
+        self.assertEqual(beat_file_counters.pending_for_group(self.beat.id, "likes_count"), 1)
+
+        beat_file_counters.flush()
+        self.assertEqual(self.likes_count(), (1, 1))
+
+        self.post("unlike")
+        self.assertEqual(self.likes_count(), (1, 0))
+        beat_file_counters.flush()
+        self.assertEqual(self.likes_count(), (0, 0))
+
+    def test_like_deleted_by_a_concurrent_unlike_is_not_counted_twice(self):
+        self.post("like")
+        beat_file_counters.flush()
+        delete = BeatLikes.delete
+
+        def delete_after_concurrent_unlike(like, *args, **kwargs):
+            BeatLikes.objects.filter(pk=like.pk).delete()
+            return delete(like, *args, **kwargs)
+
+        with mock.patch.object(BeatLikes, "delete", delete_after_concurrent_unlike):
+            self.post("unlike")
+        self.assertEqual(self.likes_count(), (1, 1))
+
+
+def beat_detail(fixture):
+    return {"id": fixture["beat"].id, "beat_type": fixture["beat"].beat_type}
+
+
+class BeatRoutesQueryCountTest(QueryCountRegressionMixin, TestCase):
+    """Every GET route of the beats app runs as many queries on a large catalog as on a small one"""
+
+    urlconf = "Beats_Management.urls"
+    prefix = "/beatsapi/"
+    routes = {
+        "explore/discover": ("member", lambda fixture: {"beat_type": fixture["beat"].beat_type}),
+        "beats/view-beats": ("member", beat_detail),
+        "beats/view-beats/audio-files": ("member", lambda fixture: {**beat_detail(fixture), "sort": "likes"}),
+        "beats/beats": ("member", None),
+        "search": ("member", lambda fixture: {"q": fixture["beat"].beat.title.split()[0]}),
+        "search/typeahead": ("member", lambda fixture: {"q": fixture["beat"].beat.title[:3]}),
+        "search/files": ("member", None),
+        "mylibrary/likes/view-likes": ("member", lambda fixture: {"product_type": fixture["beat"].beat_type}),
+        "mylibrary/downloads/view": ("member", lambda fixture: {"product_type": fixture["download_type"]}),
+        "mylibrary/downloads/view-beat": ("member", lambda fixture: {"download_id": fixture["download"].id,
+                                                                     "beat_id": fixture["download"].beat_id}),
+        "mylibrary/downloads/archive": ("member", lambda fixture: {"beat_id": fixture["beat"].beat_id}),
+        "mylibrary/collection": ("member", None),
+        "mylibrary/collection/view": ("member", lambda fixture: {"product_type": fixture["beat"].beat_type}),
+        "mylibrary/collection/dropdown": ("member", None),
+        "moods/": ("admin", None),
+        "plugins/": ("admin", None),
+        "genres/": ("admin", None),
+        "sub-genres/": ("admin", lambda fixture: {"genre_id": fixture["genre"].id,
+                                                  "genre_name": fixture["genre"].name}),
+        "instruments/": ("admin", None),
+        "sub-instruments/": ("admin", lambda fixture: {"instrument_id": fixture["instrument"].id,
+                                                       "instrument_name": fixture["instrument"].name}),
+        "drp/genres/": ("supplier", None),
+        "drp/plugins/": ("supplier", None),
+        "drp/instruments/": ("supplier", None),
+        "drp/moods/": ("supplier", None),
+        "view-beats/": ("supplier", lambda fixture: {"beat_type": fixture["beat"].beat_type}),
+        "view-submitted-beats/": ("admin", None),
+        "review-queue/": ("staff", None),
+    }
+
+    def seed(self, size):
+        """This function generates a catalog of 12 * size beats of size files, half of them approved, with size
+        likes, downloads and collection files per member and size more genres, instruments, moods and plugins"""
+        rng = random.Random(size)
+        suppliers, members, staff = generate_users("routes", rng, suppliers=1, members=2, staff=1)
+        beat_catalog.generate(rng, suppliers, members, staff, products=12 * size, files_per_product=size,
+                              likes=2 * size, downloads=2 * size, approved=0.5)
+        genre, instrument = BeatGenre.objects.first(), BeatInstrument.objects.first()
+        BeatSubGenre.objects.bulk_create(BeatSubGenre(name=f"Extra {index}", genre=genre) for index in range(size))
+        BeatSubInstrument.objects.bulk_create(BeatSubInstrument(name=f"Extra {index}", instrument=instrument)
+                                              for index in range(size))
+        for model in (BeatGenre, BeatInstrument, BeatMood):
+            model.objects.bulk_create(model(name=f"Extra {index}") for index in range(size))
+        BeatPlugin.objects.bulk_create(BeatPlugin(name=f"Plugin {index}", extension="vst") for index in range(size))
+
+        member = User.objects.get(pk=members[0])
+        collections = BeatCollections.objects.bulk_create(BeatCollections(name=f"Collection {index}",
+                                                                          description="Synthetic", member=member)
+                                                          for index in range(size))
+        likes = BeatLikes.objects.filter(member=member)
+        BeatCollectionFiles.objects.bulk_create(BeatCollectionFiles(collection=collection, beat_id=like.beat_id,
+                                                                    audio_file_id=like.file_id)
+                                                for collection, like in zip(collections, likes))
+        beat = BeatsSubmissions.objects.select_related("beat").filter(
+            status=SubmissionStatus.APPROVED.value, beat__beat_likes__member=member).first()
+        for beat_type in BeatTypes.list():
+            self.assertTrue(BeatCatalogCard.objects.filter(beat_type=beat_type).exists(),
+                            f"the fixture of size {size} has no approved {beat_type} beat")
+        self.assertTrue(BeatsSubmissions.objects.filter(status=SubmissionStatus.SUBMITTED.value).exists(),
+                        f"the fixture of size {size} has no submitted beat")
+        download = BeatDownloads.objects.select_related("beat").filter(
+            member=member, beat__beat_submissions__status=SubmissionStatus.APPROVED.value).first()
+        return {
+            "member": member,
+            "supplier": User.objects.get(pk=suppliers[0][0]),
+            "staff": User.objects.get(pk=staff[0]),
+            "admin": User.objects.create(email="admin@test.com", password="pw", usertype=UserType.ADMIN.value,
+                                         verified=True),
+            "beat": beat,
+            "download": download,
+            "download_type": download.beat.beat_submissions.get().beat_type,
+            "genre": genre,
+            "instrument": instrument,
+        }
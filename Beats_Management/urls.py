@@ -2,14 +2,15 @@ from django.urls import path
 
 from Beats_Management.MainStream import GetBeatsView,  ViewBeatView, \
     CollectionsView, CollectionsAddView, CollectionsRemoveView, CollectionsDropDownView, DownloadsView, \
-    ViewDownloadsView, ViewFileDownloadsView, ViewCollectionView, LikeView, UnlikeView, ViewLikesView, \
-    GetAllBeatsView
+    DownloadArchiveView, ViewDownloadsView, ViewFileDownloadsView, ViewCollectionView, LikeView, UnlikeView, ViewLikesView, \
+    GetAllBeatsView, SearchBeatFilesView, SearchBeatsView, BeatsTypeaheadView, ViewBeatFilesView
     # GetSamplesView, GetMIDIView, GetPresetView
     
 from Beats_Management.Views import BeatGenresView, BeatGenre,BeatSubGenresView, BeatGenresDropdownView, BeatInstrumentsView, \
     BeatSubInstrumentsView, BeatInstrumentsDropdownView, BeatMoodsView, BeatMoodsDropdownView, BeatsSubmissionsView, ViewBeatsView, \
     PluginsDropdownView, SendRevisionBeatsView, ResolveRevisionBeatsView, ApproveRevisionBeatsView, PluginsView, \
-    RejectRevisionBeatsView, BeatSubmitForReviewView, ApproveBeatView, RejectBeatView, ViewSubmittedBeatsView
+    RejectRevisionBeatsView, BeatSubmitForReviewView, ApproveBeatView, RejectBeatView, ViewSubmittedBeatsView, \
+    ReviewQueueBeatsView
 
 urlpatterns = [
     # Mainstream
@@ -17,10 +18,16 @@ urlpatterns = [
 
     # beats
     path("beats/view-beats", ViewBeatView.as_view()),
+    path("beats/view-beats/audio-files", ViewBeatFilesView.as_view()),
     path("beats/beats", GetAllBeatsView.as_view()),
     # path("beats/midi", GetMIDIView.as_view()),
     # path("beats/preset", GetPresetView.as_view()),
 
+    # Search
+    path("search", SearchBeatsView.as_view()),
+    path("search/typeahead", BeatsTypeaheadView.as_view()),
+    path("search/files", SearchBeatFilesView.as_view()),
+
     # My Library
     path("mylibrary/likes/view-likes", ViewLikesView.as_view()),
     path("mylibrary/likes/like", LikeView.as_view()),
@@ -30,6 +37,7 @@ urlpatterns = [
     path("mylibrary/downloads/view", ViewDownloadsView.as_view()),
     path("mylibrary/downloads/view-beat", ViewFileDownloadsView.as_view()),
     path("mylibrary/downloads/download", DownloadsView.as_view()),
+    path("mylibrary/downloads/archive", DownloadArchiveView.as_view()),
 
     # Collections
     path("mylibrary/collection", CollectionsView.as_view()),
@@ -65,6 +73,7 @@ urlpatterns = [
     path("reject-file/", RejectRevisionBeatsView.as_view()),
     path("submit-for-review/", BeatSubmitForReviewView.as_view()),
     path("view-submitted-beats/", ViewSubmittedBeatsView.as_view()),
+    path("review-queue/", ReviewQueueBeatsView.as_view()),
     path("approve-beat/", ApproveBeatView.as_view()),
     path("reject-beat/", RejectBeatView.as_view()),
 ]
@@ -0,0 +1,35 @@
+import time
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+
+from Email_Management.outbox import email_outbox
+
+
+class Command(BaseCommand):
+    help = "Delivers the queued emails, keeping one mail connection open while there is work"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="deliver the due emails and exit")
+        parser.add_argument("--interval", type=float, default=settings.EMAIL_OUTBOX_POLL_INTERVAL,
+                            help="seconds to wait between polls of an empty outbox")
+
+    def handle(self, *args, **options):
+        mail_connection = get_connection()
+        try:
+            while True:
+                try:
+                    sent = email_outbox.deliver(mail_connection)
+                except Exception as error:
+                    self.stderr.write(f"delivering the email outbox failed: {error}")
+                    sent = 0
+                if sent:
+                    self.stdout.write(f"sent {sent} emails")
+                if options["once"]:
+                    return
+                if not sent:
+                    mail_connection.close()
+                    time.sleep(options["interval"])
+        finally:
+            mail_connection.close()
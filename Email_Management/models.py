@@ -0,0 +1,76 @@
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.db import models
+from django.utils import timezone
+
+from User_Management.models import DateTimeModel
+from Utilities.Enums import EmailStatus
+
+
+class EmailOutbox(DateTimeModel):
+    """This Model keeps the emails queued by request handlers until the outbox worker delivers them"""
+
+    from_email = models.CharField(max_length=255, null=True, blank=True)
+    to = models.CharField(max_length=255)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    content_subtype = models.CharField(max_length=20, default="html")
+    status = models.CharField(max_length=20, choices=EmailStatus.choices, default=EmailStatus.PENDING.value)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claim = models.UUIDField(null=True, blank=True)
+    last_error = models.TextField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="email_outbox_due_idx"),
+        ]
+
+    @classmethod
+    def claim_due(cls, batch_size):
+        """This function leases a batch of due emails to the caller and returns them
+
+        The lease pushes ``next_attempt_at`` forward, so another worker skips the batch, and an email
+        claimed by a worker that died is delivered again once the lease is over.
+        """
+        now = timezone.now()
+        claim = uuid.uuid4()
+        due = cls.objects.filter(status=EmailStatus.PENDING.value, next_attempt_at__lte=now). \
+            order_by("next_attempt_at", "id").values_list("id", flat=True)[:batch_size]
+        cls.objects.filter(pk__in=list(due), status=EmailStatus.PENDING.value, next_attempt_at__lte=now). \
+            update(claim=claim, next_attempt_at=now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE))
+        return list(cls.objects.filter(claim=claim, status=EmailStatus.PENDING.value).order_by("id"))
+
+    @classmethod
+    def next_due_at(cls):
+        """This function returns when the earliest pending email is due, None when nothing is pending"""
+        return cls.objects.filter(status=EmailStatus.PENDING.value).order_by("next_attempt_at"). \
+            values_list("next_attempt_at", flat=True).first()
+
+    def message(self, connection):
+        email = EmailMessage(from_email=self.from_email, to=[self.to], subject=self.subject, body=self.body,
+                             connection=connection)
+        email.content_subtype = self.content_subtype
+        return email
+
+    def mark_sent(self):
+        self.status = EmailStatus.SENT.value
+        self.sent_at = timezone.now()
+        self.attempts += 1
+        self.last_error = None
+        self.claim = None
+
+    def mark_failed(self, error):
+        """This function schedules a retry with exponential backoff, or gives up after the last attempt"""
+        self.attempts += 1
+        self.last_error = str(error)
+        self.claim = None
+        if self.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+            self.status = EmailStatus.FAILED.value
+        else:
+            delay = settings.EMAIL_OUTBOX_RETRY_DELAY * 2 ** (self.attempts - 1)
+            self.next_attempt_at = timezone.now() + timedelta(seconds=delay)
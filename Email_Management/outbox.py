@@ -0,0 +1,4 @@
+from Email_Management.models import EmailOutbox
+from Utilities.EmailOutboxWorker import EmailOutboxWorker
+
+email_outbox = EmailOutboxWorker(EmailOutbox)
@@ -0,0 +1,96 @@
+import smtplib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import mail
+from django.test import TestCase
+from django.utils import timezone
+
+from Email_Management.models import EmailOutbox
+from Email_Management.outbox import email_outbox
+from Utilities.Enums import EmailStatus
+
+
+class FailingConnection:
+    """Mail connection whose every send fails, as when the SMTP server refuses the message"""
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send_messages(self, messages):
+        raise smtplib.SMTPException("server unavailable")
+
+
+class EmailOutboxTest(TestCase):
+    """Queued emails are sent once, retried with backoff when sending fails and leased to one worker at a time"""
+
+    def enqueue(self, to="member@test.com"):
+        return email_outbox.enqueue(from_email="noreply@test.com", to=to, subject="Subject", body="Body")
+
+    def deliver_failing(self):
+        with self.assertLogs("Utilities.EmailOutboxWorker", "WARNING"):
+            return email_outbox.deliver(FailingConnection())
+
+    def test_enqueued_emails_are_sent_once(self):
+        first, second = self.enqueue(), self.enqueue(to="staff@test.com")
+
+        self.assertEqual(email_outbox.deliver(), 2)
+        self.assertEqual([message.to for message in mail.outbox], [["member@test.com"], ["staff@test.com"]])
+        for email in EmailOutbox.objects.filter(pk__in=[first.pk, second.pk]):
+            self.assertEqual((email.status, email.attempts, email.claim), (EmailStatus.SENT.value, 1, None))
+            self.assertIsNotNone(email.sent_at)
+
+        self.assertEqual(email_outbox.deliver(), 0)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIsNone(EmailOutbox.next_due_at())
+
+    def test_failed_emails_are_retried_with_backoff(self):
+        email = self.enqueue()
+
+        before = timezone.now()
+        self.assertEqual(self.deliver_failing(), 0)
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), (EmailStatus.PENDING.value, 1))
+        self.assertIn("server unavailable", email.last_error)
+        self.assertGreaterEqual(email.next_attempt_at, before + timedelta(seconds=settings.EMAIL_OUTBOX_RETRY_DELAY))
+        self.assertEqual(EmailOutbox.next_due_at(), email.next_attempt_at)
+
+        self.assertEqual(email_outbox.deliver(), 0)
+        EmailOutbox.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(self.deliver_failing(), 0)
+        email.refresh_from_db()
+        self.assertEqual(email.attempts, 2)
+        self.assertGreaterEqual(email.next_attempt_at,
+                                timezone.now() + timedelta(seconds=2 * settings.EMAIL_OUTBOX_RETRY_DELAY - 1))
+
+        EmailOutbox.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(email_outbox.deliver(), 1)
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts, email.last_error), (EmailStatus.SENT.value, 3, None))
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_emails_are_given_up_after_the_last_attempt(self):
+        email = self.enqueue()
+        for _ in range(settings.EMAIL_OUTBOX_MAX_ATTEMPTS):
+            EmailOutbox.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+            self.deliver_failing()
+
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), (EmailStatus.FAILED.value, settings.EMAIL_OUTBOX_MAX_ATTEMPTS))
+        EmailOutbox.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(email_outbox.deliver(), 0)
+        self.assertEqual(mail.outbox, [])
+
+    def test_claimed_emails_are_leased_until_the_lease_expires(self):
+        email = self.enqueue()
+
+        self.assertEqual([claimed.pk for claimed in EmailOutbox.claim_due(10)], [email.pk])
+        self.assertEqual(EmailOutbox.claim_due(10), [])
+        self.assertEqual(email_outbox.deliver(), 0)
+
+        EmailOutbox.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(email_outbox.deliver(), 1)
+        self.assertEqual(EmailOutbox.objects.get(pk=email.pk).status, EmailStatus.SENT.value)
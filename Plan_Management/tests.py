@@ -1,3 +1,31 @@
 from django.test import TestCase
 
-# Create your tests here.
+from Plan_Management.models import Plan, PlanDetails, Pricing
+from User_Management.models import User
+from Utilities.Enums import UserType, PlanTypes, PlanDetailsTypes
+from Utilities.QueryCountRegression import QueryCountRegressionMixin
+
+
+class PlanRoutesQueryCountTest(QueryCountRegressionMixin, TestCase):
+    """Every GET route of the plans app runs as many queries with many plans as with a few"""
+
+    urlconf = "Plan_Management.urls"
+    prefix = "/plan/"
+    routes = {
+        "view/": ("admin", lambda fixture: {"timeline": PlanDetailsTypes.MONTHLY.value}),
+        "custom/": ("admin", None),
+        "monthly-yearly/": ("admin", None),
+        "pricing/": ("admin", None),
+    }
+
+    def seed(self, size):
+        """This function generates size plans of every type, each with size monthly and yearly details"""
+        plans = Plan.objects.bulk_create(Plan(name=f"Plan {plan_type} {index}", plan_type=plan_type)
+                                         for plan_type in PlanTypes.list() for index in range(size))
+        PlanDetails.objects.bulk_create(PlanDetails(pricing=index, points=index * 10, timeline=timeline, plan=plan)
+                                        for plan in plans for index in range(size)
+                                        for timeline in PlanDetailsTypes.list())
+        Pricing.objects.update_or_create(pk=1, defaults={"cents_per_point": 1.5})
+        admin = User.objects.create(email="admin@test.com", password="pw", usertype=UserType.ADMIN.value,
+                                    verified=True)
+        return {"admin": admin}
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from Product_Management.caches import pack_library
 from Product_Management.models import Collections, AudioFiles, CollectionFiles
 from Utilities import generate_humanize_time
 from Utilities.Enums import FileStatus, SubmissionStatus
@@ -81,7 +82,7 @@ class CollectionAddSerializer(serializers.Serializer):
 
         pack = audio_file.packs.first()
 
-        if pack.id != pack_id and pack.submissions().first().status != SubmissionStatus.APPROVED.value:
+        if pack.id != pack_id and not pack.submissions.filter(status=SubmissionStatus.APPROVED.value).exists():
             raise serializers.ValidationError("audio file not found.")
 
         user = self.context.get("user")
@@ -97,7 +98,9 @@ class CollectionAddSerializer(serializers.Serializer):
         return attrs
 
     def create(self, validated_data):
-        return CollectionFiles.objects.get_or_create(**validated_data)
+        collection_file = CollectionFiles.objects.get_or_create(**validated_data)
+        pack_library.invalidate(validated_data["collection"].member_id)
+        return collection_file
 
 
 class CollectionRemoveSerializer(serializers.Serializer):
@@ -142,6 +145,7 @@ class CollectionRemoveSerializer(serializers.Serializer):
             raise serializers.ValidationError("file not found in given collection")
 
         collection_file.delete()
+        pack_library.invalidate(collection_file.collection.member_id)
 
         return attrs
 
@@ -1,6 +1,8 @@
 from django.db import transaction
 from rest_framework import serializers
 
+from Product_Management.caches import pack_library
+from Product_Management.counters import pack_counters, pack_file_counters
 from Product_Management.models import AudioFiles, Pack, Downloads, FileDownloads
 from Utilities import generate_humanize_time
 from Utilities.Enums import FileStatus, SubmissionStatus
@@ -12,6 +14,7 @@ class DownloadsSerializer(serializers.Serializer):
         error_messages={"required": "pack_id is required", "blank": "pack_id cannot be blank"}
     )
     audio_file_id = serializers.IntegerField(
+        required=False,
         error_messages={"required": "audio_file_id is required", "blank": "audio_file_id cannot be blank"}
     )
     complete_pack = serializers.BooleanField(
@@ -50,17 +53,17 @@ class DownloadsSerializer(serializers.Serializer):
 
             pack = audio_file.packs.first()
 
-            if pack.id != pack_id and pack.submissions.all().first().status != SubmissionStatus.APPROVED.value:
+            if pack.id != pack_id and not pack.submissions.filter(status=SubmissionStatus.APPROVED.value).exists():
                 raise serializers.ValidationError("audio file not found in pack.")
 
             audio_files.append(audio_file)
         else:
             pack = Pack.objects.filter(pk=pack_id).first()
 
-            if not pack or pack.submissions.all().first().status != SubmissionStatus.APPROVED.value:
+            if not pack or not pack.submissions.filter(status=SubmissionStatus.APPROVED.value).exists():
                 raise serializers.ValidationError("pack not found.")
 
-            audio_files.extend(pack.audio_files.all())
+            audio_files.extend(pack.audio_files.select_related("file").filter(status=FileStatus.APPROVED.value))
 
         attrs["audio_files"] = audio_files
         attrs["pack"] = pack
@@ -73,13 +76,17 @@ class DownloadsSerializer(serializers.Serializer):
             pack = validated_data.get("pack")
             member = validated_data.get("member")
 
-            pack.downloads_count += 1
-            pack.save(update_fields=["downloads_count"])
+            pack_counters.add(pack.pk, "downloads_count")
             download = Downloads.objects.get_or_create(pack=pack, member=member)[0]
+            downloaded = set(FileDownloads.objects.filter(download=download, audio_file__in=audio_files).
+                             values_list("audio_file_id", flat=True))
+            FileDownloads.objects.bulk_create(
+                [FileDownloads(download=download, audio_file=audio_file)
+                 for audio_file in audio_files if audio_file.pk not in downloaded],
+                ignore_conflicts=True)
+            pack_library.invalidate(member.pk)
             for audio_file in audio_files:
-                audio_file.downloads_count += 1
-                audio_file.save(update_fields=["downloads_count"])
-                FileDownloads.objects.get_or_create(download=download, audio_file=audio_file)
+                pack_file_counters.add(audio_file.pk, "downloads_count", group=pack.pk)
 
         return download
 
@@ -1,6 +1,8 @@
 from django.db import transaction
 from rest_framework import serializers
 
+from Product_Management.caches import pack_library
+from Product_Management.counters import pack_file_counters
 from Product_Management.models import AudioFiles, Likes
 from Utilities import generate_humanize_time
 from Utilities.Validators import InputValidator
@@ -39,12 +41,6 @@ class LikesSerializer(serializers.Serializer):
         if pack.id != pack_id:
             raise serializers.ValidationError("audio file not found in pack.")
 
-        like = Likes.objects.select_related("file").filter(file__id=audio_file_id, pack__id=pack_id,
-                                                           member=user).first()
-
-        if like:
-            raise serializers.ValidationError("file already liked.")
-
         attrs["audio_file"] = audio_file
         attrs["pack"] = pack
         attrs["member"] = user
@@ -56,10 +52,9 @@ class LikesSerializer(serializers.Serializer):
             pack = validated_data.get("pack")
             member = validated_data.get("member")
 
-            (like, created) = Likes.objects.get_or_create(pack=pack, file=audio_file, member=member)
-            if created:
-                audio_file.likes_count += 1
-                audio_file.save(update_fields=["likes_count"])
+            like = Likes.objects.create(pack=pack, file=audio_file, member=member)
+            pack_file_counters.add(audio_file.pk, "likes_count", group=pack.pk)
+            pack_library.invalidate(member.pk)
 
         return like
 
@@ -93,10 +88,11 @@ class UnLikesSerializer(serializers.Serializer):
         if not like:
             raise serializers.ValidationError("file not liked yet.")
 
-        like.file.likes_count -= 1
-        like.file.save(update_fields=["likes_count"])
-
-        like.delete()
+        # a concurrent unlike of the same like may have deleted it already, only the one that did decrements
+        deleted, _ = like.delete()
+        if deleted:
+            pack_file_counters.add(like.file_id, "likes_count", -1, group=like.pack_id)
+        pack_library.invalidate(user.pk)
         return attrs
 
 
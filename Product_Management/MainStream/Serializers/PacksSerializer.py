@@ -18,6 +18,23 @@ class PacksSerializer(serializers.Serializer):
             return obj.supplier.get_user_details().artist.name
 
 
+class PackCatalogCardSerializer(serializers.Serializer):
+    id = serializers.IntegerField(source="submission_id")
+    artist = serializers.CharField()
+    title = serializers.CharField()
+    artwork = serializers.ImageField()
+    genre = serializers.CharField()
+    sub_genre = serializers.CharField()
+    moods = serializers.ListField(child=serializers.CharField())
+    files_count = serializers.IntegerField()
+    likes_count = serializers.IntegerField()
+    downloads_count = serializers.IntegerField()
+
+    class Meta:
+        fields = ("id", "artist", "title", "artwork", "genre", "sub_genre", "moods", "files_count", "likes_count",
+                  "downloads_count")
+
+
 class AudioFileSerializer(serializers.Serializer):
     id = serializers.IntegerField()
     file = serializers.FileField(source="file.file")
@@ -42,6 +59,28 @@ class AudioFileSerializer(serializers.Serializer):
                   "bpm_start_value", "bpm_end_value", "bpm_type", "key", "key_scale", "key_type", "type", "source")
 
 
+class LibraryAudioFileSerializer(AudioFileSerializer):
+    is_liked = serializers.SerializerMethodField(method_name="get_is_liked")
+    is_downloaded = serializers.SerializerMethodField(method_name="get_is_downloaded")
+    in_collection = serializers.SerializerMethodField(method_name="get_in_collection")
+
+    class Meta:
+        fields = AudioFileSerializer.Meta.fields + ("is_liked", "is_downloaded", "in_collection")
+
+    def get_flag(self, obj, flag):
+        library = self.context.get("library")
+        return library(obj.id)[flag] if library else False
+
+    def get_is_liked(self, obj):
+        return self.get_flag(obj, "is_liked")
+
+    def get_is_downloaded(self, obj):
+        return self.get_flag(obj, "is_downloaded")
+
+    def get_in_collection(self, obj):
+        return self.get_flag(obj, "in_collection")
+
+
 class PackSerializer(serializers.Serializer):
     id = serializers.IntegerField()
     artist = serializers.SerializerMethodField(method_name="get_artist")
@@ -69,10 +108,11 @@ class PackSerializer(serializers.Serializer):
     def get_demo_file(obj):
         return AudioFileSerializer(obj.pack.demo_file).data
 
-    @staticmethod
-    def get_audio_files(obj):
-        audio_files = obj.pack.audio_files.all()
-        return AudioFileSerializer(audio_files, many=True).data
+    def get_audio_files(self, obj):
+        audio_files = self.context.get("audio_files")
+        if audio_files is None:
+            audio_files = obj.pack.audio_files.all()
+        return LibraryAudioFileSerializer(audio_files, many=True, context=self.context).data
 
     @staticmethod
     def get_artist(obj):
@@ -2,4 +2,4 @@ from .CollectionsSerializer import CollectionsSerializer, CollectionAddSerialize
     CollectionsDropdownSerializer, ViewCollectionsFilesSerializer
 from .DownloadsSerializer import DownloadsSerializer, ViewDownloadsSerializer, ViewFileDownloadsSerializer
 from .LikesSerializer import LikesSerializer, UnLikesSerializer, ViewLikedFilesSerializer
-from .PacksSerializer import PacksSerializer, PackSerializer
+from .PacksSerializer import PacksSerializer, PackSerializer, PackCatalogCardSerializer, LibraryAudioFileSerializer
@@ -7,6 +7,7 @@ from rest_framework.views import APIView
 
 from Product_Management.MainStream.Serializers import CollectionsSerializer, CollectionAddSerializer, \
     CollectionRemoveSerializer, CollectionsDropdownSerializer, ViewCollectionsFilesSerializer
+from Product_Management.caches import pack_library
 from Product_Management.models import CollectionFiles
 from Utilities import extract_error_messages, group_by_attribute
 from Utilities.Enums import SubmissionStatus
@@ -20,7 +21,7 @@ class CollectionsDropDownView(APIView):
     @swagger_auto_schema(responses={200: CollectionsDropdownSerializer(many=True)})
     def get(request):
         """This function return the My Library Page Collections"""
-        collections = request.user.collections.only("id", "name")
+        collections = request.user.collections.only("id", "name", "member")
         collections_serializer = CollectionsDropdownSerializer(collections, many=True)
         return Response({'detail': collections_serializer.data}, status=status.HTTP_200_OK)
 
@@ -41,7 +42,7 @@ class ViewCollectionView(APIView):
             return Response({"detail": "product_type is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         collections_details = CollectionFiles.objects. \
-            select_related("pack", "collection", "audio_file"). \
+            select_related("pack", "collection", "audio_file", "audio_file__file"). \
             prefetch_related("pack__submissions",
                              "pack__submissions__supplier",
                              "pack__submissions__supplier__supplier_details",
@@ -52,7 +53,7 @@ class ViewCollectionView(APIView):
 
         collections_details_serializer = ViewCollectionsFilesSerializer(collections_details, many=True)
 
-        collections = request.user.collections.only("id", "name", "description")
+        collections = request.user.collections.only("id", "name", "description", "member")
         collections_serializer = CollectionsSerializer(collections, many=True)
 
         return Response({'detail': {
@@ -69,7 +70,7 @@ class CollectionsView(APIView):
     @swagger_auto_schema(responses={200: CollectionsSerializer(many=True)})
     def get(request):
         """This function return the Collections"""
-        collections = request.user.collections.only("id", "name", "description")
+        collections = request.user.collections.only("id", "name", "description", "member")
         collections_serializer = CollectionsSerializer(collections, many=True)
         return Response({'detail': collections_serializer.data}, status=status.HTTP_200_OK)
 
@@ -103,6 +104,7 @@ class CollectionsView(APIView):
         if collection:
             try:
                 collection.delete()
+                pack_library.invalidate(request.user.id)
                 return Response({"detail": "collection deleted successfully"}, status=status.HTTP_201_CREATED)
             except Exception as e:
                 return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
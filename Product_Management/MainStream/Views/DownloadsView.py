@@ -1,3 +1,7 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils.http import content_disposition_header
+from django.utils.text import get_valid_filename
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -11,6 +15,7 @@ from Product_Management.models import Downloads, FileDownloads
 from Utilities import extract_error_messages
 from Utilities.Enums import SubmissionStatus
 from Utilities.Permissions import MemberPermissions
+from Utilities.ZipStream import stream_zip, audio_file_entries
 
 
 class ViewDownloadsView(APIView):
@@ -64,7 +69,7 @@ class ViewFileDownloadsView(APIView):
             return Response({"detail": "pack_id is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         downloads = FileDownloads.objects. \
-            select_related("download", "download__pack"). \
+            select_related("download", "download__pack", "audio_file", "audio_file__file"). \
             prefetch_related("download__pack__submissions",
                              "download__pack__submissions__supplier",
                              "download__pack__submissions__supplier__supplier_details",
@@ -94,3 +99,30 @@ class DownloadsView(APIView):
                             status=status.HTTP_400_BAD_REQUEST)
         downloads_serializer.save()
         return Response({'detail': "downloads started successfully."}, status=status.HTTP_201_CREATED)
+
+
+class DownloadArchiveView(APIView):
+    permission_classes = [IsAuthenticated, MemberPermissions]
+
+    @staticmethod
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("pack_id", in_=openapi.IN_QUERY,
+                          type=openapi.TYPE_INTEGER, required=True),
+    ], responses={200: "zip archive of the pack audio files", 400: "pack not found."})
+    def get(request):
+        """This function records the download of a complete pack and streams its approved audio files as a zip"""
+        data = {"pack_id": request.GET.get("pack_id"), "complete_pack": True}
+        downloads_serializer = DownloadsSerializer(data=data, context={"user": request.user})
+        downloads_serializer.is_valid()
+        if downloads_serializer.errors:
+            return Response({"detail": extract_error_messages(downloads_serializer.errors)},
+                            status=status.HTTP_400_BAD_REQUEST)
+        downloads_serializer.save()
+
+        pack = downloads_serializer.validated_data.get("pack")
+        entries = audio_file_entries(downloads_serializer.validated_data.get("audio_files"))
+        response = StreamingHttpResponse(stream_zip(entries, settings.MEDIA_STREAM_CHUNK_SIZE),
+                                         content_type="application/zip")
+        response["Content-Disposition"] = content_disposition_header(
+            True, f"{get_valid_filename(pack.title) or 'pack'}.zip")
+        return response
@@ -1,3 +1,4 @@
+from django.db import IntegrityError
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -27,7 +28,7 @@ class ViewLikesView(APIView):
             return Response({"detail": "product_type is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         likes = Likes.objects. \
-            select_related("pack", "file"). \
+            select_related("pack", "file", "file__file"). \
             prefetch_related("pack__submissions",
                              "pack__submissions__supplier",
                              "pack__submissions__supplier__supplier_details",
@@ -51,7 +52,10 @@ class LikeView(APIView):
         if like_serializer.errors:
             return Response({"detail": extract_error_messages(like_serializer.errors)},
                             status=status.HTTP_400_BAD_REQUEST)
-        like_serializer.save()
+        try:
+            like_serializer.save()
+        except IntegrityError:
+            return Response({"detail": ["file already liked."]}, status=status.HTTP_400_BAD_REQUEST)
         return Response({'detail': "file liked successfully."}, status=status.HTTP_200_OK)
 
 
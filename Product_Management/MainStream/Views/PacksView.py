@@ -1,4 +1,4 @@
-from django.db.models import Count
+from django.db.models import F
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -6,8 +6,15 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from Product_Management.MainStream.Serializers import PacksSerializer, PackSerializer
-from Product_Management.models import PackSubmissions
+from Product_Management.MainStream.Serializers import PacksSerializer, PackSerializer, PackCatalogCardSerializer, \
+    LibraryAudioFileSerializer
+from Product_Management.caches import pack_library
+from Product_Management.counters import merge_card_counts
+from Product_Management.indexes import pack_files_facets
+from Product_Management.models import AudioFiles, PackSubmissions, PackCatalogCard
+from Utilities.AudioFilesPage import audio_files_page
+from Utilities.AudioFilesQuerySet import AudioFilesQuerySet
+from Utilities.CursorPagination import CursorPaginator
 from Utilities.Enums import PackTypes, SubmissionStatus
 from Utilities.Permissions import MemberPermissions
 
@@ -19,16 +26,14 @@ class GetPacksView(APIView):
     @swagger_auto_schema(manual_parameters=[
         openapi.Parameter("pack_type", in_=openapi.IN_QUERY,
                           type=openapi.TYPE_STRING, required=True)
-    ], responses={200: PacksSerializer(many=True)})
+    ], responses={200: PackCatalogCardSerializer(many=True)})
     def get(request):
         """This function return the Discover Page Packs"""
         pack_type = request.GET.get("pack_type")
         if pack_type in PackTypes.list():
-            packs = PackSubmissions.objects.prefetch_related("supplier", "supplier__supplier_details",
-                                                             "supplier__supplier_details__artist",
-                                                             "pack").filter(pack_type=pack_type,
-                                                                            status=SubmissionStatus.APPROVED.value)[:15]
-            packs_serializer = PacksSerializer(packs, many=True)
+            packs = merge_card_counts(PackCatalogCard.objects.annotate(pack_id=F("submission__pack_id")).filter(
+                pack_type=pack_type).order_by("-created_at", "-id")[:15])
+            packs_serializer = PackCatalogCardSerializer(packs, many=True)
             return Response({'detail': packs_serializer.data}, status=status.HTTP_200_OK)
         return Response({"detail": "invalid pack_type."}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -48,61 +53,120 @@ class ViewPackView(APIView):
         id_ = request.GET.get("id")
         pack_type = request.GET.get("pack_type")
         if pack_type in PackTypes.list():
-            pack = (PackSubmissions.objects.prefetch_related("supplier", "supplier__supplier_details",
-                                                             "supplier__supplier_details__artist",
-                                                             "pack", "pack__demo_file", "pack__genre",
-                                                             "pack__sub_genre"
-                                                             ).filter(pk=id_, pack_type=pack_type,
-                                                                      status=SubmissionStatus.APPROVED.value
-                                                                      ).annotate(
-                files_count=Count('pack__audio_files'))).first()
+            pack = PackSubmissions.load_detail(id_, pack_type)
             if pack:
-                pack_serializer = PackSerializer(pack)
-                return Response({'detail': pack_serializer.data}, status=status.HTTP_200_OK)
+                audio_files = AudioFiles.objects.filter(packs=pack.pack_id)
+                try:
+                    audio_files, next_cursor = audio_files_page(request, audio_files, pack_files_facets.fields)
+                except ValueError as e:
+                    return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+                pack_serializer = PackSerializer(pack, context={"library": pack_library.flags(request.user.id),
+                                                                "audio_files": audio_files})
+                return Response({'detail': pack_serializer.data, 'next_cursor': next_cursor},
+                                status=status.HTTP_200_OK)
             return Response({"detail": "pack not found."}, status=status.HTTP_404_NOT_FOUND)
         return Response({"detail": "invalid pack_type."}, status=status.HTTP_400_BAD_REQUEST)
 
 
+class ViewPackFilesView(APIView):
+    permission_classes = [IsAuthenticated, MemberPermissions]
+
+    @staticmethod
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("id", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+        openapi.Parameter("pack_type", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+        openapi.Parameter("sort", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                          enum=list(AudioFilesQuerySet.sort_keys),
+                          description="likes and downloads order by counters flushed every few seconds"),
+        openapi.Parameter("order", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=["asc", "desc"]),
+        *[openapi.Parameter(facet, in_=openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                            description="comma separated values") for facet in pack_files_facets.facets],
+        openapi.Parameter("bpm_min", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        openapi.Parameter("bpm_max", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        openapi.Parameter("cursor", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+        openapi.Parameter("page_size", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    ], responses={200: LibraryAudioFileSerializer(many=True)})
+    def get(request):
+        """This function returns a page of the audio files of an approved pack, sorted and filtered"""
+        pack_type = request.GET.get("pack_type")
+        if pack_type not in PackTypes.list():
+            return Response({"detail": "invalid pack_type."}, status=status.HTTP_400_BAD_REQUEST)
+        pack_id = PackSubmissions.objects.filter(pk=request.GET.get("id"), pack_type=pack_type,
+                                                 status=SubmissionStatus.APPROVED.value). \
+            values_list("pack_id", flat=True).first()
+        if pack_id is None:
+            return Response({"detail": "pack not found."}, status=status.HTTP_404_NOT_FOUND)
+        try:
+            audio_files, next_cursor = audio_files_page(request, AudioFiles.objects.filter(packs=pack_id),
+                                                        pack_files_facets.fields)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        files_serializer = LibraryAudioFileSerializer(audio_files, many=True,
+                                              context={"library": pack_library.flags(request.user.id)})
+        return Response({"detail": files_serializer.data, "next_cursor": next_cursor}, status=status.HTTP_200_OK)
+
+
 class GetSamplesView(APIView):
     permission_classes = [IsAuthenticated, MemberPermissions]
 
     @staticmethod
-    @swagger_auto_schema(responses={200: PacksSerializer(many=True)})
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("cursor", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+        openapi.Parameter("page_size", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    ], responses={200: PacksSerializer(many=True)})
     def get(request):
         """This function return the Discover Page Packs"""
         packs = PackSubmissions.objects.prefetch_related("supplier", "supplier__supplier_details",
                                                          "supplier__supplier_details__artist",
                                                          "pack").filter(pack_type=PackTypes.SAMPLE.value,
                                                                         status=SubmissionStatus.APPROVED.value)
+        try:
+            packs, next_cursor = CursorPaginator.from_request(request, packs).get_page()
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         packs_serializer = PacksSerializer(packs, many=True)
-        return Response({'detail': packs_serializer.data}, status=status.HTTP_200_OK)
+        return Response({'detail': packs_serializer.data, 'next_cursor': next_cursor}, status=status.HTTP_200_OK)
 
 
 class GetPresetView(APIView):
     permission_classes = [IsAuthenticated, MemberPermissions]
 
     @staticmethod
-    @swagger_auto_schema(responses={200: PacksSerializer(many=True)})
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("cursor", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+        openapi.Parameter("page_size", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    ], responses={200: PacksSerializer(many=True)})
     def get(request):
         """This function return the Discover Page Packs"""
         packs = PackSubmissions.objects.prefetch_related("supplier", "supplier__supplier_details",
                                                          "supplier__supplier_details__artist",
                                                          "pack").filter(pack_type=PackTypes.PRESET.value,
                                                                         status=SubmissionStatus.APPROVED.value)
+        try:
+            packs, next_cursor = CursorPaginator.from_request(request, packs).get_page()
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         packs_serializer = PacksSerializer(packs, many=True)
-        return Response({'detail': packs_serializer.data}, status=status.HTTP_200_OK)
+        return Response({'detail': packs_serializer.data, 'next_cursor': next_cursor}, status=status.HTTP_200_OK)
 
 
 class GetMIDIView(APIView):
     permission_classes = [IsAuthenticated, MemberPermissions]
 
     @staticmethod
-    @swagger_auto_schema(responses={200: PacksSerializer(many=True)})
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("cursor", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+        openapi.Parameter("page_size", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    ], responses={200: PacksSerializer(many=True)})
     def get(request):
         """This function return the Discover Page Packs"""
         packs = PackSubmissions.objects.prefetch_related("supplier", "supplier__supplier_details",
                                                          "supplier__supplier_details__artist",
                                                          "pack").filter(pack_type=PackTypes.MIDI.value,
                                                                         status=SubmissionStatus.APPROVED.value)
+        try:
+            packs, next_cursor = CursorPaginator.from_request(request, packs).get_page()
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         packs_serializer = PacksSerializer(packs, many=True)
-        return Response({'detail': packs_serializer.data}, status=status.HTTP_200_OK)
+        return Response({'detail': packs_serializer.data, 'next_cursor': next_cursor}, status=status.HTTP_200_OK)
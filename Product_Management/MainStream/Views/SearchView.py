@@ -0,0 +1,96 @@
+from django.db.models import F
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from Product_Management.MainStream.Serializers.PacksSerializer import AudioFileSerializer, PackCatalogCardSerializer
+from Product_Management.counters import merge_card_counts
+from Product_Management.indexes import pack_files_facets, packs_text_search
+from Product_Management.models import AudioFiles, PackCatalogCard
+from Utilities.Enums import PackTypes
+from Utilities.Permissions import MemberPermissions
+
+
+class SearchFilesView(APIView):
+    permission_classes = [IsAuthenticated, MemberPermissions]
+    max_page_size = 100
+
+    @staticmethod
+    @swagger_auto_schema(manual_parameters=[
+        *[openapi.Parameter(facet, in_=openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                            description="comma separated values") for facet in pack_files_facets.facets],
+        openapi.Parameter("bpm_min", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        openapi.Parameter("bpm_max", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        openapi.Parameter("page", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        openapi.Parameter("page_size", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    ], responses={200: AudioFileSerializer(many=True)})
+    def get(request):
+        """This function searches the approved audio files by facets and returns the live facet counts"""
+        filters = {facet: [value for values in request.GET.getlist(facet) for value in values.split(",") if value]
+                   for facet in pack_files_facets.facets}
+        try:
+            bpm_min = int(request.GET["bpm_min"]) if request.GET.get("bpm_min") else None
+            bpm_max = int(request.GET["bpm_max"]) if request.GET.get("bpm_max") else None
+            page = max(int(request.GET.get("page", 1)), 1)
+            page_size = max(min(int(request.GET.get("page_size", 20)), SearchFilesView.max_page_size), 1)
+        except ValueError:
+            return Response({"detail": "invalid search parameters."}, status=status.HTTP_400_BAD_REQUEST)
+
+        ids, count, facets = pack_files_facets.search(filters, bpm_min, bpm_max,
+                                                      offset=(page - 1) * page_size, limit=page_size)
+        files = AudioFiles.objects.select_related("file", "genre", "sub_genre", "instrument", "sub_instrument",
+                                                  "mood", "bpm", "key").in_bulk(ids)
+        files_serializer = AudioFileSerializer([files[id_] for id_ in ids if id_ in files], many=True)
+        return Response({"detail": files_serializer.data, "count": count, "facets": facets},
+                        status=status.HTTP_200_OK)
+
+
+class SearchPacksView(APIView):
+    permission_classes = [IsAuthenticated, MemberPermissions]
+    max_page_size = 100
+
+    @staticmethod
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("q", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+        openapi.Parameter("pack_type", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+        openapi.Parameter("page", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        openapi.Parameter("page_size", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    ], responses={200: PackCatalogCardSerializer(many=True)})
+    def get(request):
+        """This function returns the approved packs matching the query by title and description, best first"""
+        pack_type = request.GET.get("pack_type")
+        if pack_type and pack_type not in PackTypes.list():
+            return Response({"detail": "invalid pack_type."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            page = max(int(request.GET.get("page", 1)), 1)
+            page_size = max(min(int(request.GET.get("page_size", 20)), SearchPacksView.max_page_size), 1)
+        except ValueError:
+            return Response({"detail": "invalid search parameters."}, status=status.HTTP_400_BAD_REQUEST)
+
+        ids, count = packs_text_search.search(request.GET.get("q", ""), pack_type,
+                                              offset=(page - 1) * page_size, limit=page_size)
+        packs = PackCatalogCard.objects.annotate(pack_id=F("submission__pack_id")).in_bulk(
+            ids, field_name="submission_id")
+        merge_card_counts(packs.values())
+        packs_serializer = PackCatalogCardSerializer([packs[id_] for id_ in ids if id_ in packs], many=True)
+        return Response({"detail": packs_serializer.data, "count": count}, status=status.HTTP_200_OK)
+
+
+class PacksTypeaheadView(APIView):
+    permission_classes = [IsAuthenticated, MemberPermissions]
+
+    @staticmethod
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("q", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+        openapi.Parameter("pack_type", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+    ], responses={200: "list of pack titles"})
+    def get(request):
+        """This function returns the pack titles completing the typed query"""
+        pack_type = request.GET.get("pack_type")
+        if pack_type and pack_type not in PackTypes.list():
+            return Response({"detail": "invalid pack_type."}, status=status.HTTP_400_BAD_REQUEST)
+        titles = packs_text_search.typeahead(request.GET.get("q", ""), pack_type)
+        return Response({"detail": titles}, status=status.HTTP_200_OK)
@@ -1,5 +1,7 @@
 from .Views.CollectionsView import CollectionsView, CollectionsAddView, CollectionsRemoveView, \
     CollectionsDropDownView, ViewCollectionView
-from .Views.DownloadsView import DownloadsView, ViewDownloadsView, ViewFileDownloadsView
+from .Views.DownloadsView import DownloadsView, ViewDownloadsView, ViewFileDownloadsView, DownloadArchiveView
 from .Views.LikeView import LikeView, UnlikeView, ViewLikesView
-from .Views.PacksView import GetPacksView, GetMIDIView, GetSamplesView, GetPresetView, ViewPackView
+from .Views.PacksView import GetPacksView, GetMIDIView, GetSamplesView, GetPresetView, ViewPackView, \
+    ViewPackFilesView
+from .Views.SearchView import SearchFilesView, SearchPacksView, PacksTypeaheadView
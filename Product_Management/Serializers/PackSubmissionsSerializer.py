@@ -4,8 +4,9 @@ from django.db import transaction
 from rest_framework import serializers
 
 from Product_Management.Serializers.FindApprovalPerson import find_approval_person
-from Product_Management.models import Genre, File, Pack, PackSubmissions, Mood, Instrument, Key, BPM, \
-    AudioFiles
+from Product_Management.caches import pack_taxonomy
+from Product_Management.models import File, Pack, PackSubmissions, Key, BPM, AudioFiles
+from Upload_Management.models import UploadSession
 from Utilities.Enums import BPMTypes, FlatKeys, SharpKeys, KeyScaleTypes, KeyTypes, PackTypes, SourceTypes, \
     SubmissionStatus, TypeTypes, FileStatus, Boolean
 from Utilities.Validators import InputValidator
@@ -27,7 +28,7 @@ def validate_image_file(file):
     return file
 
 
-def validate_audio_file_data(attrs):
+def validate_audio_file_data(attrs, taxonomy=None):
     file = attrs.get("file")
     file_name = attrs.get("file_name")
     file_size = attrs.get("file_size")
@@ -45,8 +46,8 @@ def validate_audio_file_data(attrs):
     file_type = attrs.get("file_type")
     file_source = attrs.get("file_source")
 
-    if not file:
-        raise serializers.ValidationError("file is required")
+    if not file and not attrs.get("upload_id"):
+        raise serializers.ValidationError("file or upload_id is required")
 
     if not InputValidator(file_name).is_valid():
         raise serializers.ValidationError("file_name is required")
@@ -60,12 +61,15 @@ def validate_audio_file_data(attrs):
     if not InputValidator(file_sub_genre).is_valid():
         raise serializers.ValidationError("file_sub_genre is required")
 
-    genre = Genre.objects.prefetch_related("sub_genre").filter(name=file_genre).first()
+    if taxonomy is None:
+        taxonomy = pack_taxonomy.lookup()
+
+    genre = taxonomy.genre(file_genre)
 
     if not genre:
         raise serializers.ValidationError("invalid genre")
 
-    sub_genre = genre.sub_genre.filter(name=file_sub_genre).first()
+    sub_genre = taxonomy.sub_genre(genre, file_sub_genre)
 
     if not sub_genre:
         raise serializers.ValidationError(f"invalid sub_genre under {genre.name}")
@@ -76,12 +80,12 @@ def validate_audio_file_data(attrs):
     if not InputValidator(file_sub_instrument).is_valid():
         raise serializers.ValidationError("file_sub_instrument is required")
 
-    instrument = Instrument.objects.prefetch_related("sub_instrument").filter(name=file_instrument).first()
+    instrument = taxonomy.instrument(file_instrument)
 
     if not instrument:
         raise serializers.ValidationError("invalid instrument")
 
-    sub_instrument = instrument.sub_instrument.filter(name=file_sub_instrument).first()
+    sub_instrument = taxonomy.sub_instrument(instrument, file_sub_instrument)
 
     if not sub_instrument:
         raise serializers.ValidationError(f"invalid sub_instrument under {instrument.name}")
@@ -89,7 +93,7 @@ def validate_audio_file_data(attrs):
     if not InputValidator(file_mood).is_valid():
         raise serializers.ValidationError("file_mood is required")
 
-    mood = Mood.objects.filter(name=file_mood).first()
+    mood = taxonomy.mood(file_mood)
 
     if not mood:
         raise serializers.ValidationError("invalid mood")
@@ -165,13 +169,42 @@ def validate_audio_file_data(attrs):
     return attrs
 
 
+class AudioFileListSerializer(serializers.ListSerializer):
+    def create(self, validated_data):
+        """This function creates the files, keys, BPMs and audio files of every item with one bulk insert per table"""
+        with transaction.atomic():
+            files = File.objects.bulk_create([
+                File(file=item.get("file"), file_name=item.get("file_name"), file_size=item.get("file_size"))
+                for item in validated_data])
+            keys = Key.objects.bulk_create([
+                Key(key=item.get("file_key"), key_scale=item.get("file_key_scale"), key_type=item.get("file_key_type"))
+                for item in validated_data])
+            bpms = BPM.objects.bulk_create([
+                BPM(start_value=int(item.get("file_bpm_start_value")), end_value=int(item.get("file_bpm_end_value")),
+                    bpm_type=item.get("file_bpm_type"))
+                for item in validated_data])
+            return AudioFiles.objects.bulk_create([
+                AudioFiles(file=file, genre=item.get("genre"), sub_genre=item.get("sub_genre"),
+                           instrument=item.get("instrument"), sub_instrument=item.get("sub_instrument"),
+                           mood=item.get("mood"), bpm=bpm, key=key, type=item.get("file_type"),
+                           source=item.get("file_source"))
+                for item, file, key, bpm in zip(validated_data, files, keys, bpms)])
+
+
 class AudioFileSerializer(serializers.Serializer):
     file = serializers.FileField(
+        required=False,
         error_messages={
             "required": "file is required",
             "blank": "file cannot be blank"
         }
     )
+    upload_id = serializers.UUIDField(
+        required=False,
+        error_messages={
+            "invalid": "invalid upload_id"
+        }
+    )
     file_name = serializers.CharField(
         error_messages={
             "required": "file_name is required",
@@ -292,7 +325,7 @@ class AudioFileSerializer(serializers.Serializer):
         with transaction.atomic():
             file = File.objects.create(file=file, file_name=file_name, file_size=file_size)
             file_key = Key.objects.create(key=file_key, key_scale=file_key_scale, key_type=file_key_type)
-            file_bpm = BPM.objects.create(start_value=file_bpm_start_value, end_value=file_bpm_end_value,
+            file_bpm = BPM.objects.create(start_value=int(file_bpm_start_value), end_value=int(file_bpm_end_value),
                                           bpm_type=file_bpm_type)
 
             audio_file = AudioFiles.objects.create(file=file, genre=file_genre, sub_genre=file_sub_genre,
@@ -301,6 +334,9 @@ class AudioFileSerializer(serializers.Serializer):
                                                    source=file_source)
             return audio_file
 
+    class Meta:
+        list_serializer_class = AudioFileListSerializer
+
 
 class DemoFileSerializer(AudioFileSerializer):
     class Meta:
@@ -350,11 +386,18 @@ class PackSubmissionsSerializer(serializers.Serializer):
     )
     pack_demo = DemoFileSerializer()
     pack_artwork_file = serializers.FileField(
+        required=False,
         error_messages={
             "required": "pack_artwork_file is required",
             "blank": "pack_artwork_file cannot be blank"
         }
     )
+    pack_artwork_upload_id = serializers.UUIDField(
+        required=False,
+        error_messages={
+            "invalid": "invalid pack_artwork_upload_id"
+        }
+    )
     pack_audio_files = serializers.ListField(
         error_messages={
             "required": "pack_audio_files is required",
@@ -381,6 +424,7 @@ class PackSubmissionsSerializer(serializers.Serializer):
         pack_description = attrs.get("pack_description")
         pack_demo = attrs.get("pack_demo")
         pack_artwork_file = attrs.get("pack_artwork_file")
+        pack_artwork_upload_id = attrs.get("pack_artwork_upload_id")
         pack_audio_files = attrs.get("pack_audio_files")
         pack_type = attrs.get("pack_type")
 
@@ -405,44 +449,56 @@ class PackSubmissionsSerializer(serializers.Serializer):
         if pack_demo is None:
             raise serializers.ValidationError("pack_demo is required")
 
-        if not pack_artwork_file:
-            raise serializers.ValidationError("pack_artwork_file is required")
+        if not pack_artwork_file and not pack_artwork_upload_id:
+            raise serializers.ValidationError("pack_artwork_file or pack_artwork_upload_id is required")
 
         if not InputValidator(pack_moods).has_valid_length(3, 3):
             raise serializers.ValidationError("pack_mood must be 3")
 
-        moods = Mood.objects.filter(name__in=pack_moods)
+        taxonomy = pack_taxonomy.lookup()
+        moods = [taxonomy.mood(name) for name in pack_moods]
 
-        if len(moods) < len(pack_moods):
+        if None in moods or len({mood.pk for mood in moods}) != len(moods):
             raise serializers.ValidationError("provide valid moods")
 
         # TODO Uncomment audio file limit
         # if not InputValidator(pack_audio_files).has_valid_length(min_length=100):
         #     raise serializers.ValidationError("audio_files must be at least 100")
 
-        genre = Genre.objects.prefetch_related("sub_genre").filter(name=pack_genre).first()
+        genre = taxonomy.genre(pack_genre)
 
         if genre is None:
             raise serializers.ValidationError("pack_genre does not exist")
 
-        sub_genre = genre.sub_genre.filter(name=pack_sub_genre).first()
+        sub_genre = taxonomy.sub_genre(genre, pack_sub_genre)
 
         if sub_genre is None:
             raise serializers.ValidationError("pack_sub_genre does not exist")
 
+        upload_ids = [item.get("upload_id") for item in [*pack_audio_files, pack_demo] if not item.get("file")]
+        if not pack_artwork_file:
+            upload_ids.append(pack_artwork_upload_id)
+
+        if len(upload_ids) != len(set(upload_ids)):
+            raise serializers.ValidationError("an upload can only be used once")
+
         with transaction.atomic():
-            audio_files_serializer = AudioFileSerializer(data=pack_audio_files, many=True)
-            audio_files_serializer.is_valid()
-            if audio_files_serializer.errors:
-                raise serializers.ValidationError(audio_files_serializer.errors)
-            audio_files = audio_files_serializer.save()
-
-            pack_demo_serializer = AudioFileSerializer(data=pack_demo)
-            pack_demo_serializer.is_valid()
-            if pack_demo_serializer.errors:
-                raise serializers.ValidationError(pack_demo_serializer.errors)
-            pack_demo = pack_demo_serializer.save()
+            uploads = UploadSession.attach(self.context.get("supplier"), upload_ids)
+
+            if uploads is None:
+                raise serializers.ValidationError("uploads must be finalized before they are submitted")
+
+            for item in [*pack_audio_files, pack_demo]:
+                if not item.get("file"):
+                    item["file"] = uploads[item.get("upload_id")].file.name
+
+            if not pack_artwork_file:
+                pack_artwork_file = uploads[pack_artwork_upload_id].file.name
+
+            audio_files = AudioFileSerializer(many=True).create([*pack_audio_files, pack_demo])
+            pack_demo = audio_files.pop()
 
+        attrs["pack_artwork_file"] = pack_artwork_file
         attrs["moods"] = moods
         attrs["genre"] = genre
         attrs["sub_genre"] = sub_genre
@@ -621,27 +677,28 @@ class RevisedAudioFileSerializer(serializers.Serializer):
         pack_type = attrs.get("pack_type")
         is_demo_file = attrs.get("is_demo_file")
 
-        mood = Mood.objects.filter(name=file_mood).first()
+        taxonomy = pack_taxonomy.lookup()
+        mood = taxonomy.mood(file_mood)
 
         if not mood:
             raise serializers.ValidationError("invalid mood")
 
-        instrument = Instrument.objects.prefetch_related("sub_instrument").filter(name=file_instrument).first()
+        instrument = taxonomy.instrument(file_instrument)
 
         if not instrument:
             raise serializers.ValidationError("invalid instrument")
 
-        genre = Genre.objects.prefetch_related("sub_genre").filter(name=file_genre).first()
+        genre = taxonomy.genre(file_genre)
 
         if not genre:
             raise serializers.ValidationError("invalid genre")
 
-        sub_instrument = instrument.sub_instrument.filter(name=file_sub_instrument).first()
+        sub_instrument = taxonomy.sub_instrument(instrument, file_sub_instrument)
 
         if not sub_instrument:
             raise serializers.ValidationError(f"invalid sub_instrument under {instrument.name}")
 
-        sub_genre = genre.sub_genre.filter(name=file_sub_genre).first()
+        sub_genre = taxonomy.sub_genre(genre, file_sub_genre)
 
         if not sub_genre:
             raise serializers.ValidationError(f"invalid sub_genre under {genre.name}")
@@ -667,7 +724,7 @@ class RevisedAudioFileSerializer(serializers.Serializer):
             if not file:
                 raise serializers.ValidationError("Pack demo file does not exist")
 
-        attrs = validate_audio_file_data(attrs)
+        attrs = validate_audio_file_data(attrs, taxonomy)
 
         attrs['submitted_file'] = file
         return attrs
@@ -703,10 +760,10 @@ class RevisedAudioFileSerializer(serializers.Serializer):
 
             if submitted_file.bpm.bpm_type != file_bpm_type:
                 submitted_file.bpm.bpm_type = file_bpm_type
-            if submitted_file.bpm.start_value != file_bpm_start_value:
-                submitted_file.bpm.start_value = file_bpm_start_value
-            if submitted_file.bpm.end_value != file_bpm_end_value:
-                submitted_file.bpm.end_value = file_bpm_end_value
+            if submitted_file.bpm.start_value != int(file_bpm_start_value):
+                submitted_file.bpm.start_value = int(file_bpm_start_value)
+            if submitted_file.bpm.end_value != int(file_bpm_end_value):
+                submitted_file.bpm.end_value = int(file_bpm_end_value)
             submitted_file.bpm.save()
 
             if submitted_file.file.file != file:
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from Product_Management.models import PackSubmissions, AudioFiles
+from Utilities.Enums import FileStatus
 
 
 class AudioFileSerializer(serializers.Serializer):
@@ -100,3 +101,33 @@ class ViewPacksSerializer(serializers.Serializer):
             "pack_artwork", "pack_audio_files", "pack_demo_file", "pack_demo_file_name", "pack_demo_file_size",
             "pack_supplier", "pack_type", "status", "approval_person"
         )
+
+
+class ReviewQueuePacksSerializer(serializers.Serializer):
+    request_id = serializers.IntegerField(source="id", read_only=True)
+    pack_id = serializers.IntegerField(source="pack.id", read_only=True)
+    pack_title = serializers.CharField(source="pack.title")
+    pack_type = serializers.CharField()
+    pack_supplier = serializers.SerializerMethodField(method_name="get_pack_supplier", source="supplier")
+    pack_files = serializers.SerializerMethodField(method_name="get_pack_files")
+    status = serializers.CharField()
+    created_at = serializers.DateTimeField()
+
+    @staticmethod
+    def get_pack_supplier(obj):
+        supplier = obj.supplier
+        if supplier is None:
+            return None
+        details = supplier.get_user_details()
+        if supplier.is_admin:
+            return {'id': supplier.id, 'name': details.name}
+        return {'id': supplier.id, 'name': details.first_name}
+
+    @staticmethod
+    def get_pack_files(obj):
+        return {file_status.lower(): getattr(obj, f"files_{file_status.lower()}") for file_status in FileStatus.list()}
+
+    class Meta:
+        model = PackSubmissions
+        fields = ("request_id", "pack_id", "pack_title", "pack_type", "pack_supplier", "pack_files", "status",
+                  "created_at")
@@ -6,4 +6,4 @@ from Product_Management.Serializers.MoodSerializer import MoodsDropdownSerialize
 from Product_Management.Serializers.PackSubmissionsSerializer import PackSubmissionsSerializer, \
     RevisedAudioFileSerializer
 from Product_Management.Serializers.PluginSerializer import PluginDropdownSerializer, PluginSerializer
-from Product_Management.Serializers.ViewPacksSerializer import ViewPacksSerializer
+from Product_Management.Serializers.ViewPacksSerializer import ViewPacksSerializer, ReviewQueuePacksSerializer
@@ -7,6 +7,7 @@ from rest_framework.views import APIView
 
 from Product_Management.Serializers import GenreSerializer, SubGenreSerializer, CreateSubGenreSerializer, \
     GenreDropDownSerializer
+from Product_Management.caches import pack_taxonomy
 from Product_Management.models import Genre
 from Utilities import extract_error_messages
 from Utilities.Permissions import AdminPermissions, SupplierPermissions
@@ -19,9 +20,9 @@ class GenresDropdownView(APIView):
     @swagger_auto_schema(responses={200: GenreDropDownSerializer(many=True)})
     def get(request):
         """This function return the genres dropdown"""
-        genre = Genre.objects.prefetch_related("sub_genre").all()
-        genre_serializer = GenreDropDownSerializer(genre, many=True)
-        return Response({'detail': genre_serializer.data}, status=status.HTTP_200_OK)
+        genres = pack_taxonomy.dropdown("genres", lambda: GenreDropDownSerializer(
+            Genre.objects.prefetch_related("sub_genre").all(), many=True).data)
+        return Response({'detail': genres}, status=status.HTTP_200_OK)
 
 
 class GenresView(APIView):
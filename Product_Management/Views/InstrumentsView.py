@@ -7,6 +7,7 @@ from rest_framework.views import APIView
 
 from Product_Management.Serializers import InstrumentSerializer, SubInstrumentSerializer, \
     CreateSubInstrumentSerializer, InstrumentDropdownSerializer
+from Product_Management.caches import pack_taxonomy
 from Product_Management.models import Instrument
 from Utilities import extract_error_messages
 from Utilities.Permissions import AdminPermissions, SupplierPermissions
@@ -19,9 +20,9 @@ class InstrumentsDropdownView(APIView):
     @swagger_auto_schema(responses={200: InstrumentDropdownSerializer(many=True)})
     def get(request):
         """This function return the instrument dropdown list."""
-        instrument = Instrument.objects.prefetch_related("sub_instrument").all()
-        instrument_serializer = InstrumentDropdownSerializer(instrument, many=True)
-        return Response({'detail': instrument_serializer.data}, status=status.HTTP_200_OK)
+        instruments = pack_taxonomy.dropdown("instruments", lambda: InstrumentDropdownSerializer(
+            Instrument.objects.prefetch_related("sub_instrument").all(), many=True).data)
+        return Response({'detail': instruments}, status=status.HTTP_200_OK)
 
 
 class InstrumentsView(APIView):
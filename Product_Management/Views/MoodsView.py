@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from Product_Management.Serializers import MoodSerializer, MoodsDropdownSerializer
+from Product_Management.caches import pack_taxonomy
 from Product_Management.models import Mood
 from Utilities import extract_error_messages
 from Utilities.Permissions import AdminPermissions, SupplierPermissions
@@ -18,9 +19,9 @@ class MoodsDropdownView(APIView):
     @swagger_auto_schema(responses={200: MoodsDropdownSerializer(many=True)})
     def get(request):
         """This function return the moodsDropdown list."""
-        moods = Mood.objects.all()
-        moods_serializer = MoodsDropdownSerializer(moods, many=True)
-        return Response({'detail': moods_serializer.data}, status=status.HTTP_200_OK)
+        moods = pack_taxonomy.dropdown("moods", lambda: MoodsDropdownSerializer(
+            Mood.objects.all(), many=True).data)
+        return Response({'detail': moods}, status=status.HTTP_200_OK)
 
 
 class MoodsView(APIView):
@@ -6,8 +6,11 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from Product_Management.Serializers import PackSubmissionsSerializer, ViewPacksSerializer, RevisedAudioFileSerializer
+from Product_Management.Serializers import PackSubmissionsSerializer, ViewPacksSerializer, RevisedAudioFileSerializer, \
+    ReviewQueuePacksSerializer
 from Product_Management.models import PackSubmissions
+from User_Management.models import ReviewerLoad
+from Utilities.CursorPagination import CursorPaginator
 from Utilities.Enums import PackTypes, SubmissionStatus, FileStatus, Boolean
 from Utilities.Permissions import AdminPermissions, StaffPermissions, SupplierPermissions
 
@@ -21,8 +24,9 @@ class PackSubmissionsView(APIView):
     def post(request):
         """This function handles pack-submissions"""
         try:
+            data = request.data
             with transaction.atomic():
-                packs_submissions_serializer = PackSubmissionsSerializer(data=request.data,
+                packs_submissions_serializer = PackSubmissionsSerializer(data=data,
                                                                          context={"supplier": request.user})
                 packs_submissions_serializer.is_valid()
 
@@ -60,7 +64,7 @@ class ViewPacksView(APIView):
                 queryset['pack_type'] = pack_type
             if request.user.is_supplier or request.user.is_admin:
                 queryset['supplier'] = request.user
-            pack = PackSubmissions.objects.select_related("pack", "supplier").filter(**queryset)
+            pack = PackSubmissions.with_review_details().filter(**queryset)
             view_packs_serializer = ViewPacksSerializer(pack, many=True)
             return Response({"detail": view_packs_serializer.data}, status=status.HTTP_200_OK)
         return Response({"detail": "invalid pack type"}, status=status.HTTP_404_NOT_FOUND)
@@ -358,10 +362,10 @@ class ViewSubmittedPacksView(APIView):
         if pack_type in PackTypes.list():
             if pack_type:
                 queryset['pack_type'] = pack_type
-            pack = PackSubmissions.objects.select_related("pack", "supplier"). \
+            pack = PackSubmissions.with_review_details(). \
                 filter(**queryset, status=SubmissionStatus.SUBMITTED)
         else:
-            pack = PackSubmissions.objects.select_related("pack", "supplier"). \
+            pack = PackSubmissions.with_review_details(). \
                 filter(**queryset, status=SubmissionStatus.SUBMITTED)
         view_packs_serializer = ViewPacksSerializer(pack, many=True)
         return Response({"detail": view_packs_serializer.data}, status=status.HTTP_200_OK)
@@ -449,3 +453,35 @@ class RejectPackView(APIView):
                 return Response({"detail": "pack rejected successfully!"}, status=status.HTTP_200_OK)
             return Response({"detail": "pack not found!"}, status=status.HTTP_404_NOT_FOUND)
         return Response({"detail": "invalid pack type"}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class ReviewQueuePacksView(APIView):
+    permission_classes = [IsAuthenticated, StaffPermissions]
+
+    @staticmethod
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter("pack_type", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter("status", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter("cursor", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+            openapi.Parameter("page_size", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
+        responses={200: ReviewQueuePacksSerializer(many=True)})
+    def get(request):
+        """This function returns the open pack submissions assigned to the staff member, oldest first"""
+        pack_type = request.GET.get("pack_type")
+        submission_status = request.GET.get("status")
+        if submission_status and submission_status not in ReviewerLoad.OPEN_STATUSES:
+            return Response({"detail": "invalid status."}, status=status.HTTP_400_BAD_REQUEST)
+        if pack_type and pack_type not in PackTypes.list():
+            return Response({"detail": "invalid pack type."}, status=status.HTTP_400_BAD_REQUEST)
+        submissions = PackSubmissions.review_queue(request.user, [submission_status] if submission_status else None)
+        if pack_type:
+            submissions = submissions.filter(pack_type=pack_type)
+        try:
+            submissions, next_cursor = CursorPaginator.from_request(request, submissions, ascending=True).get_page()
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        review_queue_serializer = ReviewQueuePacksSerializer(submissions, many=True)
+        return Response({"detail": review_queue_serializer.data, "next_cursor": next_cursor},
+                        status=status.HTTP_200_OK)
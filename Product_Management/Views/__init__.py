@@ -3,5 +3,5 @@ from Product_Management.Views.InstrumentsView import SubInstrumentsView, Instrum
 from Product_Management.Views.MoodsView import MoodsDropdownView, MoodsView
 from Product_Management.Views.PacksViews import ViewPacksView, PackSubmissionsView, SendRevisionPacksView, \
     ResolveRevisionPacksView, ApproveRevisionPacksView, RejectRevisionPacksView, SubmitForReviewView, \
-    ApprovePackView, RejectPackView, ViewSubmittedPacksView
+    ApprovePackView, RejectPackView, ViewSubmittedPacksView, ReviewQueuePacksView
 from Product_Management.Views.PluginsView import PluginsDropdownView, PluginsView
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ProductManagementConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "Product_Management"
+
+    def ready(self):
+        from Product_Management import signals  # noqa: F401
@@ -0,0 +1,24 @@
+from Product_Management.models import Genre, SubGenre, Instrument, SubInstrument, Mood, Likes, FileDownloads, \
+    CollectionFiles
+from Utilities.MemberLibrary import MemberLibraryCache
+from Utilities.TaxonomyCache import TaxonomyCache
+
+pack_taxonomy = TaxonomyCache("packs", Genre, SubGenre, Instrument, SubInstrument, Mood)
+
+
+def liked_files(member_id):
+    return Likes.objects.filter(member_id=member_id, file__isnull=False).values_list("file_id", flat=True)
+
+
+def downloaded_files(member_id):
+    return FileDownloads.objects.filter(download__member_id=member_id, audio_file__isnull=False). \
+        values_list("audio_file_id", flat=True)
+
+
+def collected_files(member_id):
+    return CollectionFiles.objects.filter(collection__member_id=member_id, audio_file__isnull=False). \
+        values_list("audio_file_id", flat=True)
+
+
+pack_library = MemberLibraryCache("packs", is_liked=liked_files, is_downloaded=downloaded_files,
+                                  in_collection=collected_files)
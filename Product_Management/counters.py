@@ -0,0 +1,18 @@
+from Product_Management.models import Pack, AudioFiles, PackCatalogCard
+from Utilities.Counters import CounterBuffer
+
+
+def refresh_card_counts(pack_ids):
+    for pack in Pack.objects.filter(pk__in=pack_ids):
+        PackCatalogCard.refresh_counts(pack)
+
+
+pack_counters = CounterBuffer("packs", Pack, on_flush=lambda ids, groups: refresh_card_counts(ids))
+pack_file_counters = CounterBuffer("pack-files", AudioFiles,
+                                   on_flush=lambda ids, groups: refresh_card_counts(groups))
+
+
+def merge_card_counts(cards):
+    """This function adds the downloads and likes not flushed yet to catalog cards annotated with pack_id"""
+    pack_counters.merge(cards, "downloads_count", key=lambda card: card.pack_id)
+    return pack_file_counters.merge(cards, "likes_count", key=lambda card: card.pack_id, grouped=True)
@@ -0,0 +1,32 @@
+from Product_Management.models import AudioFiles, PackSubmissions
+from Utilities.Enums import SubmissionStatus
+from Utilities.FacetIndex import FacetIndex
+from Utilities.SearchIndex import TextSearchIndex
+
+
+def approved_pack_files():
+    return AudioFiles.objects.filter(packs__submissions__status=SubmissionStatus.APPROVED.value)
+
+
+pack_files_facets = FacetIndex("pack-files", approved_pack_files, {
+    "genre": "genre_id",
+    "sub_genre": "sub_genre_id",
+    "instrument": "instrument_id",
+    "sub_instrument": "sub_instrument_id",
+    "mood": "mood_id",
+    "key": "key__key",
+    "scale": "key__key_scale",
+    "source": "source",
+    "type": "type",
+})
+
+
+def approved_pack_submissions():
+    return PackSubmissions.objects.filter(status=SubmissionStatus.APPROVED.value, pack__isnull=False)
+
+
+packs_text_search = TextSearchIndex("Product_Management_search", approved_pack_submissions, {
+    "title": "pack__title",
+    "description": "pack__description",
+    "type": "pack_type",
+})
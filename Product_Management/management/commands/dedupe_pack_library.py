@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from Product_Management.counters import refresh_card_counts
+from Product_Management.models import AudioFiles, CollectionFiles, Downloads, FileDownloads, Likes
+from Utilities.Dedupe import delete_duplicates, recount
+
+
+class Command(BaseCommand):
+    help = "Deletes duplicate pack likes, downloads and collection files, keeping the oldest row of each"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="only report the duplicate groups")
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        with transaction.atomic():
+            downloads = delete_duplicates(Downloads, ["member", "pack"],
+                                          children=[(FileDownloads, "download", "audio_file")], dry_run=dry_run)
+            likes = delete_duplicates(Likes, ["member", "file", "pack"], dry_run=dry_run)
+            collection_files = delete_duplicates(CollectionFiles, ["collection", "audio_file", "pack"],
+                                                 dry_run=dry_run)
+            if not dry_run:
+                recount(AudioFiles, [like["file"] for like in likes], "likes_count", Likes, "file")
+                refresh_card_counts({like["pack"] for like in likes})
+
+        prefix = "found" if dry_run else "deduped"
+        self.stdout.write(f"{prefix} {len(downloads)} downloads, {len(likes)} likes and "
+                          f"{len(collection_files)} collection files")
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.1 on 2026-10-18 18:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Product_Management', '0002_likes_file'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='packsubmissions',
+            index=models.Index(fields=['pack_type', 'status', 'created_at', 'id'], name='pack_sub_type_status_idx'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 4.2.1 on 2026-10-18 18:44
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def artist_name(supplier):
+    if supplier is None:
+        return ""
+    if supplier.usertype == "Admin" and hasattr(supplier, "adminOrStaff_details"):
+        return supplier.adminOrStaff_details.name
+    if supplier.usertype == "Supplier" and hasattr(supplier, "supplier_details"):
+        return supplier.supplier_details.artist.name
+    return ""
+
+
+def build_catalog_cards(apps, schema_editor):
+    PackSubmissions = apps.get_model("Product_Management", "PackSubmissions")
+    PackCatalogCard = apps.get_model("Product_Management", "PackCatalogCard")
+
+    submissions = PackSubmissions.objects.select_related("pack", "pack__genre", "pack__sub_genre", "supplier"). \
+        prefetch_related("pack__mood").filter(status="Approved", pack__isnull=False)
+    cards = []
+    for submission in submissions:
+        pack = submission.pack
+        counts = pack.audio_files.aggregate(files_count=models.Count("id"), likes_count=models.Sum("likes_count"))
+        cards.append(PackCatalogCard(
+            submission=submission,
+            pack_type=submission.pack_type,
+            title=pack.title,
+            artist=artist_name(submission.supplier),
+            artwork=pack.artwork.name if pack.artwork else None,
+            genre=pack.genre.name if pack.genre else "",
+            sub_genre=pack.sub_genre.name if pack.sub_genre else "",
+            moods=[mood.name for mood in pack.mood.all()],
+            files_count=counts["files_count"],
+            likes_count=counts["likes_count"] or 0,
+            downloads_count=pack.downloads_count,
+        ))
+    PackCatalogCard.objects.bulk_create(cards)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Product_Management', '0003_submissions_keyset_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PackCatalogCard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_modified', models.DateTimeField(auto_now=True)),
+                ('pack_type', models.CharField(choices=[('Sample', 'Sample'), ('MIDI', 'Midi'), ('Preset', 'Preset')], default='Sample', max_length=25)),
+                ('title', models.CharField(max_length=255)),
+                ('artist', models.CharField(blank=True, default='', max_length=255)),
+                ('artwork', models.ImageField(blank=True, default=None, max_length=1000, null=True, upload_to='artworks/')),
+                ('genre', models.CharField(blank=True, default='', max_length=255)),
+                ('sub_genre', models.CharField(blank=True, default='', max_length=255)),
+                ('moods', models.JSONField(blank=True, default=list)),
+                ('files_count', models.IntegerField(default=0)),
+                ('likes_count', models.IntegerField(default=0)),
+                ('downloads_count', models.IntegerField(default=0)),
+                ('submission', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='catalog_card', to='Product_Management.packsubmissions')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['pack_type', 'created_at', 'id'], name='pack_card_type_idx')],
+            },
+        ),
+        migrations.RunPython(build_catalog_cards, migrations.RunPython.noop),
+    ]
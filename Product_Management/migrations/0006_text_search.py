@@ -0,0 +1,41 @@
+# Generated by Django 4.2.1 on 2026-10-18 18:50
+
+from django.db import migrations, OperationalError
+
+SEARCH_TABLE = "Product_Management_search"
+
+
+def create_search_table(apps, schema_editor):
+    """Creates the FTS5 table of the text search and fills it, skipped when FTS5 is not available"""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    try:
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{SEARCH_TABLE}" USING fts5('
+            f'title, description, type UNINDEXED, tokenize="unicode61 remove_diacritics 2", prefix="2 3")'
+        )
+    except OperationalError:
+        return
+    PackSubmissions = apps.get_model("Product_Management", "PackSubmissions")
+    rows = PackSubmissions.objects.filter(status="Approved", pack__isnull=False). \
+        values_list("id", "pack__title", "pack__description", "pack_type")
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany(
+            f'INSERT INTO "{SEARCH_TABLE}" (rowid, title, description, type) VALUES (%s, %s, %s, %s)',
+            [(id_, title or "", description or "", type_) for id_, title, description, type_ in rows])
+
+
+def drop_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(f'DROP TABLE IF EXISTS "{SEARCH_TABLE}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Product_Management', '0005_bpm_integer_range'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.1 on 2026-10-18 19:01
+
+from django.db import migrations, models
+
+
+def delete_duplicate_file_downloads(apps, schema_editor):
+    """Keeps the oldest row of every (download, audio_file) pair so the unique constraint can be added"""
+    FileDownloads = apps.get_model("Product_Management", "FileDownloads")
+    duplicates = FileDownloads.objects.filter(download__isnull=False, audio_file__isnull=False). \
+        values("download", "audio_file").annotate(keep=models.Min("id"), rows=models.Count("id")).filter(rows__gt=1)
+    for duplicate in duplicates:
+        FileDownloads.objects.filter(download=duplicate["download"], audio_file=duplicate["audio_file"]). \
+            exclude(id=duplicate["keep"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Product_Management', '0006_text_search'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_file_downloads, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='filedownloads',
+            constraint=models.UniqueConstraint(fields=('download', 'audio_file'), name='unique_file_download'),
+        ),
+    ]
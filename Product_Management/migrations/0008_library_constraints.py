@@ -0,0 +1,91 @@
+# Generated by Django 4.2.1 on 2026-10-18 19:03
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+# copied from Utilities.Dedupe so this migration keeps replaying the same way when that module changes
+def duplicate_groups(model, fields):
+    """This function returns the values of every group of rows sharing the fields, with the id of its oldest row"""
+    return model.objects.filter(**{f"{field}__isnull": False for field in fields}). \
+        values(*fields).annotate(keep=Min("id"), rows=Count("id")).filter(rows__gt=1).order_by()
+
+
+def delete_duplicates(model, fields, children=(), dry_run=False):
+    """This function keeps the oldest row of every duplicate group and deletes the others
+
+    ``children`` lists the (model, foreign key, unique field) of rows pointing at the deleted rows. They
+    are moved to the kept row, unless it already has a child with the same unique field value. Returns
+    the duplicate groups that were found.
+    """
+    groups = list(duplicate_groups(model, fields))
+    if dry_run:
+        return groups
+
+    for group in groups:
+        extra_ids = list(model.objects.filter(**{field: group[field] for field in fields}).
+                         exclude(id=group["keep"]).values_list("id", flat=True))
+        for child_model, foreign_key, unique_field in children:
+            for extra_id in extra_ids:
+                kept_values = child_model.objects.filter(**{foreign_key: group["keep"]}). \
+                    values_list(unique_field, flat=True)
+                moving = child_model.objects.filter(**{foreign_key: extra_id})
+                moving.filter(**{f"{unique_field}__in": kept_values}).delete()
+                moving.update(**{foreign_key: group["keep"]})
+        model.objects.filter(id__in=extra_ids).delete()
+    return groups
+
+
+def recount(model, ids, field, related_model, related_field):
+    """This function resets the counter field of the given rows to the number of related rows"""
+    for id_ in set(ids):
+        model.objects.filter(id=id_).update(**{field: related_model.objects.filter(**{related_field: id_}).count()})
+
+
+def delete_duplicate_library_rows(apps, schema_editor):
+    """Keeps the oldest like, download and collection file of every member so the unique constraints can be added"""
+    AudioFiles = apps.get_model("Product_Management", "AudioFiles")
+    Downloads = apps.get_model("Product_Management", "Downloads")
+    FileDownloads = apps.get_model("Product_Management", "FileDownloads")
+    Likes = apps.get_model("Product_Management", "Likes")
+    CollectionFiles = apps.get_model("Product_Management", "CollectionFiles")
+
+    delete_duplicates(Downloads, ["member", "pack"], children=[(FileDownloads, "download", "audio_file")])
+    likes = delete_duplicates(Likes, ["member", "file", "pack"])
+    recount(AudioFiles, [like["file"] for like in likes], "likes_count", Likes, "file")
+    delete_duplicates(CollectionFiles, ["collection", "audio_file", "pack"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Product_Management', '0007_unique_file_download'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_library_rows, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='collectionfiles',
+            index=models.Index(fields=['collection', '-created_at'], name='collection_file_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='downloads',
+            index=models.Index(fields=['member', '-created_at'], name='download_member_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='likes',
+            index=models.Index(fields=['member', '-created_at'], name='like_member_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='collectionfiles',
+            constraint=models.UniqueConstraint(fields=('collection', 'audio_file', 'pack'), name='unique_collection_file'),
+        ),
+        migrations.AddConstraint(
+            model_name='downloads',
+            constraint=models.UniqueConstraint(fields=('member', 'pack'), name='unique_download'),
+        ),
+        migrations.AddConstraint(
+            model_name='likes',
+            constraint=models.UniqueConstraint(fields=('member', 'file', 'pack'), name='unique_like'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.1 on 2026-10-18 19:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Product_Management', '0008_library_constraints'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='packsubmissions',
+            index=models.Index(fields=['approval_person', 'status', 'created_at', 'id'], name='pack_sub_review_queue_idx'),
+        ),
+    ]
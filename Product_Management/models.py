@@ -1,6 +1,8 @@
 from django.db import models
+from django.db.models import Count, Q, Prefetch
 
-from User_Management.models import User, DateTimeModel
+from User_Management.models import User, DateTimeModel, ReviewerLoad
+from Utilities.AudioFilesQuerySet import AudioFilesQuerySet
 from Utilities.Enums import TypeTypes
 from Utilities.Enums.BPMTypes import BPMTypes
 from Utilities.Enums.FileStatus import FileStatus
@@ -44,10 +46,15 @@ class SubInstrument(DateTimeModel):
 
 
 class BPM(DateTimeModel):
-    start_value = models.CharField(max_length=10)
-    end_value = models.CharField(max_length=10)
+    start_value = models.PositiveIntegerField()
+    end_value = models.PositiveIntegerField()
     bpm_type = models.CharField(max_length=25, choices=BPMTypes.choices)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["start_value", "end_value"], name="bpm_range_idx"),
+        ]
+
 
 class Key(DateTimeModel):
     key = models.CharField(max_length=10, choices=SharpKeys.choices + FlatKeys.choices)
@@ -127,6 +134,8 @@ class AudioFiles(DateTimeModel):
     message = models.CharField(max_length=1000, default=None, null=True, blank=True)
     status = models.CharField(max_length=25, choices=FileStatus.choices, default=FileStatus.UPLOADED.value)
 
+    objects = AudioFilesQuerySet.as_manager()
+
 
 class Pack(DateTimeModel):
     title = models.CharField(max_length=255)
@@ -192,6 +201,52 @@ class PackSubmissions(DateTimeModel):
     pack_type = models.CharField(max_length=25, choices=PackTypes.choices, default=PackTypes.SAMPLE.value)
     status = models.CharField(max_length=25, choices=SubmissionStatus.choices, default=SubmissionStatus.UPLOADED.value)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["pack_type", "status", "created_at", "id"], name="pack_sub_type_status_idx"),
+            models.Index(fields=["approval_person", "status", "created_at", "id"], name="pack_sub_review_queue_idx"),
+        ]
+
+    @classmethod
+    def review_queue(cls, staff, statuses=None):
+        """This function returns the open submissions assigned to the staff member with their file status counts
+
+        The counts are aggregated in the same query as the rows, one ``files_<status>`` column per file status.
+        """
+        files = {f"files_{file_status.lower()}": Count("pack__audio_files",
+                                                           filter=Q(pack__audio_files__status=file_status))
+                 for file_status in FileStatus.list()}
+        return cls.objects.select_related("pack", "supplier", "supplier__supplier_details",
+                                          "supplier__adminOrStaff_details"). \
+            filter(approval_person=staff, status__in=statuses or ReviewerLoad.OPEN_STATUSES).annotate(**files)
+
+    @classmethod
+    def with_review_details(cls):
+        """This function returns the submissions with everything the submission lists show
+
+        The pack, its demo file, the supplier and the approval person are joined, the moods and the audio files
+        prefetched, so a list runs the same number of queries whatever the number of submissions and files.
+        """
+        return cls.objects.select_related("pack", "pack__genre", "pack__sub_genre", "pack__demo_file",
+                                          *(f"pack__demo_file__{field}" for field in AudioFilesQuerySet.detail_fields),
+                                          "supplier", "supplier__supplier_details", "supplier__adminOrStaff_details",
+                                          "approval_person", "approval_person__adminOrStaff_details"). \
+            prefetch_related("pack__mood", Prefetch("pack__audio_files", queryset=AudioFiles.objects.with_details()))
+
+    @classmethod
+    def load_detail(cls, pk, pack_type):
+        """This function loads an approved submission with everything its detail page shows
+
+        The submission, pack and supplier are joined and the moods prefetched. The audio files are paged
+        separately, see ``Utilities.AudioFilesPage``.
+        """
+        return cls.objects.select_related("pack", "pack__genre", "pack__sub_genre", "supplier",
+                                          "supplier__supplier_details", "supplier__supplier_details__artist",
+                                          "supplier__adminOrStaff_details"). \
+            prefetch_related("pack__mood"). \
+            filter(pk=pk, pack_type=pack_type, status=SubmissionStatus.APPROVED.value). \
+            annotate(files_count=Count("pack__audio_files")).first()
+
 
 class Downloads(DateTimeModel):
     pack = models.ForeignKey(
@@ -209,6 +264,14 @@ class Downloads(DateTimeModel):
         related_name="downloads",
     )
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["member", "pack"], name="unique_download"),
+        ]
+        indexes = [
+            models.Index(fields=["member", "-created_at"], name="download_member_idx"),
+        ]
+
 
 class FileDownloads(DateTimeModel):
     download = models.ForeignKey(
@@ -226,6 +289,11 @@ class FileDownloads(DateTimeModel):
         related_name="downloads",
     )
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["download", "audio_file"], name="unique_file_download"),
+        ]
+
 
 class Likes(DateTimeModel):
     pack = models.ForeignKey(
@@ -250,6 +318,14 @@ class Likes(DateTimeModel):
         related_name="likes",
     )
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["member", "file", "pack"], name="unique_like"),
+        ]
+        indexes = [
+            models.Index(fields=["member", "-created_at"], name="like_member_idx"),
+        ]
+
 
 class Collections(DateTimeModel):
     name = models.CharField(max_length=255)
@@ -285,3 +361,78 @@ class CollectionFiles(DateTimeModel):
         null=True,
         related_name="collection_files",
     )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["collection", "audio_file", "pack"], name="unique_collection_file"),
+        ]
+        indexes = [
+            models.Index(fields=["collection", "-created_at"], name="collection_file_idx"),
+        ]
+
+
+class PackCatalogCard(DateTimeModel):
+    """Denormalized discover-page card of an approved pack submission"""
+
+    submission = models.OneToOneField(
+        PackSubmissions,
+        on_delete=models.CASCADE,
+        related_name="catalog_card",
+    )
+    pack_type = models.CharField(max_length=25, choices=PackTypes.choices, default=PackTypes.SAMPLE.value)
+    title = models.CharField(max_length=255)
+    artist = models.CharField(max_length=255, default="", blank=True)
+    artwork = models.ImageField(
+        upload_to="artworks/", max_length=1000, default=None, null=True, blank=True
+    )
+    genre = models.CharField(max_length=255, default="", blank=True)
+    sub_genre = models.CharField(max_length=255, default="", blank=True)
+    moods = models.JSONField(default=list, blank=True)
+    files_count = models.IntegerField(default=0)
+    likes_count = models.IntegerField(default=0)
+    downloads_count = models.IntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["pack_type", "created_at", "id"], name="pack_card_type_idx"),
+        ]
+
+    @classmethod
+    def refresh(cls, submission):
+        """This function rebuilds the card of an approved submission and drops it otherwise"""
+        if submission.status != SubmissionStatus.APPROVED.value or submission.pack is None:
+            cls.objects.filter(submission=submission).delete()
+            return None
+
+        pack = submission.pack
+        counts = pack.audio_files.aggregate(files_count=models.Count("id"),
+                                            likes_count=models.Sum("likes_count"))
+        card, _ = cls.objects.update_or_create(submission=submission, defaults={
+            "pack_type": submission.pack_type,
+            "title": pack.title,
+            "artist": submission.supplier.get_artist_name() if submission.supplier else "",
+            "artwork": pack.artwork.name if pack.artwork else None,
+            "genre": pack.genre.name if pack.genre else "",
+            "sub_genre": pack.sub_genre.name if pack.sub_genre else "",
+            "moods": [mood.name for mood in pack.mood.all()],
+            "files_count": counts["files_count"],
+            "likes_count": counts["likes_count"] or 0,
+            "downloads_count": pack.downloads_count,
+        })
+        return card
+
+    @classmethod
+    def refresh_pack(cls, pack):
+        """This function rebuilds the cards of every approved submission of a pack"""
+        for submission in pack.submissions.select_related("supplier").filter(
+                status=SubmissionStatus.APPROVED.value):
+            cls.refresh(submission)
+
+    @classmethod
+    def refresh_counts(cls, pack):
+        """This function recomputes only the counters of the cards of a pack"""
+        counts = pack.audio_files.aggregate(files_count=models.Count("id"),
+                                            likes_count=models.Sum("likes_count"))
+        cls.objects.filter(submission__pack=pack).update(files_count=counts["files_count"],
+                                                         likes_count=counts["likes_count"] or 0,
+                                                         downloads_count=pack.downloads_count)
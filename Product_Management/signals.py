@@ -0,0 +1,171 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from Product_Management.caches import pack_taxonomy
+from Product_Management.indexes import pack_files_facets, packs_text_search
+from Product_Management.models import Pack, PackSubmissions, AudioFiles, PackCatalogCard, Genre, \
+    SubGenre, Mood, BPM, Key, Instrument, SubInstrument
+from User_Management.caches import reviewer_pool
+from User_Management.models import Artist, AdminOrStaff
+from Utilities.Enums import SubmissionStatus
+
+CARD_SUBMISSION_FIELDS = {"status", "pack", "supplier", "pack_type"}
+
+
+@receiver(post_save, sender=PackSubmissions)
+def refresh_submission_card(sender, instance, created, update_fields=None, **kwargs):
+    if created and instance.status != SubmissionStatus.APPROVED.value:
+        return
+    if update_fields is None or CARD_SUBMISSION_FIELDS & set(update_fields):
+        PackCatalogCard.refresh(instance)
+
+
+@receiver(post_save, sender=Pack)
+def refresh_pack_cards(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        return
+    if update_fields is not None and set(update_fields) == {"downloads_count"}:
+        PackCatalogCard.refresh_counts(instance)
+    else:
+        PackCatalogCard.refresh_pack(instance)
+
+
+@receiver(m2m_changed, sender=Pack.mood.through)
+@receiver(m2m_changed, sender=Pack.audio_files.through)
+def refresh_pack_cards_relations(sender, instance, action, reverse, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        for pack in Pack.objects.filter(pk__in=kwargs.get("pk_set") or []):
+            PackCatalogCard.refresh_pack(pack)
+    else:
+        PackCatalogCard.refresh_pack(instance)
+
+
+@receiver(post_save, sender=AudioFiles)
+def refresh_audio_file_counts(sender, instance, created, **kwargs):
+    if created:
+        return
+    for pack in instance.packs.all():
+        PackCatalogCard.refresh_counts(pack)
+
+
+@receiver(post_save, sender=Genre)
+def rename_card_genre(sender, instance, created, **kwargs):
+    if not created:
+        PackCatalogCard.objects.filter(submission__pack__genre=instance).update(genre=instance.name)
+
+
+@receiver(post_save, sender=SubGenre)
+def rename_card_sub_genre(sender, instance, created, **kwargs):
+    if not created:
+        PackCatalogCard.objects.filter(submission__pack__sub_genre=instance).update(sub_genre=instance.name)
+
+
+@receiver(post_save, sender=Mood)
+def rename_card_mood(sender, instance, created, **kwargs):
+    if not created:
+        for pack in instance.packs.all():
+            PackCatalogCard.refresh_pack(pack)
+
+
+@receiver(post_save, sender=Artist)
+def rename_card_artist(sender, instance, created, **kwargs):
+    if not created:
+        PackCatalogCard.objects.filter(submission__supplier__supplier_details__artist=instance). \
+            update(artist=instance.name)
+
+
+@receiver(post_save, sender=AdminOrStaff)
+def rename_card_admin(sender, instance, created, **kwargs):
+    if not created:
+        PackCatalogCard.objects.filter(submission__supplier=instance.admin_user).update(artist=instance.name)
+
+
+@receiver(post_save, sender=PackSubmissions)
+def index_submission_files(sender, instance, created, update_fields=None, **kwargs):
+    if created and instance.status != SubmissionStatus.APPROVED.value:
+        return
+    if instance.pack_id and (update_fields is None or {"status", "pack"} & set(update_fields)):
+        pack_files_facets.refresh_on_commit(instance.pack.audio_files.values_list("id", flat=True))
+
+
+@receiver(post_save, sender=AudioFiles)
+def index_audio_file(sender, instance, created, **kwargs):
+    if not created:
+        pack_files_facets.refresh_on_commit([instance.id])
+
+
+@receiver(post_delete, sender=AudioFiles)
+def unindex_audio_file(sender, instance, **kwargs):
+    pack_files_facets.refresh_on_commit([instance.id])
+
+
+@receiver(m2m_changed, sender=Pack.audio_files.through)
+def index_pack_files(sender, instance, action, reverse, pk_set=None, **kwargs):
+    if action == "post_clear":
+        transaction.on_commit(pack_files_facets.invalidate)
+    elif action in ("post_add", "post_remove"):
+        pack_files_facets.refresh_on_commit([instance.id] if reverse else pk_set)
+
+
+@receiver(post_save, sender=BPM)
+@receiver(post_save, sender=Key)
+def index_audio_file_metadata(sender, instance, created, **kwargs):
+    if not created:
+        pack_files_facets.refresh_on_commit(instance.audio_files.values_list("id", flat=True))
+
+
+@receiver(post_delete, sender=Genre)
+@receiver(post_delete, sender=SubGenre)
+@receiver(post_delete, sender=Instrument)
+@receiver(post_delete, sender=SubInstrument)
+@receiver(post_delete, sender=Mood)
+def invalidate_files_index(sender, instance, **kwargs):
+    transaction.on_commit(pack_files_facets.invalidate)
+
+
+@receiver(post_save, sender=PackSubmissions)
+def index_submission_text(sender, instance, created, update_fields=None, **kwargs):
+    if created and instance.status != SubmissionStatus.APPROVED.value:
+        return
+    if update_fields is None or {"status", "pack", "pack_type"} & set(update_fields):
+        packs_text_search.refresh_on_commit([instance.id])
+
+
+@receiver(post_delete, sender=PackSubmissions)
+def unindex_submission_text(sender, instance, **kwargs):
+    packs_text_search.refresh_on_commit([instance.id])
+
+
+@receiver(post_save, sender=Pack)
+def index_pack_text(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and not {"title", "description"} & set(update_fields)):
+        return
+    packs_text_search.refresh_on_commit(instance.submissions.values_list("id", flat=True))
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=SubGenre)
+@receiver(post_delete, sender=SubGenre)
+@receiver(post_save, sender=Instrument)
+@receiver(post_delete, sender=Instrument)
+@receiver(post_save, sender=SubInstrument)
+@receiver(post_delete, sender=SubInstrument)
+@receiver(post_save, sender=Mood)
+@receiver(post_delete, sender=Mood)
+def invalidate_taxonomy(sender, instance, **kwargs):
+    transaction.on_commit(pack_taxonomy.invalidate)
+
+
+@receiver(post_save, sender=PackSubmissions)
+def refresh_reviewer_load(sender, instance, created, update_fields=None, **kwargs):
+    if created or update_fields is None or {"status", "approval_person"} & set(update_fields):
+        reviewer_pool.refresh_loads_on_commit([instance.approval_person_id])
+
+
+@receiver(post_delete, sender=PackSubmissions)
+def release_reviewer_load(sender, instance, **kwargs):
+    reviewer_pool.refresh_loads_on_commit([instance.approval_person_id])
@@ -0,0 +1,19 @@
+from Product_Management.caches import pack_taxonomy
+from Product_Management.indexes import pack_files_facets, packs_text_search
+from Product_Management.models import Genre, SubGenre, Instrument, SubInstrument, Mood, BPM, Key, File, AudioFiles, \
+    Pack, PackSubmissions, Likes, Downloads, FileDownloads, PackCatalogCard
+from Utilities.Enums import PackTypes, TypeTypes
+from Utilities.SyntheticCatalog import SyntheticCatalog
+
+
+def refresh_pack_indexes():
+    pack_taxonomy.invalidate()
+    pack_files_facets.invalidate()
+    packs_text_search.rebuild()
+
+
+pack_catalog = SyntheticCatalog("packs", "pack", "pack_type", PackTypes.list(), "type", TypeTypes.list(),
+                                refresh_pack_indexes, genre=Genre, sub_genre=SubGenre, instrument=Instrument,
+                                sub_instrument=SubInstrument, mood=Mood, bpm=BPM, key=Key, file=File,
+                                audio_file=AudioFiles, product=Pack, submission=PackSubmissions, like=Likes,
+                                download=Downloads, file_download=FileDownloads, card=PackCatalogCard)
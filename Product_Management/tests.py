@@ -1,3 +1,206 @@
-from django.test import TestCase
+import random
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from Product_Management.counters import pack_file_counters
+from Product_Management.models import Genre, SubGenre, Instrument, SubInstrument, Mood, BPM, Key, File, AudioFiles, \
+    Pack, PackSubmissions, Plugin, Likes, Downloads, Collections, CollectionFiles, PackCatalogCard
+from Product_Management.synthetic import pack_catalog
+from User_Management.models import User, Supplier, Artist, MusicContentInformation
+from User_Management.synthetic import generate_users
+from Utilities.Enums import UserType, PackTypes, SubmissionStatus
+from Utilities.QueryCountRegression import QueryCountRegressionMixin
+
+
+class PackFixtureTestCase(TestCase):
+    """Creates a member, a supplier and the taxonomy rows packs are made of"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create(email="member@test.com", password="pw", usertype=UserType.MEMBER.value,
+                                         verified=True)
+        cls.supplier = User.objects.create(email="supplier@test.com", password="pw",
+                                           usertype=UserType.SUPPLIER.value, verified=True)
+        content_info = MusicContentInformation.objects.create(talent="talent", daw="daw")
+        artist = Artist.objects.create(name="artist", complete_residence_address="address", major_city="city",
+                                       country_or_state="state", bio="bio", content_info=content_info)
+        Supplier.objects.create(supplier_user=cls.supplier, first_name="first", last_name="last",
+                                username="supplier", artist=artist)
+        cls.genre = Genre.objects.create(name="Trap")
+        cls.sub_genre = SubGenre.objects.create(name="Drill", genre=cls.genre)
+        cls.instrument = Instrument.objects.create(name="Drums")
+        cls.sub_instrument = SubInstrument.objects.create(name="Kick", instrument=cls.instrument)
+        cls.mood = Mood.objects.create(name="Dark")
+
+    def create_pack(self, files_count):
+        pack = Pack.objects.create(title=f"pack {files_count}", genre=self.genre, sub_genre=self.sub_genre)
+        pack.mood.add(self.mood)
+        for index in range(files_count):
+            pack.audio_files.add(AudioFiles.objects.create(
+                file=File.objects.create(file_name=f"file {index}.wav", file_size="10"), genre=self.genre,
+                sub_genre=self.sub_genre, instrument=self.instrument, sub_instrument=self.sub_instrument,
+                mood=self.mood, bpm=BPM.objects.create(start_value=120, end_value=124, bpm_type="Range"),
+                key=Key.objects.create(key="C", key_scale="Minor", key_type="Sharp"), type="Loops",
+                source="Electronic"))
+        return PackSubmissions.objects.create(pack=pack, supplier=self.supplier, pack_type=PackTypes.SAMPLE.value,
+                                              status=SubmissionStatus.APPROVED.value)
+
+
+class ViewPackQueryCountTest(PackFixtureTestCase):
+    """The pack detail page runs the same number of queries whatever the number of audio files"""
+
+    def view_pack(self, submission):
+        client = APIClient()
+        client.force_authenticate(self.member)
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/app/products/view-pack",
+                                  {"id": submission.id, "pack_type": PackTypes.SAMPLE.value})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["detail"]["audio_files"]), submission.pack.audio_files.count())
+        return len(queries)
+
+    def test_query_count_does_not_depend_on_files_count(self):
+        self.assertEqual(self.view_pack(self.create_pack(1)), self.view_pack(self.create_pack(12)))
+
+
+@override_settings(COUNTER_FLUSH_INTERVAL=3600)
+class LikeCountersTest(PackFixtureTestCase):
+    """Likes and unlikes are buffered, read exactly in this process and counted once per deleted like"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.member)
+        self.pack = self.create_pack(1).pack
+        self.audio_file = self.pack.audio_files.get()
+        self.addCleanup(pack_file_counters.flush)
+
+    def post(self, action):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f"/app/mylibrary/likes/{action}",
+                                        {"pack_id": self.pack.id, "audio_file_id": self.audio_file.id}, format="json")
+        self.assertEqual(response.status_code, 200)
+
+    def likes_count(self):
+        audio_file = AudioFiles.objects.get(pk=self.audio_file.pk)
+        return audio_file.likes_count, pack_file_counters.merge([audio_file], "likes_count")[0].likes_count
+
+    def test_likes_are_merged_until_flushed(self):
+        self.post("like")
+        self.assertEqual(self.likes_count(), (0, 1))
+        self.assertEqual(pack_file_counters.pending_for_group(self.pack.id, "likes_count"), 1)
+
+        pack_file_counters.flush()
+        self.assertEqual(self.likes_count(), (1, 1))
+
+        self.post("unlike")
+        self.assertEqual(self.likes_count(), (1, 0))
+        pack_file_counters.flush()
+        self.assertEqual(self.likes_count(), (0, 0))
+
+    def test_like_deleted_by_a_concurrent_unlike_is_not_counted_twice(self):
+        self.post("like")
+        pack_file_counters.flush()
+        delete = Likes.delete
+
+        def delete_after_concurrent_unlike(like, *args, **kwargs):
+            Likes.objects.filter(pk=like.pk).delete()
+            return delete(like, *args, **kwargs)
+
+        with mock.patch.object(Likes, "delete", delete_after_concurrent_unlike):
+            self.post("unlike")
+        self.assertEqual(self.likes_count(), (1, 1))
+
+
+def pack_detail(fixture):
+    return {"id": fixture["pack"].id, "pack_type": fixture["pack"].pack_type}
+
+
+class PackRoutesQueryCountTest(QueryCountRegressionMixin, TestCase):
+    """Every GET route of the packs app runs as many queries on a large catalog as on a small one"""
+
+    urlconf = "Product_Management.urls"
+    prefix = "/app/"
+    routes = {
+        "explore/discover": ("member", lambda fixture: {"pack_type": fixture["pack"].pack_type}),
+        "products/view-pack": ("member", pack_detail),
+        "products/view-pack/audio-files": ("member", lambda fixture: {**pack_detail(fixture), "sort": "likes"}),
+        "products/samples": ("member", None),
+        "products/midi": ("member", None),
+        "products/preset": ("member", None),
+        "search": ("member", lambda fixture: {"q": fixture["pack"].pack.title.split()[0]}),
+        "search/typeahead": ("member", lambda fixture: {"q": fixture["pack"].pack.title[:3]}),
+        "search/files": ("member", None),
+        "mylibrary/likes/view-likes": ("member", lambda fixture: {"product_type": fixture["pack"].pack_type}),
+        "mylibrary/downloads/view": ("member", lambda fixture: {"product_type": fixture["download_type"]}),
+        "mylibrary/downloads/view-pack": ("member", lambda fixture: {"download_id": fixture["download"].id,
+                                                                     "pack_id": fixture["download"].pack_id}),
+        "mylibrary/downloads/archive": ("member", lambda fixture: {"pack_id": fixture["pack"].pack_id}),
+        "mylibrary/collection": ("member", None),
+        "mylibrary/collection/view": ("member", lambda fixture: {"product_type": fixture["pack"].pack_type}),
+        "mylibrary/collection/dropdown": ("member", None),
+        "moods/": ("admin", None),
+        "plugins/": ("admin", None),
+        "genres/": ("admin", None),
+        "sub-genres/": ("admin", lambda fixture: {"genre_id": fixture["genre"].id,
+                                                  "genre_name": fixture["genre"].name}),
+        "instruments/": ("admin", None),
+        "sub-instruments/": ("admin", lambda fixture: {"instrument_id": fixture["instrument"].id,
+                                                       "instrument_name": fixture["instrument"].name}),
+        "drp/genres/": ("supplier", None),
+        "drp/plugins/": ("supplier", None),
+        "drp/instruments/": ("supplier", None),
+        "drp/moods/": ("supplier", None),
+        "view-packs/": ("supplier", lambda fixture: {"pack_type": fixture["pack"].pack_type}),
+        "view-submitted-packs/": ("admin", None),
+        "review-queue/": ("staff", None),
+    }
+
+    def seed(self, size):
+        """This function generates a catalog of 12 * size packs of size files, half of them approved, with size
+        likes, downloads and collection files per member and size more genres, instruments, moods and plugins"""
+        rng = random.Random(size)
+        suppliers, members, staff = generate_users("routes", rng, suppliers=1, members=2, staff=1)
+        pack_catalog.generate(rng, suppliers, members, staff, products=12 * size, files_per_product=size,
+                              likes=2 * size, downloads=2 * size, approved=0.5)
+        genre, instrument = Genre.objects.first(), Instrument.objects.first()
+        SubGenre.objects.bulk_create(SubGenre(name=f"Extra {index}", genre=genre) for index in range(size))
+        SubInstrument.objects.bulk_create(SubInstrument(name=f"Extra {index}", instrument=instrument)
+                                          for index in range(size))
+        for model in (Genre, Instrument, Mood):
+            model.objects.bulk_create(model(name=f"Extra {index}") for index in range(size))
+        Plugin.objects.bulk_create(Plugin(name=f"Plugin {index}", extension="vst") for index in range(size))
+
+        member = User.objects.get(pk=members[0])
+        collections = Collections.objects.bulk_create(Collections(name=f"Collection {index}", description="Synthetic",
+                                                                  member=member) for index in range(size))
+        likes = Likes.objects.filter(member=member)
+        CollectionFiles.objects.bulk_create(CollectionFiles(collection=collection, pack_id=like.pack_id,
+                                                            audio_file_id=like.file_id)
+                                            for collection, like in zip(collections, likes))
+        pack = PackSubmissions.objects.select_related("pack").filter(
+            status=SubmissionStatus.APPROVED.value, pack__likes__member=member).first()
+        for pack_type in PackTypes.list():
+            self.assertTrue(PackCatalogCard.objects.filter(pack_type=pack_type).exists(),
+                            f"the fixture of size {size} has no approved {pack_type} pack")
+        self.assertTrue(PackSubmissions.objects.filter(status=SubmissionStatus.SUBMITTED.value).exists(),
+                        f"the fixture of size {size} has no submitted pack")
+        download = Downloads.objects.select_related("pack").filter(
+            member=member, pack__submissions__status=SubmissionStatus.APPROVED.value).first()
+        return {
+            "member": member,
+            "supplier": User.objects.get(pk=suppliers[0][0]),
+            "staff": User.objects.get(pk=staff[0]),
+            "admin": User.objects.create(email="admin@test.com", password="pw", usertype=UserType.ADMIN.value,
+                                         verified=True),
+            "pack": pack,
+            "download": download,
+            "download_type": download.pack.submissions.get().pack_type,
+            "genre": genre,
+            "instrument": instrument,
+        }
@@ -2,11 +2,14 @@ from django.urls import path
 
 from Product_Management.MainStream import GetPacksView, GetSamplesView, GetMIDIView, GetPresetView, ViewPackView, \
     CollectionsView, CollectionsAddView, CollectionsRemoveView, CollectionsDropDownView, DownloadsView, \
-    ViewDownloadsView, ViewFileDownloadsView, ViewCollectionView, LikeView, UnlikeView, ViewLikesView
+    DownloadArchiveView, ViewDownloadsView, ViewFileDownloadsView, ViewCollectionView, LikeView, UnlikeView, \
+    ViewLikesView, SearchFilesView, \
+    SearchPacksView, PacksTypeaheadView, ViewPackFilesView
 from Product_Management.Views import GenresView, SubGenresView, GenresDropdownView, InstrumentsView, \
     SubInstrumentsView, InstrumentsDropdownView, MoodsView, MoodsDropdownView, PackSubmissionsView, ViewPacksView, \
     PluginsDropdownView, SendRevisionPacksView, ResolveRevisionPacksView, ApproveRevisionPacksView, PluginsView, \
-    RejectRevisionPacksView, SubmitForReviewView, ApprovePackView, RejectPackView, ViewSubmittedPacksView
+    RejectRevisionPacksView, SubmitForReviewView, ApprovePackView, RejectPackView, ViewSubmittedPacksView, \
+    ReviewQueuePacksView
 
 urlpatterns = [
     # Main Stream
@@ -16,10 +19,16 @@ urlpatterns = [
 
     # Products
     path("products/view-pack", ViewPackView.as_view()),
+    path("products/view-pack/audio-files", ViewPackFilesView.as_view()),
     path("products/samples", GetSamplesView.as_view()),
     path("products/midi", GetMIDIView.as_view()),
     path("products/preset", GetPresetView.as_view()),
 
+    # Search
+    path("search", SearchPacksView.as_view()),
+    path("search/typeahead", PacksTypeaheadView.as_view()),
+    path("search/files", SearchFilesView.as_view()),
+
     # My Library
     path("mylibrary/likes/view-likes", ViewLikesView.as_view()),
     path("mylibrary/likes/like", LikeView.as_view()),
@@ -29,6 +38,7 @@ urlpatterns = [
     path("mylibrary/downloads/view", ViewDownloadsView.as_view()),
     path("mylibrary/downloads/view-pack", ViewFileDownloadsView.as_view()),
     path("mylibrary/downloads/download", DownloadsView.as_view()),
+    path("mylibrary/downloads/archive", DownloadArchiveView.as_view()),
 
     # Collections
     path("mylibrary/collection", CollectionsView.as_view()),
@@ -64,6 +74,7 @@ urlpatterns = [
     path("reject-file/", RejectRevisionPacksView.as_view()),
     path("submit-for-review/", SubmitForReviewView.as_view()),
     path("view-submitted-packs/", ViewSubmittedPacksView.as_view()),
+    path("review-queue/", ReviewQueuePacksView.as_view()),
     path("approve-pack/", ApprovePackView.as_view()),
     path("reject-pack/", RejectPackView.as_view()),
 ]
@@ -0,0 +1,52 @@
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from User_Management.caches import user_snapshots
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that only accepts tokens of the user's current token version, once per request.
+
+    The result is stored on the Django request, so the token checked by CustomTokenValidationMiddleware
+    is not decoded and looked up again by DRF. Users come from ``user_snapshots`` and the token check is
+    an integer compare, so authenticated requests do not query the user table. A snapshot whose version
+    does not match is reloaded once, in case the user logged out through another process.
+    """
+
+    def authenticate(self, request):
+        django_request = getattr(request, "_request", request)
+        authenticated = getattr(django_request, "jwt_authentication", None)
+        if authenticated is not None:
+            return authenticated
+
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        user = self.get_current_user(validated_token)
+        if user is None:
+            raise AuthenticationFailed("token is invalid or expired")
+
+        django_request.jwt_authentication = (user, validated_token)
+        return django_request.jwt_authentication
+
+    def get_current_user(self, validated_token):
+        """This function returns the user of the token if it is its current token, None otherwise"""
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            return None
+
+        user = user_snapshots.get(user_id)
+        if user is not None and user.has_valid_token(validated_token):
+            return user
+
+        version = user_snapshots.version(user_id)
+        user = self.get_user(validated_token)
+        user_snapshots.put(user, version)
+        return user if user.has_valid_token(validated_token) else None
@@ -1,14 +1,15 @@
 from django.utils.deprecation import MiddlewareMixin
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from django.contrib.auth import get_user
 from rest_framework.exceptions import AuthenticationFailed
 
+from Soul_Family_Sounds.Backend.CachedJWTAuthentication import CachedJWTAuthentication
+
 
 class CustomTokenValidationMiddleware(MiddlewareMixin):
     def __init__(self, get_response):
         super().__init__(get_response)
         self.get_response = get_response
-        self.jwt_auth = JWTAuthentication()
+        self.jwt_auth = CachedJWTAuthentication()
 
     def __call__(self, request):
         user = self.validate_token(request)
@@ -23,12 +24,10 @@ class CustomTokenValidationMiddleware(MiddlewareMixin):
             try:
                 raw_token = self.jwt_auth.get_raw_token(auth_header)
                 validated_token = self.jwt_auth.get_validated_token(raw_token)
-                user = self.jwt_auth.get_user(validated_token)
-
-                if user.auth_token is None:
-                    raise AuthenticationFailed()
+                user = self.jwt_auth.get_current_user(validated_token)
 
-                if all([user.is_active, (not user.is_deleted), user.auth_token == str(validated_token)]):
+                if user is not None:
+                    request.jwt_authentication = (user, validated_token)
                     return user
 
             except AuthenticationFailed as e:
@@ -0,0 +1,64 @@
+import logging
+
+from django.conf import settings
+
+from Utilities.QueryCounter import QueryCounter
+
+logger = logging.getLogger("Soul_Family_Sounds.queries")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryCountMiddleware:
+    """Counts the SQL statements of every request, reports them and enforces the per-view query budgets.
+
+    Every request is logged with its query count, database time and the statement shapes that ran at
+    least ``QUERY_COUNT_REPEAT_THRESHOLD`` times, as a warning when there are some (likely N+1 queries).
+    With ``QUERY_COUNT_HEADERS`` the numbers are also sent as X-DB-* response headers. A view listed in
+    ``QUERY_COUNT_BUDGETS`` that runs more queries than its budget is logged as an error, and raises
+    ``QueryBudgetExceeded`` when ``QUERY_COUNT_FAIL_ON_BUDGET`` is set, which fails the calling test.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    @staticmethod
+    def view_path(request):
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            return None
+        view = getattr(match.func, "view_class", match.func)
+        return f"{view.__module__}.{view.__qualname__}"
+
+    def __call__(self, request):
+        with QueryCounter() as queries:
+            response = self.get_response(request)
+
+        view = self.view_path(request)
+        repeated = queries.repeated(settings.QUERY_COUNT_REPEAT_THRESHOLD)
+        report = {
+            "method": request.method,
+            "path": request.path,
+            "view": view,
+            "status": response.status_code,
+            "queries": queries.count,
+            "db_time_ms": round(queries.duration * 1000, 2),
+            "repeated_queries": repeated,
+        }
+        logger.log(logging.WARNING if repeated else logging.INFO,
+                   "%(method)s %(path)s ran %(queries)s queries in %(db_time_ms)sms", report, extra=report)
+
+        if settings.QUERY_COUNT_HEADERS:
+            response["X-DB-Query-Count"] = str(queries.count)
+            response["X-DB-Query-Time"] = f"{queries.duration * 1000:.2f}"
+            response["X-DB-Repeated-Queries"] = str(sum(times - 1 for times in repeated.values()))
+
+        budget = settings.QUERY_COUNT_BUDGETS.get(view)
+        if budget is not None and queries.count > budget:
+            message = f"{view} ran {queries.count} queries, its budget is {budget}"
+            logger.error(message, extra=report)
+            if settings.QUERY_COUNT_FAIL_ON_BUDGET:
+                raise QueryBudgetExceeded(message)
+        return response
@@ -1 +1,2 @@
 from Soul_Family_Sounds.Middleware.CustomTokenValidationMiddleware import CustomTokenValidationMiddleware
+from Soul_Family_Sounds.Middleware.QueryCountMiddleware import QueryCountMiddleware, QueryBudgetExceeded
@@ -1,4 +1,5 @@
 import os
+import sys
 from datetime import timedelta
 from pathlib import Path
 
@@ -36,6 +37,8 @@ INSTALLED_APPS = [
     "Product_Management.apps.ProductManagementConfig",
     "User_Management.apps.UserManagementConfig",
     "Beats_Management.apps.BeatManagementConfig",
+    "Upload_Management.apps.UploadManagementConfig",
+    "Email_Management.apps.EmailManagementConfig",
     # External Apps
     "drf_yasg",
     "corsheaders",
@@ -50,6 +53,7 @@ AUTHENTICATION_BACKENDS = [
 ]
 
 MIDDLEWARE = [
+    "Soul_Family_Sounds.Middleware.QueryCountMiddleware.QueryCountMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -114,13 +118,48 @@ USE_TZ = True
 STATIC_URL = "/static/"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
+SEARCH_INDEX_DIR = os.path.join(BASE_DIR, "search_index")
+MEDIA_STREAM_CHUNK_SIZE = 64 * 1024
+# "django" streams media files from Python, "x-accel-redirect" (nginx) and "x-sendfile" (apache, lighttpd)
+# hand the file over to the web server. When None, /media/ is only served (from Python) with DEBUG.
+MEDIA_DELIVERY = None
+MEDIA_ACCEL_REDIRECT_PREFIX = "/protected-media/"
+COUNTER_FLUSH_INTERVAL = 2
+COUNTER_MAX_PENDING = 500
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+UPLOAD_MAX_FILE_SIZE = 10 * 1024 * 1024 * 1024
+UPLOAD_SESSION_TTL = timedelta(days=2)
+# seconds a validated user is reused without reading it from the database. Changes to a user reach the other
+# processes through the cache, so several web processes need a shared CACHES backend (Redis, Memcached):
+# with the default per-process cache a changed password or revoked token is only seen there after this delay
+AUTH_USER_CACHE_TTL = 30
+# staff members holding this many open submissions are not assigned new ones
+REVIEWER_MAX_OPEN_SUBMISSIONS = 1000
+# emails are queued in the outbox and delivered by "manage.py process_email_outbox", and also by a background
+# thread of the web process when EMAIL_OUTBOX_IN_PROCESS is set. That thread retries failed emails while the
+# process runs; run the command to deliver what is left when the process stops. The thread is off under the test
+# runner, where it would share the test database with the tests
+EMAIL_OUTBOX_IN_PROCESS = sys.argv[1:2] != ["test"]
+EMAIL_OUTBOX_BATCH_SIZE = 50
+EMAIL_OUTBOX_MAX_ATTEMPTS = 6
+EMAIL_OUTBOX_RETRY_DELAY = 30
+EMAIL_OUTBOX_LEASE = 300
+EMAIL_OUTBOX_POLL_INTERVAL = 5
+# every request is logged with its query count on the "Soul_Family_Sounds.queries" logger, statements repeated
+# this many times are reported as likely N+1 queries
+QUERY_COUNT_REPEAT_THRESHOLD = 5
+# sends the query count and database time as X-DB-* response headers
+QUERY_COUNT_HEADERS = DEBUG
+# {"dotted.path.of.ViewClass": max queries}, exceeding it is logged and raises when QUERY_COUNT_FAIL_ON_BUDGET is set
+QUERY_COUNT_BUDGETS = {}
+QUERY_COUNT_FAIL_ON_BUDGET = False
 STATICFILES_DIRS = (os.path.join(BASE_DIR, "static"),)
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "Soul_Family_Sounds.Backend.CachedJWTAuthentication.CachedJWTAuthentication",
     )
 }
 
@@ -1,10 +1,10 @@
-from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 
 from Soul_Family_Sounds import settings
+from Upload_Management.Views import MediaView
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -24,6 +24,7 @@ urlpatterns = [
     path("app/", include("Product_Management.urls")),
     path("beatsapi/", include("Beats_Management.urls")),
     path("plan/", include("Plan_Management.urls")),
+    path("uploads/", include("Upload_Management.urls")),
     path("redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
     path(
         "swagger<format>/", schema_view.without_ui(cache_timeout=0), name="schema-json"
@@ -35,4 +36,5 @@ urlpatterns = [
     ),
 ]
 
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+if settings.DEBUG or settings.MEDIA_DELIVERY:
+    urlpatterns += [path(f"{settings.MEDIA_URL.strip('/')}/<path:path>", MediaView.as_view())]
@@ -0,0 +1,69 @@
+from django.conf import settings
+from rest_framework import serializers
+
+from Upload_Management.models import UploadSession
+from Utilities.Validators.InputValidator import InputValidator
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    upload_id = serializers.UUIDField(source="id", read_only=True)
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadSession
+        fields = ("upload_id", "file_name", "file_size", "received", "checksum", "status", "chunk_size")
+
+    @staticmethod
+    def get_chunk_size(obj):
+        return settings.UPLOAD_CHUNK_SIZE
+
+
+class CreateUploadSessionSerializer(serializers.Serializer):
+    file_name = serializers.CharField(
+        error_messages={
+            "required": "file_name is required",
+            "blank": "file_name cannot be blank"
+        }
+    )
+    file_size = serializers.IntegerField(
+        error_messages={
+            "required": "file_size is required",
+            "invalid": "file_size should be a numerical value"
+        }
+    )
+
+    def validate(self, attrs):
+        file_name = attrs.get("file_name")
+        file_size = attrs.get("file_size")
+
+        if not InputValidator(file_name).is_valid():
+            raise serializers.ValidationError("file_name is required")
+
+        if file_size <= 0:
+            raise serializers.ValidationError("file_size must be a positive number")
+
+        if file_size > settings.UPLOAD_MAX_FILE_SIZE:
+            raise serializers.ValidationError("file_size exceeds the maximum upload size")
+
+        return attrs
+
+    def create(self, validated_data):
+        return UploadSession.objects.create(owner=self.context.get("owner"), file_name=validated_data.get("file_name"),
+                                            file_size=validated_data.get("file_size"))
+
+
+class FinalizeUploadSessionSerializer(serializers.Serializer):
+    upload_id = serializers.UUIDField(
+        error_messages={
+            "required": "upload_id is required",
+            "invalid": "invalid upload_id"
+        }
+    )
+    checksum = serializers.RegexField(
+        regex=r"^[0-9a-fA-F]{64}$",
+        error_messages={
+            "required": "checksum is required",
+            "blank": "checksum cannot be blank",
+            "invalid": "checksum should be a sha256 hex digest"
+        }
+    )
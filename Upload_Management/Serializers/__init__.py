@@ -0,0 +1,2 @@
+from Upload_Management.Serializers.UploadSessionSerializer import UploadSessionSerializer, \
+    CreateUploadSessionSerializer, FinalizeUploadSessionSerializer
@@ -0,0 +1,141 @@
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.http import http_date, quote_etag
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from Upload_Management.models import UploadSession
+from Utilities.Enums import UploadStatus
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+# never served: supplier contracts and uploads still being received
+PRIVATE_MEDIA_DIRS = ("contracts", os.path.join("uploads", "partial"))
+# only served once the upload is attached to a submission
+UPLOADS_DIR = "uploads"
+
+
+def is_inside(path, directory):
+    return os.path.commonpath([path, directory]) == directory
+
+
+def find_media_file(path):
+    """This function returns the resolved path of a public file under MEDIA_ROOT and its name relative to it
+
+    The path is resolved before it is checked, so "./", "//", ".." or symlinks cannot reach a private
+    directory. Raises Http404 if there is no such public file.
+    """
+    media_root = os.path.realpath(settings.MEDIA_ROOT)
+    try:
+        full_path = os.path.realpath(safe_join(media_root, path))
+    except SuspiciousFileOperation:
+        raise Http404
+    if not is_inside(full_path, media_root) or not os.path.isfile(full_path):
+        raise Http404
+    if any(is_inside(full_path, os.path.join(media_root, directory)) for directory in PRIVATE_MEDIA_DIRS):
+        raise Http404
+    name = os.path.relpath(full_path, media_root).replace(os.sep, "/")
+    if is_inside(full_path, os.path.join(media_root, UPLOADS_DIR)) and \
+            not UploadSession.objects.filter(file=name, status=UploadStatus.ATTACHED.value).exists():
+        raise Http404
+    return full_path, name
+
+
+def file_etag(stat):
+    return quote_etag(f"{stat.st_mtime_ns:x}-{stat.st_size:x}")
+
+
+def parse_range(header, size):
+    """This function returns the (start, end) of a single byte range header, None when it does not apply
+
+    Raises ValueError when the range cannot be satisfied. Multi-range requests are answered with the
+    whole file, which RFC 9110 allows.
+    """
+    match = RANGE_RE.match(header or "")
+    if not match:
+        return None
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        length = int(end)
+        if not length or not size:
+            raise ValueError("unsatisfiable range")
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        raise ValueError("unsatisfiable range")
+    return start, end
+
+
+def read_file(path, start, length, chunk_size):
+    with open(path, "rb") as media_file:
+        media_file.seek(start)
+        while length > 0:
+            data = media_file.read(min(chunk_size, length))
+            if not data:
+                break
+            length -= len(data)
+            yield data
+
+
+class MediaView(APIView):
+    """Serves the public files of MEDIA_ROOT with Range, ETag and If-None-Match support.
+
+    It is only mounted with DEBUG or ``MEDIA_DELIVERY`` set. With "x-accel-redirect" or "x-sendfile"
+    the response only carries the header and the web server sends the file (and answers the ranges)
+    itself. Contracts, partial uploads and uploads not attached to a submission are never served.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    @staticmethod
+    def get(request, path):
+        """This function streams a media file, or the requested byte range of it"""
+        full_path, name = find_media_file(path)
+        stat = os.stat(full_path)
+        etag = file_etag(stat)
+        content_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+
+        if etag in [tag.strip() for tag in request.META.get("HTTP_IF_NONE_MATCH", "").split(",")]:
+            response = HttpResponse(status=304)
+            response["ETag"] = etag
+            return response
+
+        delivery = settings.MEDIA_DELIVERY
+        if delivery == "x-accel-redirect":
+            response = HttpResponse(content_type=content_type)
+            response["X-Accel-Redirect"] = settings.MEDIA_ACCEL_REDIRECT_PREFIX + name
+        elif delivery == "x-sendfile":
+            response = HttpResponse(content_type=content_type)
+            response["X-Sendfile"] = full_path
+        else:
+            size = stat.st_size
+            byte_range = None
+            if request.META.get("HTTP_IF_RANGE", etag) == etag:
+                try:
+                    byte_range = parse_range(request.META.get("HTTP_RANGE"), size)
+                except ValueError:
+                    response = HttpResponse(status=416)
+                    response["Content-Range"] = f"bytes */{size}"
+                    return response
+
+            start, end = byte_range or (0, size - 1)
+            length = end - start + 1 if size else 0
+            response = StreamingHttpResponse(read_file(full_path, start, length, settings.MEDIA_STREAM_CHUNK_SIZE),
+                                             status=206 if byte_range else 200, content_type=content_type)
+            response["Content-Length"] = str(length)
+            response["Accept-Ranges"] = "bytes"
+            if byte_range:
+                response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(stat.st_mtime)
+        return response
@@ -0,0 +1,144 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from Upload_Management.Serializers import UploadSessionSerializer, CreateUploadSessionSerializer, \
+    FinalizeUploadSessionSerializer
+from Upload_Management.models import UploadSession
+from Utilities import extract_error_messages
+from Utilities.Enums import UploadStatus
+from Utilities.Permissions import AdminPermissions, SupplierPermissions
+
+
+def find_upload_session(upload_id, owner, lock=False):
+    uploads = UploadSession.objects.select_for_update() if lock else UploadSession.objects
+    try:
+        return uploads.filter(pk=upload_id, owner=owner).first()
+    except ValidationError:
+        return None
+
+
+class UploadSessionsView(APIView):
+    permission_classes = [IsAuthenticated, AdminPermissions | SupplierPermissions]
+
+    @staticmethod
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("upload_id", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True)
+    ], responses={200: UploadSessionSerializer(), 404: "upload not found!"})
+    def get(request):
+        """This function returns the state of an upload, received tells the offset to resume from"""
+        upload = find_upload_session(request.GET.get("upload_id"), request.user)
+        if not upload:
+            return Response({"detail": "upload not found!"}, status=status.HTTP_404_NOT_FOUND)
+        return Response({"detail": UploadSessionSerializer(upload).data}, status=status.HTTP_200_OK)
+
+    @staticmethod
+    @swagger_auto_schema(request_body=CreateUploadSessionSerializer(),
+                         responses={201: UploadSessionSerializer()})
+    def post(request):
+        """This function starts a chunked upload"""
+        create_upload_serializer = CreateUploadSessionSerializer(data=request.data, context={"owner": request.user})
+        create_upload_serializer.is_valid()
+        if create_upload_serializer.errors:
+            return Response({"detail": extract_error_messages(create_upload_serializer.errors)},
+                            status=status.HTTP_400_BAD_REQUEST)
+        upload = create_upload_serializer.save()
+        return Response({"detail": UploadSessionSerializer(upload).data}, status=status.HTTP_201_CREATED)
+
+
+class UploadChunkView(APIView):
+    permission_classes = [IsAuthenticated, AdminPermissions | SupplierPermissions]
+
+    @staticmethod
+    @swagger_auto_schema(manual_parameters=[
+        openapi.Parameter("upload_id", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+        openapi.Parameter("offset", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER, required=True),
+    ], responses={200: UploadSessionSerializer(), 404: "upload not found!", 409: "offset mismatch"})
+    def put(request):
+        """This function writes the raw request body of a chunk at the given offset of an upload"""
+        try:
+            offset = int(request.GET.get("offset"))
+            length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except (TypeError, ValueError):
+            return Response({"detail": "offset should be a numerical value"}, status=status.HTTP_400_BAD_REQUEST)
+
+        if length <= 0:
+            return Response({"detail": "chunk cannot be empty"}, status=status.HTTP_400_BAD_REQUEST)
+
+        if length > settings.UPLOAD_CHUNK_SIZE:
+            return Response({"detail": f"chunk cannot exceed {settings.UPLOAD_CHUNK_SIZE} bytes"},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            upload = find_upload_session(request.GET.get("upload_id"), request.user, lock=True)
+            if not upload or upload.status != UploadStatus.PENDING.value:
+                return Response({"detail": "upload not found!"}, status=status.HTTP_404_NOT_FOUND)
+
+            if offset < 0 or offset > upload.received:
+                return Response({"detail": "offset mismatch", "received": upload.received},
+                                status=status.HTTP_409_CONFLICT)
+
+            if offset + length > upload.file_size:
+                return Response({"detail": "chunk exceeds the file_size of the upload"},
+                                status=status.HTTP_400_BAD_REQUEST)
+
+            upload.received = upload.write_chunk(offset, request.stream, length)
+            upload.save(update_fields=["received", "last_modified"])
+        return Response({"detail": UploadSessionSerializer(upload).data}, status=status.HTTP_200_OK)
+
+
+class FinalizeUploadView(APIView):
+    permission_classes = [IsAuthenticated, AdminPermissions | SupplierPermissions]
+
+    @staticmethod
+    @swagger_auto_schema(request_body=FinalizeUploadSessionSerializer(),
+                         responses={200: UploadSessionSerializer(), 404: "upload not found!",
+                                    409: "upload changed while finalizing"})
+    def post(request):
+        """This function verifies the checksum of a fully received upload and makes it available to submissions"""
+        finalize_upload_serializer = FinalizeUploadSessionSerializer(data=request.data)
+        finalize_upload_serializer.is_valid()
+        if finalize_upload_serializer.errors:
+            return Response({"detail": extract_error_messages(finalize_upload_serializer.errors)},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        upload_id = finalize_upload_serializer.validated_data.get("upload_id")
+        checksum = finalize_upload_serializer.validated_data.get("checksum").lower()
+
+        upload = find_upload_session(upload_id, request.user)
+        if not upload:
+            return Response({"detail": "upload not found!"}, status=status.HTTP_404_NOT_FOUND)
+
+        if upload.status != UploadStatus.PENDING.value:
+            if upload.checksum == checksum:
+                return Response({"detail": UploadSessionSerializer(upload).data}, status=status.HTTP_200_OK)
+            return Response({"detail": "upload already finalized"}, status=status.HTTP_400_BAD_REQUEST)
+
+        if upload.received != upload.file_size:
+            return Response({"detail": "upload is incomplete", "received": upload.received},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        # the file is hashed before locking the upload, the lock then only checks no chunk was written meanwhile
+        received_checksum = upload.compute_checksum()
+        hashed_version = (upload.received, upload.last_modified)
+
+        with transaction.atomic():
+            upload = find_upload_session(upload_id, request.user, lock=True)
+            if not upload or upload.status != UploadStatus.PENDING.value or \
+                    (upload.received, upload.last_modified) != hashed_version:
+                return Response({"detail": "upload changed while finalizing, finalize it again"},
+                                status=status.HTTP_409_CONFLICT)
+
+            if received_checksum != checksum:
+                upload.restart()
+                return Response({"detail": "checksum mismatch, upload the file again"},
+                                status=status.HTTP_400_BAD_REQUEST)
+
+            upload.complete(checksum)
+        return Response({"detail": UploadSessionSerializer(upload).data}, status=status.HTTP_200_OK)
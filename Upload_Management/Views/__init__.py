@@ -0,0 +1,2 @@
+from Upload_Management.Views.MediaView import MediaView
+from Upload_Management.Views.UploadsView import UploadSessionsView, UploadChunkView, FinalizeUploadView
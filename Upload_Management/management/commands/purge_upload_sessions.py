@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from Upload_Management.models import UploadSession
+from Utilities.Enums import UploadStatus
+
+
+class Command(BaseCommand):
+    help = "Deletes chunked uploads that were abandoned or never attached to a submission"
+
+    def handle(self, *args, **options):
+        stale = UploadSession.objects.filter(status__in=[UploadStatus.PENDING.value, UploadStatus.COMPLETED.value],
+                                             last_modified__lt=timezone.now() - settings.UPLOAD_SESSION_TTL)
+        count = 0
+        for upload in stale.iterator():
+            upload.discard()
+            count += 1
+        self.stdout.write(f"purged {count} upload sessions")
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.1 on 2026-10-18 18:56
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_modified', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('file_name', models.CharField(max_length=1000)),
+                ('file_size', models.BigIntegerField()),
+                ('received', models.BigIntegerField(default=0)),
+                ('checksum', models.CharField(blank=True, max_length=64, null=True)),
+                ('file', models.FileField(blank=True, default=None, max_length=1000, null=True, upload_to='uploads/')),
+                ('status', models.CharField(choices=[('Pending', 'Pending'), ('Completed', 'Completed'), ('Attached', 'Attached')], default='Pending', max_length=20)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'last_modified'], name='upload_status_modified_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,114 @@
+import hashlib
+import logging
+import os
+import shutil
+import uuid
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils.text import get_valid_filename
+
+from User_Management.models import DateTimeModel, User
+from Utilities.Enums import UploadStatus
+
+logger = logging.getLogger(__name__)
+
+
+class UploadSession(DateTimeModel):
+    """This Model tracks a file uploaded in chunks to local disk before a submission references it"""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="upload_sessions")
+    file_name = models.CharField(max_length=1000)
+    file_size = models.BigIntegerField()
+    received = models.BigIntegerField(default=0)
+    checksum = models.CharField(max_length=64, null=True, blank=True)
+    file = models.FileField(upload_to="uploads/", max_length=1000, default=None, null=True, blank=True)
+    status = models.CharField(max_length=20, choices=UploadStatus.choices, default=UploadStatus.PENDING.value)
+
+    copy_buffer_size = 1024 * 1024
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "last_modified"], name="upload_status_modified_idx"),
+        ]
+
+    @property
+    def part_path(self):
+        return os.path.join(settings.MEDIA_ROOT, "uploads", "partial", f"{self.id}.part")
+
+    def write_chunk(self, offset, stream, length):
+        """This function writes up to length bytes of the stream at the given offset and returns the new size"""
+        os.makedirs(os.path.dirname(self.part_path), exist_ok=True)
+        with open(self.part_path, "r+b" if os.path.exists(self.part_path) else "wb") as part:
+            part.seek(offset)
+            remaining = length
+            while remaining > 0:
+                data = stream.read(min(self.copy_buffer_size, remaining))
+                if not data:
+                    break
+                part.write(data)
+                remaining -= len(data)
+            part.truncate()
+            return part.tell()
+
+    def compute_checksum(self):
+        """This function returns the sha256 hex digest of the received bytes"""
+        digest = hashlib.sha256()
+        with open(self.part_path, "rb") as part:
+            for block in iter(lambda: part.read(self.copy_buffer_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def complete(self, checksum):
+        """This function marks the upload completed and moves the received file under MEDIA_ROOT/uploads/<id>/
+
+        The file is moved once the transaction commits, so a rollback leaves it where the pending upload
+        resumes from. When the move fails the error is logged and the upload goes back to pending, the
+        commit having already succeeded.
+        """
+        name = f"uploads/{self.id}/{get_valid_filename(os.path.basename(self.file_name)) or 'file'}"
+        self.file.name = name
+        self.checksum = checksum
+        self.status = UploadStatus.COMPLETED.value
+        self.save(update_fields=["file", "checksum", "status", "last_modified"])
+        transaction.on_commit(lambda: self.__move_received_file(name))
+
+    def __move_received_file(self, name):
+        path = os.path.join(settings.MEDIA_ROOT, name)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(self.part_path, path)
+        except OSError:
+            logger.exception("moving the received file of upload %s failed, back to pending", self.pk)
+            UploadSession.objects.filter(pk=self.pk).update(status=UploadStatus.PENDING.value, file=None,
+                                                            checksum=None)
+
+    def restart(self):
+        """This function drops the received bytes so the client uploads the file again"""
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+        self.received = 0
+        self.save(update_fields=["received", "last_modified"])
+
+    def discard(self):
+        """This function deletes the upload and whatever it stored on disk"""
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+        if self.file:
+            shutil.rmtree(os.path.dirname(self.file.path), ignore_errors=True)
+        self.delete()
+
+    @classmethod
+    def attach(cls, owner, upload_ids):
+        """This function marks the completed uploads of the owner attached and returns them by id
+
+        Nothing is attached and None is returned when one of the ids is not a completed upload of the owner.
+        """
+        upload_ids = set(upload_ids)
+        uploads = cls.objects.select_for_update().filter(id__in=upload_ids, owner=owner,
+                                                         status=UploadStatus.COMPLETED.value).in_bulk()
+        if len(uploads) != len(upload_ids):
+            return None
+        cls.objects.filter(id__in=upload_ids).update(status=UploadStatus.ATTACHED.value)
+        return uploads
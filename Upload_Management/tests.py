@@ -0,0 +1,173 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase, RequestFactory, override_settings
+from rest_framework.test import APIClient
+
+from Upload_Management.Views import MediaView
+from Upload_Management.models import UploadSession
+from User_Management.models import User
+from Utilities.Enums import UserType, UploadStatus
+
+
+class UploadSessionTest(TestCase):
+    """Chunked uploads resume from the received offset and only move the file once finalized and committed"""
+
+    content = bytes(range(256)) * 40
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.supplier = User.objects.create(email="supplier@test.com", password="pw",
+                                           usertype=UserType.SUPPLIER.value, verified=True)
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media_settings = override_settings(MEDIA_ROOT=self.media_root, UPLOAD_CHUNK_SIZE=4096)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        self.client = APIClient()
+        self.client.force_authenticate(self.supplier)
+
+    def start(self):
+        response = self.client.post("/uploads/", {"file_name": "kick.wav", "file_size": len(self.content)},
+                                    format="json")
+        self.assertEqual(response.status_code, 201)
+        return response.data["detail"]["upload_id"]
+
+    def put_chunk(self, upload_id, offset, size):
+        return self.client.put(f"/uploads/chunk?upload_id={upload_id}&offset={offset}",
+                               self.content[offset:offset + size], content_type="application/octet-stream")
+
+    def finalize(self, upload_id, content=None):
+        checksum = hashlib.sha256(self.content if content is None else content).hexdigest()
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post("/uploads/finalize", {"upload_id": upload_id, "checksum": checksum},
+                                    format="json")
+
+    def test_resumes_from_the_received_offset_and_completes(self):
+        upload_id = self.start()
+        self.assertEqual(self.put_chunk(upload_id, 0, 4096).data["detail"]["received"], 4096)
+
+        response = self.put_chunk(upload_id, 8192, 4096)
+        self.assertEqual((response.status_code, response.data["received"]), (409, 4096))
+
+        self.assertEqual(self.client.get(f"/uploads/?upload_id={upload_id}").data["detail"]["received"], 4096)
+        self.put_chunk(upload_id, 4096, 4096)
+        self.assertEqual(self.put_chunk(upload_id, 8192, 4096).data["detail"]["received"], len(self.content))
+
+        response = self.finalize(upload_id)
+        self.assertEqual(response.status_code, 200)
+        upload = UploadSession.objects.get(pk=upload_id)
+        self.assertEqual(upload.status, UploadStatus.COMPLETED.value)
+        self.assertFalse(os.path.exists(upload.part_path))
+        with open(upload.file.path, "rb") as completed:
+            self.assertEqual(completed.read(), self.content)
+
+    def test_checksum_mismatch_restarts_the_upload(self):
+        upload_id = self.start()
+        for offset in range(0, len(self.content), 4096):
+            self.put_chunk(upload_id, offset, 4096)
+
+        response = self.finalize(upload_id, content=b"other bytes")
+        self.assertEqual(response.status_code, 400)
+        upload = UploadSession.objects.get(pk=upload_id)
+        self.assertEqual((upload.status, upload.received), (UploadStatus.PENDING.value, 0))
+        self.assertFalse(os.path.exists(upload.part_path))
+
+    def test_rolled_back_completion_keeps_the_partial_file(self):
+        upload_id = self.start()
+        for offset in range(0, len(self.content), 4096):
+            self.put_chunk(upload_id, offset, 4096)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                UploadSession.objects.get(pk=upload_id).complete("0" * 64)
+                transaction.set_rollback(True)
+        self.assertEqual(callbacks, [])
+
+        upload = UploadSession.objects.get(pk=upload_id)
+        self.assertEqual(upload.status, UploadStatus.PENDING.value)
+        self.assertTrue(os.path.exists(upload.part_path))
+
+    def test_chunk_written_while_hashing_fails_the_finalize(self):
+        upload_id = self.start()
+        for offset in range(0, len(self.content), 4096):
+            self.put_chunk(upload_id, offset, 4096)
+
+        compute_checksum = UploadSession.compute_checksum
+
+        def rewrite_first_chunk(upload):
+            self.put_chunk(upload_id, 0, 4096)
+            return compute_checksum(upload)
+
+        with mock.patch.object(UploadSession, "compute_checksum", rewrite_first_chunk):
+            response = self.finalize(upload_id)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(UploadSession.objects.get(pk=upload_id).status, UploadStatus.PENDING.value)
+
+    def test_failed_move_goes_back_to_pending_after_the_commit(self):
+        upload_id = self.start()
+        for offset in range(0, len(self.content), 4096):
+            self.put_chunk(upload_id, offset, 4096)
+
+        with mock.patch("Upload_Management.models.os.replace", side_effect=OSError), \
+                self.assertLogs("Upload_Management.models", "ERROR"):
+            response = self.finalize(upload_id)
+        self.assertEqual(response.status_code, 200)
+        upload = UploadSession.objects.get(pk=upload_id)
+        self.assertEqual((upload.status, upload.file.name), (UploadStatus.PENDING.value, None))
+        self.assertTrue(os.path.exists(upload.part_path))
+
+
+class MediaViewTest(TestCase):
+    """Only public media files are served, whatever spelling of their path is requested"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.supplier = User.objects.create(email="supplier@test.com", password="pw",
+                                           usertype=UserType.SUPPLIER.value, verified=True)
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media_settings = override_settings(MEDIA_ROOT=self.media_root, MEDIA_DELIVERY="django")
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        self.factory = RequestFactory()
+
+    def write(self, name, content=b"0123456789"):
+        path = os.path.join(self.media_root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as media_file:
+            media_file.write(content)
+
+    def get(self, path, **headers):
+        return MediaView.as_view()(self.factory.get(f"/media/{path}", **headers), path=path)
+
+    def test_serves_public_files_and_ranges(self):
+        self.write("audio-files/kick.wav")
+        response = self.get("audio-files/kick.wav")
+        self.assertEqual((response.status_code, b"".join(response.streaming_content)), (200, b"0123456789"))
+        response = self.get("audio-files/kick.wav", HTTP_RANGE="bytes=2-4")
+        self.assertEqual((response.status_code, b"".join(response.streaming_content)), (206, b"234"))
+
+    def test_private_directories_cannot_be_reached(self):
+        self.write("uploads/partial/upload.part")
+        self.write("contracts/contract.pdf")
+        for path in ("uploads/partial/upload.part", "uploads/./partial/upload.part", "uploads//partial/upload.part",
+                     "audio-files/../uploads/partial/upload.part", "contracts/contract.pdf", "./contracts/contract.pdf"):
+            with self.subTest(path=path):
+                self.assertEqual(self.get(path).status_code, 404)
+
+    def test_uploads_are_served_once_attached(self):
+        upload = UploadSession.objects.create(owner=self.supplier, file_name="kick.wav", file_size=10,
+                                              file="uploads/1/kick.wav", status=UploadStatus.COMPLETED.value)
+        self.write("uploads/1/kick.wav")
+        self.assertEqual(self.get("uploads//1/kick.wav").status_code, 404)
+        UploadSession.objects.filter(pk=upload.pk).update(status=UploadStatus.ATTACHED.value)
+        self.assertEqual(self.get("uploads/1/kick.wav").status_code, 200)
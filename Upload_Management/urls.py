@@ -0,0 +1,10 @@
+from django.urls import path
+
+from Upload_Management.Views import UploadSessionsView, UploadChunkView, FinalizeUploadView
+
+urlpatterns = [
+    # Chunked uploads
+    path("", UploadSessionsView.as_view()),
+    path("chunk", UploadChunkView.as_view()),
+    path("finalize", FinalizeUploadView.as_view()),
+]
@@ -85,11 +85,7 @@ class VerifyTokenSerializer(serializers.Serializer):
 
         user = jwt_auth.get_user(validated_token)
 
-        if (
-                not user.auth_token
-        ) or (
-                not all([user.is_active, (not user.is_deleted), user.auth_token == str(validated_token)])
-        ):
+        if not user.has_valid_token(validated_token):
             raise serializers.ValidationError("token is invalid or expired")
 
         return attrs
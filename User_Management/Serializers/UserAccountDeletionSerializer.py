@@ -3,6 +3,7 @@ from datetime import datetime
 from django.db import transaction
 from rest_framework import serializers
 
+from User_Management.models import User
 from Utilities import generate_otp
 from Utilities.EmailsHandler import EmailsHandler
 from Utilities.Validators.EmailValidator import EmailValidator
@@ -82,11 +83,12 @@ class UserVerifyAccountDeletionOTPSerializer(serializers.Serializer):
 
     def update(self, instance, validated_data):
         with transaction.atomic():
+            instance = User.objects.select_for_update().get(pk=instance.pk)
             instance.is_deleted = True
             instance.is_active = False
             instance.deleted_at = datetime.now()
             instance.save(
                 update_fields=["is_deleted", "is_active", "deleted_at"]
             )
-            instance.save()
+            instance.revoke_tokens()
         return instance
@@ -67,9 +67,10 @@ class UserPasswordSerializer(serializers.ModelSerializer):
 
     def update(self, instance, validated_data):
         with transaction.atomic():
-            new_password = validated_data.pop("new_password")
-            validated_data["password"] = make_password(new_password)
-            super().update(instance=instance, validated_data=validated_data)
+            instance = User.objects.select_for_update().get(pk=instance.pk)
+            instance.password = make_password(validated_data.pop("new_password"))
+            instance.save(update_fields=["password"])
+            instance.revoke_tokens()
             EmailsHandler(to_user=instance).set_update_email(update="Password").send()
             return instance
 
@@ -117,7 +118,9 @@ class UserResetPasswordSerializer(serializers.ModelSerializer):
         new_password = validated_data.pop("new_password")
 
         with transaction.atomic():
-            validated_data["password"] = make_password(new_password)
-            super().update(instance=instance, validated_data=validated_data)
+            instance = User.objects.select_for_update().get(pk=instance.pk)
+            instance.password = make_password(new_password)
+            instance.save(update_fields=["password"])
+            instance.revoke_tokens()
             EmailsHandler(to_user=instance).set_update_email(update="Password").send()
             return instance
@@ -40,9 +40,6 @@ class LoginView(APIView):
         if user:
             token = generate_token(user)
 
-            user.auth_token = token
-            user.save(update_fields=["auth_token"])
-
             user_details = user.get_user_details()
 
             details = {
@@ -32,8 +32,7 @@ class LogoutView(APIView):
     def get(request):
         """This function logout the current User."""
         if request.user.usertype in UserType.list():
-            request.user.auth_token = None
-            request.user.save(update_fields=["auth_token"])
+            request.user.revoke_tokens()
             return Response(
                 {"detail": "user logged out successfully!"}, status=status.HTTP_200_OK
             )
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class UserManagementConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "User_Management"
+
+    def ready(self):
+        from User_Management import signals  # noqa: F401
@@ -0,0 +1,10 @@
+from django.conf import settings
+
+from User_Management.models import User, ReviewerLoad
+from Utilities.ReviewerAssignment import ReviewerPool
+from Utilities.UserSnapshotCache import UserSnapshotCache
+
+user_snapshots = UserSnapshotCache("auth", User, ttl=settings.AUTH_USER_CACHE_TTL)
+
+reviewer_pool = ReviewerPool(ReviewerLoad.staff_loads, ReviewerLoad.recount,
+                             capacity=settings.REVIEWER_MAX_OPEN_SUBMISSIONS)
@@ -0,0 +1,56 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from Beats_Management.synthetic import beat_catalog
+from Product_Management.synthetic import pack_catalog
+from User_Management.models import User
+from User_Management.synthetic import generate_users, refresh_reviewer_loads
+
+
+class Command(BaseCommand):
+    help = "Fills the database with a synthetic catalog of users, packs, beats, likes and downloads for benchmarks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--prefix", default="synthetic", help="prefix of the generated emails and usernames")
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--suppliers", type=int, default=2000)
+        parser.add_argument("--members", type=int, default=20000)
+        parser.add_argument("--staff", type=int, default=20)
+        parser.add_argument("--packs", type=int, default=4000)
+        parser.add_argument("--beats", type=int, default=1000)
+        parser.add_argument("--files-per-product", type=int, default=25)
+        parser.add_argument("--likes", type=int, default=2000000, help="likes over packs and beats together")
+        parser.add_argument("--downloads", type=int, default=500000,
+                            help="downloads over packs and beats together")
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def log(self, message):
+        self.stdout.write(f"[{time.monotonic() - self.started:8.1f}s] {message}")
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"]
+        if User.objects.filter(email__startswith=f"{prefix}-").exists():
+            raise CommandError(f"a catalog with the prefix {prefix!r} was already generated, use another --prefix")
+        if min(options["suppliers"], options["members"], options["files_per_product"]) < 1:
+            raise CommandError("--suppliers, --members and --files-per-product must be at least 1")
+
+        self.started = time.monotonic()
+        rng = random.Random(options["seed"])
+        products = options["packs"] + options["beats"] or 1
+        with transaction.atomic():
+            suppliers, members, staff = generate_users(prefix, rng, options["suppliers"], options["members"],
+                                                       options["staff"], options["batch_size"])
+            self.log(f"{len(suppliers)} suppliers, {len(members)} members and {len(staff)} staff generated")
+            created = {}
+            for catalog, count in ((pack_catalog, options["packs"]), (beat_catalog, options["beats"])):
+                created.update(catalog.generate(
+                    rng, suppliers, members, staff, count, options["files_per_product"],
+                    options["likes"] * count // products, options["downloads"] * count // products,
+                    batch_size=options["batch_size"], log=self.log))
+            refresh_reviewer_loads(staff)
+        for model, rows in created.items():
+            self.stdout.write(f"{model}: {rows}")
+        self.log(f"done, the users log in with the password {prefix!r}")
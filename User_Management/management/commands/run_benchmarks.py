@@ -0,0 +1,113 @@
+import json
+import logging
+import platform
+import subprocess
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from Beats_Management.models import BeatCatalogCard
+from Product_Management.models import PackCatalogCard
+from User_Management.models import User
+from Utilities.EndpointBenchmark import EndpointBenchmark
+from Utilities.Enums import UserType
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=settings.BASE_DIR).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def busiest_user(usertype, related):
+    return User.objects.filter(usertype=usertype).annotate(rows=Count(related)).order_by("-rows", "id").first()
+
+
+class Command(BaseCommand):
+    help = "Benchmarks the main endpoints against the current database and prints the results as JSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=30, help="measured requests per endpoint")
+        parser.add_argument("--warmup", type=int, default=3, help="unmeasured requests per endpoint")
+        parser.add_argument("--only", help="comma separated names of the endpoints to run, all by default")
+        parser.add_argument("--output", help="file the JSON report is written to, stdout by default")
+
+    def endpoints(self):
+        member = busiest_user(UserType.MEMBER.value, "likes")
+        supplier = busiest_user(UserType.SUPPLIER.value, "packs_submissions")
+        staff = busiest_user(UserType.STAFF.value, "packs_review")
+        pack = PackCatalogCard.objects.order_by("-files_count", "id").first()
+        beat = BeatCatalogCard.objects.order_by("-files_count", "id").first()
+        if None in (member, supplier, staff, pack, beat):
+            raise CommandError("the database holds no catalog, run generate_synthetic_catalog first")
+
+        pack_detail = {"id": pack.submission_id, "pack_type": pack.pack_type}
+        beat_detail = {"id": beat.submission_id, "beat_type": beat.beat_type}
+        return [
+            ("packs.discover", member, "/app/explore/discover", {"pack_type": pack.pack_type}),
+            ("packs.samples", member, "/app/products/samples", None),
+            ("packs.view-pack", member, "/app/products/view-pack", pack_detail),
+            ("packs.view-pack-files", member, "/app/products/view-pack/audio-files",
+             {**pack_detail, "sort": "likes", "order": "desc"}),
+            ("packs.search-files", member, "/app/search/files", None),
+            ("packs.view-likes", member, "/app/mylibrary/likes/view-likes", {"product_type": pack.pack_type}),
+            ("packs.downloads", member, "/app/mylibrary/downloads/view", {"product_type": pack.pack_type}),
+            ("packs.submissions", supplier, "/app/view-packs/", {"pack_type": pack.pack_type}),
+            ("packs.review-queue", staff, "/app/review-queue/", None),
+            ("beats.discover", member, "/beatsapi/explore/discover", {"beat_type": beat.beat_type}),
+            ("beats.beats", member, "/beatsapi/beats/beats", None),
+            ("beats.view-beat", member, "/beatsapi/beats/view-beats", beat_detail),
+            ("beats.view-beat-files", member, "/beatsapi/beats/view-beats/audio-files",
+             {**beat_detail, "sort": "likes", "order": "desc"}),
+            ("beats.search-files", member, "/beatsapi/search/files", None),
+            ("beats.view-likes", member, "/beatsapi/mylibrary/likes/view-likes", {"product_type": beat.beat_type}),
+            ("beats.downloads", member, "/beatsapi/mylibrary/downloads/view", {"product_type": beat.beat_type}),
+            ("beats.submissions", supplier, "/beatsapi/view-beats/", {"beat_type": beat.beat_type}),
+            ("beats.review-queue", staff, "/beatsapi/review-queue/", None),
+        ]
+
+    def handle(self, *args, **options):
+        only = set(options["only"].split(",")) if options["only"] else None
+        benchmark = EndpointBenchmark(repeat=options["repeat"], warmup=options["warmup"])
+        setup_test_environment()
+        # errors and slow requests show up in the report, not as log noise between the results
+        logging.disable(logging.ERROR)
+        try:
+            for name, user, path, params in self.endpoints():
+                if only and name not in only:
+                    continue
+                client = APIClient(raise_request_exception=False)
+                client.force_authenticate(user)
+                result = benchmark.measure(name, client, path, params)
+                self.stderr.write(f"{name}: p50 {result['p50_ms']}ms, p95 {result['p95_ms']}ms, "
+                                  f"{result['queries']} queries, statuses {result['statuses']}")
+        finally:
+            logging.disable(logging.NOTSET)
+            teardown_test_environment()
+
+        report = {
+            "commit": git_commit(),
+            "created_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "users": User.objects.count(),
+            "approved_packs": PackCatalogCard.objects.count(),
+            "approved_beats": BeatCatalogCard.objects.count(),
+            "repeat": options["repeat"],
+            "endpoints": benchmark.results,
+        }
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                file.write(output + "\n")
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.1 on 2026-10-18 19:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('User_Management', '0002_rename_city_member_city_or_state_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='user',
+            name='auth_token',
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
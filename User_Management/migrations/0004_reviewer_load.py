@@ -0,0 +1,47 @@
+# Generated by Django 4.2.1 on 2026-10-18 19:12
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+OPEN_STATUSES = ["Uploaded", "Process", "Submitted"]
+
+
+def count_open_submissions(apps, schema_editor):
+    """Fills the reviewer loads with the open submissions already assigned to each staff member"""
+    ReviewerLoad = apps.get_model("User_Management", "ReviewerLoad")
+    counts = {}
+    for app_label, model_name, field in (("Product_Management", "PackSubmissions", "open_packs"),
+                                         ("Beats_Management", "BeatsSubmissions", "open_beats")):
+        model = apps.get_model(app_label, model_name)
+        open_counts = model.objects.filter(approval_person__isnull=False, status__in=OPEN_STATUSES). \
+            values("approval_person_id").annotate(count=models.Count("id"))
+        for row in open_counts:
+            counts.setdefault(row["approval_person_id"], {})[field] = row["count"]
+    ReviewerLoad.objects.bulk_create([ReviewerLoad(staff_id=staff_id, **fields) for staff_id, fields in counts.items()])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('User_Management', '0003_token_version'),
+        ('Beats_Management', '0009_library_constraints'),
+        ('Product_Management', '0008_library_constraints'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewerLoad',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_modified', models.DateTimeField(auto_now=True)),
+                ('staff', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='review_load', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('open_packs', models.PositiveIntegerField(default=0)),
+                ('open_beats', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(count_open_submissions, migrations.RunPython.noop),
+    ]
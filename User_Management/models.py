@@ -1,10 +1,13 @@
+from django.apps import apps
 from django.contrib.auth.models import AbstractBaseUser
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count
 
 from User_Management.Managers.UserManager import UserManager
 from Utilities.Enums.PrimaryDAW import PrimaryDAW
 from Utilities.Enums.PrimaryTalents import PrimaryTalents
 from Utilities.Enums.RequestStatus import RequestStatus
+from Utilities.Enums.SubmissionStatus import SubmissionStatus
 from Utilities.Enums.UserTypes import UserType
 
 
@@ -33,7 +36,7 @@ class User(AbstractBaseUser, DateTimeModel, SoftDelete):
 
     email = models.EmailField(max_length=255, unique=True)
 
-    auth_token = models.CharField(max_length=1000, null=True, blank=True)
+    token_version = models.PositiveIntegerField(default=0)
     profile_picture = models.ImageField(
         upload_to="profile_pics/", max_length=1000, default=None, null=True, blank=True
     )
@@ -46,6 +49,7 @@ class User(AbstractBaseUser, DateTimeModel, SoftDelete):
     objects = UserManager()
 
     USERNAME_FIELD = "email"
+    TOKEN_VERSION_CLAIM = "token_version"
 
     @property
     def is_staff(self):
@@ -67,6 +71,18 @@ class User(AbstractBaseUser, DateTimeModel, SoftDelete):
         """Is the user a member?"""
         return self.usertype == UserType.MEMBER.value
 
+    def has_valid_token(self, validated_token):
+        """Is the token issued for the current token version of an active user?"""
+        return all([self.is_active, (not self.is_deleted),
+                    validated_token.get(self.TOKEN_VERSION_CLAIM) == self.token_version])
+
+    def revoke_tokens(self):
+        """Invalidates every token issued to the user so far"""
+        with transaction.atomic():
+            token_version = User.objects.select_for_update().values_list("token_version", flat=True).get(pk=self.pk)
+            self.token_version = token_version + 1
+            self.save(update_fields=["token_version"])
+
     def get_user_details(self):
         if UserType.is_admin_or_staff(self.usertype):
             return (
@@ -81,6 +97,17 @@ class User(AbstractBaseUser, DateTimeModel, SoftDelete):
         elif UserType.is_member(self.usertype):
             return self.member_details if hasattr(self, "member_details") else None
 
+    def get_artist_name(self):
+        """Name shown as the artist of the products this user submits"""
+        details = self.get_user_details()
+        if details is None:
+            return ""
+        if self.is_admin:
+            return details.name
+        if self.is_supplier:
+            return details.artist.name
+        return ""
+
 
 class AdminOrStaff(models.Model):
     admin_user = models.OneToOneField(
@@ -157,3 +184,44 @@ class Member(models.Model):
     city_or_state = models.CharField(max_length=255)
     description = models.CharField(max_length=1000)
     username = models.CharField(max_length=255, unique=True)
+
+
+class ReviewerLoad(DateTimeModel):
+    """This Model keeps the number of open pack and beat submissions assigned to each staff member"""
+
+    staff = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="review_load")
+    open_packs = models.PositiveIntegerField(default=0)
+    open_beats = models.PositiveIntegerField(default=0)
+
+    OPEN_STATUSES = [SubmissionStatus.UPLOADED.value, SubmissionStatus.PROCESS.value,
+                     SubmissionStatus.SUBMITTED.value]
+
+    @property
+    def open_submissions(self):
+        return self.open_packs + self.open_beats
+
+    @staticmethod
+    def __open_counts(model, staff_ids):
+        return dict(model.objects.filter(approval_person_id__in=staff_ids, status__in=ReviewerLoad.OPEN_STATUSES).
+                    values("approval_person_id").annotate(count=Count("id")).
+                    values_list("approval_person_id", "count"))
+
+    @classmethod
+    def recount(cls, staff_ids):
+        """This function recounts the open submissions of the staff and returns {staff id: open submissions}"""
+        staff_ids = list(set(staff_ids))
+        packs = cls.__open_counts(apps.get_model("Product_Management", "PackSubmissions"), staff_ids)
+        beats = cls.__open_counts(apps.get_model("Beats_Management", "BeatsSubmissions"), staff_ids)
+        loads = {}
+        for staff_id in staff_ids:
+            load, _ = cls.objects.update_or_create(staff_id=staff_id, defaults={
+                "open_packs": packs.get(staff_id, 0), "open_beats": beats.get(staff_id, 0)})
+            loads[staff_id] = load.open_submissions
+        return loads
+
+    @staticmethod
+    def staff_loads():
+        """This function returns the (staff id, open submissions) of every active staff member"""
+        staff = User.objects.filter(usertype=UserType.STAFF.value, is_active=True, is_deleted=False). \
+            values_list("id", "review_load__open_packs", "review_load__open_beats")
+        return [(staff_id, (packs or 0) + (beats or 0)) for staff_id, packs, beats in staff]
@@ -0,0 +1,16 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from User_Management.caches import user_snapshots, reviewer_pool
+from User_Management.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_snapshot(sender, instance, **kwargs):
+    transaction.on_commit(partial(user_snapshots.invalidate, instance.pk))
+    if instance.is_staff:
+        transaction.on_commit(reviewer_pool.invalidate)
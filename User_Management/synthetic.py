@@ -0,0 +1,50 @@
+from django.contrib.auth.hashers import make_password
+
+from User_Management.caches import reviewer_pool
+from User_Management.models import User, AdminOrStaff, MusicContentInformation, Artist, Supplier, Member, \
+    ReviewerLoad
+from Utilities.Enums import UserType
+from Utilities.Enums.PrimaryDAW import PrimaryDAW
+from Utilities.Enums.PrimaryTalents import PrimaryTalents
+from Utilities.SyntheticCatalog import bulk_insert
+
+
+def generate_users(prefix, rng, suppliers, members, staff, batch_size=2000):
+    """This function generates verified users of every type, whose password is their prefix
+
+    Returns the list of (supplier id, artist name), the member ids and the staff ids.
+    """
+    password = make_password(prefix)
+
+    def users(usertype, count):
+        return bulk_insert(User, [User(email=f"{prefix}-{usertype.lower()}-{index}@example.com", password=password,
+                                       usertype=usertype, verified=True) for index in range(count)], batch_size)
+
+    staff_users = users(UserType.STAFF.value, staff)
+    bulk_insert(AdminOrStaff, [AdminOrStaff(admin_user=user, name=f"Staff {index}", username=f"{prefix}-staff-{index}")
+                               for index, user in enumerate(staff_users)], batch_size)
+
+    supplier_users = users(UserType.SUPPLIER.value, suppliers)
+    content_info = bulk_insert(MusicContentInformation, [
+        MusicContentInformation(talent=rng.choice(PrimaryTalents.list()), daw=rng.choice(PrimaryDAW.list()))
+        for _ in supplier_users], batch_size)
+    artists = bulk_insert(Artist, [Artist(name=f"Artist {index}", complete_residence_address=f"{index} Main Street",
+                                          major_city="City", country_or_state="Country", bio="Synthetic artist",
+                                          content_info=info) for index, info in enumerate(content_info)], batch_size)
+    bulk_insert(Supplier, [Supplier(supplier_user=user, first_name=f"Supplier {index}", last_name="Synthetic",
+                                    username=f"{prefix}-supplier-{index}", artist=artist)
+                           for index, (user, artist) in enumerate(zip(supplier_users, artists))], batch_size)
+
+    member_users = users(UserType.MEMBER.value, members)
+    bulk_insert(Member, [Member(member_user=user, name=f"Member {index}", country="Country", city_or_state="City",
+                                description="Synthetic member", username=f"{prefix}-member-{index}")
+                         for index, user in enumerate(member_users)], batch_size)
+
+    return ([(user.id, artist.name) for user, artist in zip(supplier_users, artists)],
+            [user.id for user in member_users], [user.id for user in staff_users])
+
+
+def refresh_reviewer_loads(staff_ids):
+    """This function recounts the open submissions of the generated staff and reloads the reviewer pool"""
+    ReviewerLoad.recount(staff_ids)
+    reviewer_pool.invalidate()
@@ -1,3 +1,69 @@
+import random
+
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from User_Management.models import User, AdminOrStaff, Supplier, Requests
+from User_Management.synthetic import generate_users
+from Utilities import generate_token
+from Utilities.Enums import UserType, RequestStatus
+from Utilities.QueryCountRegression import QueryCountRegressionMixin
+
+
+class UserRoutesQueryCountTest(QueryCountRegressionMixin, TestCase):
+    """Every GET route of the users app runs as many queries with many users as with a few"""
+
+    urlconf = "User_Management.urls"
+    prefix = "/"
+    routes = {
+        "members/": ("admin", None),
+        "member/": ("admin", lambda fixture: {"member_id": fixture["member"].id}),
+        "staffs/": ("admin", None),
+        "staff/": ("admin", lambda fixture: {"staff_id": fixture["staff"].id}),
+        "supplier/details/": ("admin", lambda fixture: {"email": fixture["supplier"].supplier_user.email,
+                                                        "username": fixture["supplier"].username}),
+        "supplier/status/": ("admin", lambda fixture: {"hidden": "false", "status": RequestStatus.APPLIED.value}),
+        "user/profile/": ("supplier_user", None),
+        "user/logout/": ("member", None),
+    }
+
+    def seed(self, size):
+        """This function generates size suppliers with an application, size members and size staff members"""
+        suppliers, members, staff = generate_users("routes", random.Random(size), suppliers=size, members=size,
+                                                   staff=size)
+        Requests.objects.bulk_create(Requests(supplier_id=supplier_id, status=RequestStatus.APPLIED.value)
+                                     for supplier_id, _ in suppliers)
+        admin = User.objects.create(email="admin@test.com", password="pw", usertype=UserType.ADMIN.value,
+                                    verified=True)
+        AdminOrStaff.objects.create(admin_user=admin, name="Admin", username="routes-admin")
+        supplier = Supplier.objects.select_related("supplier_user").get(pk=suppliers[0][0])
+        return {
+            "admin": admin,
+            "member": User.objects.get(pk=members[0]),
+            "staff": User.objects.get(pk=staff[0]),
+            "supplier": supplier,
+            "supplier_user": supplier.supplier_user,
+        }
+
+
+class TokenRevocationTest(TestCase):
+    """Tokens issued before a password change are rejected afterwards"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create(email="member@test.com", password="old-password",
+                                         usertype=UserType.MEMBER.value, verified=True)
+
+    def test_password_change_revokes_the_old_token(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_token(self.member)}")
+        self.assertEqual(client.get("/user/profile/").status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.put("/user/password/", {"old_password": "old-password", "new_password": "new-password",
+                                                      "confirm_password": "new-password"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(client.get("/user/profile/").status_code, 401)
 
-# Create your tests here.
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_token(User.objects.get(pk=self.member.pk))}")
+        self.assertEqual(client.get("/user/profile/").status_code, 200)
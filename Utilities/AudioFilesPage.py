@@ -0,0 +1,24 @@
+from Utilities.CursorPagination import CursorPaginator
+from Utilities.FacetIndex import FacetIndex
+
+
+def audio_files_page(request, audio_files, facet_fields: dict):
+    """This function returns a page of the audio files, sorted and filtered as requested, and the next cursor
+
+    ``sort`` is one of the ``sort_keys`` of the queryset and ``order`` is asc or desc. The facets take comma
+    separated values, like the audio files search. Raises ValueError when a parameter is invalid.
+    """
+    sort = request.GET.get("sort", "name")
+    order = request.GET.get("order", "asc")
+    if sort not in audio_files.sort_keys or order not in ("asc", "desc"):
+        raise ValueError("invalid sort.")
+    filters = {facet: [value for values in request.GET.getlist(facet) for value in values.split(",") if value]
+               for facet in FacetIndex.facets}
+    try:
+        bpm_min = int(request.GET["bpm_min"]) if request.GET.get("bpm_min") else None
+        bpm_max = int(request.GET["bpm_max"]) if request.GET.get("bpm_max") else None
+        audio_files = audio_files.matching(facet_fields, filters).bpm_overlaps(bpm_min, bpm_max)
+    except ValueError:
+        raise ValueError("invalid filters.")
+    audio_files = audio_files.with_details().sort_by(sort)
+    return CursorPaginator.from_request(request, audio_files, ascending=order == "asc", key="sort_value").get_page()
@@ -0,0 +1,40 @@
+from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
+
+
+class AudioFilesQuerySet(models.QuerySet):
+    # likes and downloads sort by the counters stored in the database, which CounterBuffer updates every
+    # COUNTER_FLUSH_INTERVAL seconds, so that order is approximate until the pending increments are flushed
+    sort_keys = {
+        "name": Coalesce(F("file__file_name"), Value("")),
+        "bpm": Coalesce(F("bpm__start_value"), Value(0)),
+        "key": Coalesce(F("key__key"), Value("")),
+        "likes": F("likes_count"),
+        "downloads": F("downloads_count"),
+    }
+    detail_fields = ("file", "genre", "sub_genre", "instrument", "sub_instrument", "mood", "bpm", "key")
+
+    def with_details(self):
+        """This function joins the file and the taxonomy rows the audio file serializers read"""
+        return self.select_related(*self.detail_fields)
+
+    def bpm_overlaps(self, bpm_min=None, bpm_max=None):
+        """This function keeps the audio files whose BPM range overlaps [bpm_min, bpm_max]
+
+        Both bounds are optional, it is answered by a range scan on the (start_value, end_value) BPM index.
+        """
+        queryset = self
+        if bpm_max is not None:
+            queryset = queryset.filter(bpm__start_value__lte=bpm_max)
+        if bpm_min is not None:
+            queryset = queryset.filter(bpm__end_value__gte=bpm_min)
+        return queryset
+
+    def matching(self, fields: dict, filters: dict):
+        """This function keeps the audio files carrying one of the given values of every filtered facet"""
+        return self.filter(**{f"{fields[facet]}__in": values for facet, values in filters.items() if values})
+
+    def sort_by(self, sort):
+        """This function annotates the never NULL value of the ``sort_keys`` entry as ``sort_value``"""
+        return self.annotate(sort_value=self.sort_keys[sort])
@@ -0,0 +1,29 @@
+import threading
+
+from django.db import transaction
+
+
+class CommitBatch:
+    """Collects the keys a transaction touches and hands them to ``flush`` once, after it commits.
+
+    Every ``add`` schedules a drain with ``transaction.on_commit``. The first drain after the commit takes
+    all the keys pending in the thread and the later ones find nothing left, so a transaction saving N rows
+    flushes once. Outside a transaction the drain runs immediately. Keys of a rolled back transaction stay
+    pending and go out with the next commit of the thread, so ``flush`` must only re-read its keys.
+    """
+
+    def __init__(self, flush):
+        self.flush = flush
+        self.local = threading.local()
+
+    def add(self, keys):
+        pending = getattr(self.local, "pending", None)
+        if pending is None:
+            pending = self.local.pending = set()
+        pending.update(key for key in keys if key is not None)
+        transaction.on_commit(self.__drain)
+
+    def __drain(self):
+        pending, self.local.pending = getattr(self.local, "pending", None), None
+        if pending:
+            self.flush(pending)
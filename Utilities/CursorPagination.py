@@ -0,0 +1,77 @@
+import json
+from datetime import datetime
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.encoding import force_bytes, smart_str
+from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
+
+
+class CursorPaginator:
+    """Keyset pagination over (key, id), newest first unless ``ascending`` is set.
+
+    ``key`` defaults to ``created_at`` and may be any field or annotation that is never NULL. The
+    cursor is an opaque token holding the (key, id) of the last row of the previous page, so every
+    page is a single range scan no matter how deep it is.
+    """
+
+    default_page_size = 20
+    max_page_size = 100
+
+    def __init__(self, queryset, cursor: str = None, page_size=None, ascending=False, key="created_at"):
+        self.queryset = queryset
+        self.cursor = cursor
+        self.page_size = self.__clean_page_size(page_size)
+        self.ascending = ascending
+        self.key = key
+
+    @classmethod
+    def from_request(cls, request, queryset, ascending=False, key="created_at"):
+        return cls(queryset, cursor=request.GET.get("cursor"), page_size=request.GET.get("page_size"),
+                   ascending=ascending, key=key)
+
+    def __clean_page_size(self, page_size):
+        try:
+            page_size = int(page_size)
+        except (TypeError, ValueError):
+            return self.default_page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    @staticmethod
+    def encode_cursor(value, pk):
+        """This function encodes the position of a row into an opaque cursor"""
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        return urlsafe_base64_encode(force_bytes(json.dumps([value, pk])))
+
+    def decode_cursor(self, cursor: str):
+        """This function decodes a cursor, raises ValueError if it is malformed"""
+        try:
+            value, pk = json.loads(smart_str(urlsafe_base64_decode(cursor)))
+            if self.key == "created_at":
+                value = parse_datetime(value)
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError("invalid cursor.")
+        if value is None or isinstance(value, (list, dict)) or not isinstance(pk, int):
+            raise ValueError("invalid cursor.")
+        return value, pk
+
+    def get_page(self):
+        """This function returns the rows of the requested page and the cursor of the next one"""
+        if self.ascending:
+            queryset = self.queryset.order_by(self.key, "id")
+        else:
+            queryset = self.queryset.order_by(f"-{self.key}", "-id")
+
+        if self.cursor:
+            value, pk = self.decode_cursor(self.cursor)
+            direction = "gt" if self.ascending else "lt"
+            queryset = queryset.filter(Q(**{f"{self.key}__{direction}": value}) |
+                                       Q(**{self.key: value, f"id__{direction}": pk}))
+
+        rows = list(queryset[:self.page_size + 1])
+        next_cursor = None
+        if len(rows) > self.page_size:
+            rows = rows[:self.page_size]
+            next_cursor = self.encode_cursor(getattr(rows[-1], self.key), rows[-1].id)
+        return rows, next_cursor
@@ -0,0 +1,38 @@
+from django.db.models import Count, Min
+
+
+def duplicate_groups(model, fields):
+    """This function returns the values of every group of rows sharing the fields, with the id of its oldest row"""
+    return model.objects.filter(**{f"{field}__isnull": False for field in fields}). \
+        values(*fields).annotate(keep=Min("id"), rows=Count("id")).filter(rows__gt=1).order_by()
+
+
+def delete_duplicates(model, fields, children=(), dry_run=False):
+    """This function keeps the oldest row of every duplicate group and deletes the others
+
+    ``children`` lists the (model, foreign key, unique field) of rows pointing at the deleted rows. They
+    are moved to the kept row, unless it already has a child with the same unique field value. Returns
+    the duplicate groups that were found.
+    """
+    groups = list(duplicate_groups(model, fields))
+    if dry_run:
+        return groups
+
+    for group in groups:
+        extra_ids = list(model.objects.filter(**{field: group[field] for field in fields}).
+                         exclude(id=group["keep"]).values_list("id", flat=True))
+        for child_model, foreign_key, unique_field in children:
+            for extra_id in extra_ids:
+                kept_values = child_model.objects.filter(**{foreign_key: group["keep"]}). \
+                    values_list(unique_field, flat=True)
+                moving = child_model.objects.filter(**{foreign_key: extra_id})
+                moving.filter(**{f"{unique_field}__in": kept_values}).delete()
+                moving.update(**{foreign_key: group["keep"]})
+        model.objects.filter(id__in=extra_ids).delete()
+    return groups
+
+
+def recount(model, ids, field, related_model, related_field):
+    """This function resets the counter field of the given rows to the number of related rows"""
+    for id_ in set(ids):
+        model.objects.filter(id=id_).update(**{field: related_model.objects.filter(**{related_field: id_}).count()})
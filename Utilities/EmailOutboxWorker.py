@@ -0,0 +1,109 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import connection, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxWorker:
+    """Delivers the emails of an outbox table in batches over one reused mail connection.
+
+    ``deliver`` is called by the ``process_email_outbox`` command, which keeps its connection open
+    between batches. With ``EMAIL_OUTBOX_IN_PROCESS`` enabled, ``wake`` also drains the outbox in a
+    background thread of the web process right after the enqueuing transaction commits, and schedules
+    the next drain for when the earliest pending email is due. Failed emails are therefore retried by
+    either, with exponential backoff, and emails leased by a worker that died are picked up again.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.lock = threading.Lock()
+        self.thread = None
+        self.rerun = False
+        self.timer = None
+
+    def enqueue(self, **fields):
+        """This function stores an email in the outbox and wakes the worker once the transaction commits"""
+        email = self.model.objects.create(**fields)
+        transaction.on_commit(self.wake)
+        return email
+
+    def wake(self):
+        if not settings.EMAIL_OUTBOX_IN_PROCESS:
+            return
+        with self.lock:
+            if self.thread is not None:
+                self.rerun = True
+                return
+            self.thread = threading.Thread(target=self.__drain_in_background, daemon=True)
+            self.thread.start()
+
+    def __drain_in_background(self):
+        try:
+            while True:
+                next_due_at = None
+                try:
+                    self.deliver()
+                    next_due_at = self.model.next_due_at()
+                except Exception:
+                    logger.exception("delivering the email outbox failed")
+                    next_due_at = timezone.now()
+                with self.lock:
+                    if not self.rerun:
+                        self.thread = None
+                        self.__schedule(next_due_at)
+                        return
+                    self.rerun = False
+        finally:
+            connection.close()
+
+    def __schedule(self, due_at):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if due_at is None:
+            return
+        delay = max((due_at - timezone.now()).total_seconds(), settings.EMAIL_OUTBOX_POLL_INTERVAL)
+        self.timer = threading.Timer(delay, self.wake)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def deliver(self, mail_connection=None):
+        """This function sends every due email, batch by batch, and returns how many were sent"""
+        batch_size = settings.EMAIL_OUTBOX_BATCH_SIZE
+        own_connection = mail_connection is None
+        mail_connection = mail_connection or get_connection()
+        sent = 0
+        try:
+            while True:
+                batch = self.model.claim_due(batch_size)
+                if not batch:
+                    return sent
+                sent += self.__send_batch(batch, mail_connection)
+                if len(batch) < batch_size:
+                    return sent
+        finally:
+            if own_connection:
+                mail_connection.close()
+
+    def __send_batch(self, batch, mail_connection):
+        sent = 0
+        for email in batch:
+            try:
+                mail_connection.open()
+                mail_connection.send_messages([email.message(mail_connection)])
+            except Exception as error:
+                logger.warning("sending email %s to %s failed: %s", email.pk, email.to, error)
+                email.mark_failed(error)
+                # the server may have dropped the connection, the next email opens a new one
+                mail_connection.close()
+            else:
+                email.mark_sent()
+                sent += 1
+        self.model.objects.bulk_update(batch, ["status", "attempts", "next_attempt_at", "claim", "last_error",
+                                               "sent_at"])
+        return sent
@@ -0,0 +1,50 @@
+import os
+import re
+import threading
+
+PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}|\{(\w+)\}")
+
+
+class CompiledTemplate:
+    """An email template split once into literal text and ``{name}`` / ``{{name}}`` placeholders.
+
+    ``render`` fills every placeholder in a single join. Placeholders without a value are kept as
+    they are written in the template, like the str.replace calls this replaces.
+    """
+
+    def __init__(self, content):
+        self.segments = []
+        position = 0
+        for match in PLACEHOLDER_RE.finditer(content):
+            self.segments.append(content[position:match.start()])
+            self.segments.append((match.group(1) or match.group(2), match.group(0)))
+            position = match.end()
+        self.segments.append(content[position:])
+
+    def render(self, **values):
+        return "".join(segment if isinstance(segment, str) else values.get(segment[0], segment[1])
+                       for segment in self.segments)
+
+
+class EmailTemplateCache:
+    """Compiled email templates of a directory, all loaded when the cache is created"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.templates = {}
+        self.lock = threading.Lock()
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                if name.endswith(".html"):
+                    self.load(name)
+
+    def load(self, name):
+        with open(os.path.join(self.directory, name), "r") as file:
+            template = CompiledTemplate(file.read())
+        with self.lock:
+            self.templates[name] = template
+        return template
+
+    def get(self, name):
+        """This function returns the compiled template, reading it from disk if it was added after startup"""
+        return self.templates.get(name) or self.load(name)
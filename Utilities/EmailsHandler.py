@@ -1,16 +1,17 @@
 import json
 import os
-import smtplib
 from random import randint
 
 from django.contrib.auth.tokens import default_token_generator
-from django.core.exceptions import ValidationError
-from django.core.mail import EmailMessage, BadHeaderError
 from django.utils.encoding import force_bytes, smart_str
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 
+from Email_Management.outbox import email_outbox
 from Soul_Family_Sounds.settings import BASE_DIR
 from User_Management.models import User
+from Utilities.EmailTemplates import EmailTemplateCache
+
+email_templates = EmailTemplateCache(os.path.join(BASE_DIR, "templates/emails"))
 
 
 class EmailsHandler:
@@ -26,33 +27,22 @@ class EmailsHandler:
             self.token = default_token_generator.make_token(self.user)
 
     @staticmethod
-    def __read_template(template_path: str):
-        with open(
-                os.path.join(BASE_DIR, f"templates/emails/{template_path}"), "r"
-        ) as file:
-            html_content = file.read()
-        return html_content
+    def __render_template(template_path: str, **values):
+        return email_templates.get(template_path).render(**values)
 
     @staticmethod
-    def __replace_otp_in_html(content: str, otp: str):
-        for index, new_value in enumerate(otp):
-            placeholder = f"{{otp_{index}}}"
-            content = content.replace(placeholder, new_value)
-        return content
+    def __otp_values(otp: str):
+        return {f"otp_{index}": value for index, value in enumerate(otp)}
 
     @staticmethod
-    def __replace_interview_date_in_html(content: str, date):
+    def __interview_date(date):
         formatted_date = date.strftime("%d")
 
         formatted_day = f"{formatted_date}{'th' if 11 <= int(formatted_date) <= 13 else {1: 'st', 2: 'nd', 3: 'rd'}.get(int(formatted_date) % 10, 'th')}"
 
         formatted_month = date.strftime("%B")
 
-        placeholder = "{{date}}"
-        date = f"{formatted_day} {formatted_month}"
-
-        content = content.replace(placeholder, date)
-        return content
+        return f"{formatted_day} {formatted_month}"
 
     def set_confirmation_email(self, otp: str, email: str, user_details: str):
         """This function sets subject and body of confirmation of email"""
@@ -61,25 +51,24 @@ class EmailsHandler:
         self.token = urlsafe_base64_encode(force_bytes(string))
 
         self.subject = "Verify Your Email - Soul Sounds Family"
-        content = self.__read_template("verify-email-template.html")
-        self.body = self.__replace_otp_in_html(content, otp)
+        self.body = self.__render_template("verify-email-template.html", **self.__otp_values(otp))
 
         return self
 
     def set_welcome_email(self):
         self.subject = "Welcome - Soul Sounds Family"
-        self.body = self.__read_template("welcome-template.html")
+        self.body = self.__render_template("welcome-template.html")
         return self
 
     def set_request_accepted_supplier_email(self, interview_date):
         self.subject = "Congratulations - Soul Sounds Family"
-        content = self.__read_template("supplier-request-accepted-template.html")
-        self.body = self.__replace_interview_date_in_html(content, interview_date)
+        self.body = self.__render_template("supplier-request-accepted-template.html",
+                                           date=self.__interview_date(interview_date))
         return self
 
     def set_supplier_request__email(self):
         self.subject = "Supplier Request - Soul Sounds Family"
-        self.body = self.__read_template("supplier-request-template.html")
+        self.body = self.__render_template("supplier-request-template.html")
         return self
 
     def set_confirmed_email(self):
@@ -105,7 +94,7 @@ class EmailsHandler:
 
     def set_update_email(self, update, email=None):
         """This function sets subject and body of update email"""
-        self.user_email = email
+        self.user_email = email or self.user_email
         self.subject = f"{update} Changed - Soul Sounds Family"
         self.body = (
             f"Your {update.lower()} is changed.\nIf you have not changed, reach us at: "
@@ -120,8 +109,7 @@ class EmailsHandler:
 
         self.token = urlsafe_base64_encode(force_bytes(string))
         self.subject = "Reset Password Email - Soul Sounds Family"
-        content = self.__read_template(f"reset-password-template-{randint(0, 1)}.html")
-        self.body = self.__replace_otp_in_html(content, otp)
+        self.body = self.__render_template(f"reset-password-template-{randint(0, 1)}.html", **self.__otp_values(otp))
 
         return self
 
@@ -131,8 +119,7 @@ class EmailsHandler:
 
         self.token = urlsafe_base64_encode(force_bytes(string))
         self.subject = "Account Deletion Email - Soul Sounds Family"
-        content = self.__read_template(f"account-delete-template.html")
-        self.body = self.__replace_otp_in_html(content, otp)
+        self.body = self.__render_template("account-delete-template.html", **self.__otp_values(otp))
 
         return self
 
@@ -179,20 +166,11 @@ class EmailsHandler:
             return "unknown"
 
     def send(self):
-        """This functions sends the email"""
-        try:
-            email = EmailMessage(
-                from_email=self.email_user,
-                to=[self.user_email],
-                subject=self.subject,
-                body=self.body,
-            )
-            email.content_subtype = "html"
-            email.send(fail_silently=False)
-        except (
-                smtplib.SMTPException
-                or BadHeaderError
-                or smtplib.SMTPAuthenticationError
-                or ValidationError
-        ) as error:
-            raise Exception(f"{error}an error occurred while sending the email!")
+        """This functions queues the email, the outbox worker sends it once the current transaction commits"""
+        email_outbox.enqueue(
+            from_email=self.email_user,
+            to=self.user_email,
+            subject=self.subject,
+            body=self.body,
+            content_subtype="html",
+        )
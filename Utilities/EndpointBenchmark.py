@@ -0,0 +1,62 @@
+import math
+import statistics
+import time
+import tracemalloc
+
+from Utilities.QueryCounter import QueryCounter
+
+
+def percentile(values, percent):
+    """This function returns the nearest-rank percentile of the values"""
+    values = sorted(values)
+    return values[max(0, math.ceil(percent / 100 * len(values)) - 1)]
+
+
+class EndpointBenchmark:
+    """Drives endpoints through a Django test client and measures them.
+
+    Every endpoint is requested ``warmup`` times unmeasured, then ``repeat`` times for the latency
+    percentiles and query counts, then once more under tracemalloc for the peak memory. The memory pass
+    is kept apart because tracing slows the requests down.
+    """
+
+    def __init__(self, repeat=30, warmup=3):
+        self.repeat = repeat
+        self.warmup = warmup
+        self.results = []
+
+    def measure(self, name, client, path, params=None):
+        """This function benchmarks GET requests of the path and returns its result"""
+        for _ in range(self.warmup):
+            client.get(path, params)
+
+        latencies, queries, statuses = [], [], set()
+        for _ in range(self.repeat):
+            with QueryCounter() as counter:
+                start = time.perf_counter()
+                response = client.get(path, params)
+                latencies.append((time.perf_counter() - start) * 1000)
+            queries.append(counter.count)
+            statuses.add(response.status_code)
+
+        tracemalloc.start()
+        try:
+            client.get(path, params)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        result = {
+            "name": name,
+            "path": path,
+            "statuses": sorted(statuses),
+            "requests": self.repeat,
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p95_ms": round(percentile(latencies, 95), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+            "mean_ms": round(statistics.fmean(latencies), 3),
+            "queries": max(queries),
+            "peak_memory_kb": round(peak_memory / 1024, 1),
+        }
+        self.results.append(result)
+        return result
@@ -0,0 +1,7 @@
+from Utilities.Enums.BaseEnum import BaseEnum
+
+
+class EmailStatus(BaseEnum):
+    PENDING = "Pending"
+    SENT = "Sent"
+    FAILED = "Failed"
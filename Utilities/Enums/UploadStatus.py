@@ -0,0 +1,7 @@
+from Utilities.Enums.BaseEnum import BaseEnum
+
+
+class UploadStatus(BaseEnum):
+    PENDING = "Pending"
+    COMPLETED = "Completed"
+    ATTACHED = "Attached"
@@ -18,4 +18,6 @@ from Utilities.Enums.ToneTypes import ToneTypes
 from Utilities.Enums.TypeTypes import TypeTypes
 from Utilities.Enums.UserTypes import UserType
 from Utilities.Enums.BeatTypes import BeatTypes
-from Utilities.Enums.BeatFileTypes import BeatFileTypes
\ No newline at end of file
+from Utilities.Enums.BeatFileTypes import BeatFileTypes
+from Utilities.Enums.UploadStatus import UploadStatus
+from Utilities.Enums.EmailStatus import EmailStatus
@@ -0,0 +1,220 @@
+import threading
+import time
+
+from django.core.cache import cache
+
+from Utilities.CommitBatch import CommitBatch
+
+
+class FacetIndex:
+    """In-memory faceted search index over the audio files of approved submissions.
+
+    Every facet value owns a posting list stored as a bitmap (a Python int whose bit n is
+    set when audio file n carries that value). Filters are answered with bitwise AND/OR
+    and facet counts with popcounts, so a search never joins the taxonomy tables.
+
+    The index is built lazily from one query, patched in place by signals on approval,
+    rejection and metadata edits once their transaction commits, and rebuilt when another
+    process bumps the shared version in the cache or when it is older than ``ttl`` seconds.
+    """
+
+    facets = ("genre", "sub_genre", "instrument", "sub_instrument", "mood", "key", "scale", "source", "type")
+    min_bpm = 1
+    max_bpm = 400
+
+    def __init__(self, name, get_queryset, fields: dict, bpm_fields=("bpm__start_value", "bpm__end_value"),
+                 ttl=300):
+        self.name = name
+        self.get_queryset = get_queryset
+        self.fields = fields
+        self.bpm_fields = bpm_fields
+        self.ttl = ttl
+
+        self.postings = None
+        self.bpm_postings = None
+        self.rows = None
+        self.everything = 0
+        self.version = None
+        self.built_at = 0
+        self.lock = threading.RLock()
+        self.changes = CommitBatch(self.refresh)
+
+    @property
+    def version_key(self):
+        return f"facet-index:{self.name}:version"
+
+    def __shared_version(self):
+        version = cache.get(self.version_key)
+        if version is None:
+            cache.add(self.version_key, 1, timeout=None)
+            version = cache.get(self.version_key, 1)
+        return version
+
+    def __bump_version(self):
+        try:
+            version = cache.incr(self.version_key)
+        except ValueError:
+            cache.add(self.version_key, 1, timeout=None)
+            version = None
+        # a jump of more than one means another process changed rows this copy has not read, so rebuild
+        self.version = version if self.version is not None and version == self.version + 1 else None
+
+    def __values(self):
+        return ("id", *(self.fields[facet] for facet in self.facets), *self.bpm_fields)
+
+    def __bpm_range(self, start, end):
+        try:
+            start = int(start)
+            end = int(end) if end not in (None, "") else start
+        except (TypeError, ValueError):
+            return None
+        if start > end:
+            start, end = end, start
+        return max(start, self.min_bpm), min(end, self.max_bpm)
+
+    def __add(self, row):
+        file_id, values, bpm = row[0], row[1:len(self.facets) + 1], row[len(self.facets) + 1:]
+        bit = 1 << file_id
+        entry = []
+        for facet, value in zip(self.facets, values):
+            if value is None or value == "":
+                entry.append(None)
+                continue
+            value = str(value)
+            postings = self.postings[facet]
+            postings[value] = postings.get(value, 0) | bit
+            entry.append(value)
+
+        bpm = self.__bpm_range(*bpm)
+        if bpm:
+            for value in range(bpm[0], bpm[1] + 1):
+                self.bpm_postings[value] = self.bpm_postings.get(value, 0) | bit
+        entry.append(bpm)
+
+        self.rows[file_id] = tuple(entry)
+        self.everything |= bit
+
+    def __remove(self, file_id):
+        entry = self.rows.pop(file_id, None)
+        if entry is None:
+            return
+        mask = ~(1 << file_id)
+        for facet, value in zip(self.facets, entry):
+            if value is not None:
+                self.postings[facet][value] &= mask
+        bpm = entry[-1]
+        if bpm:
+            for value in range(bpm[0], bpm[1] + 1):
+                self.bpm_postings[value] &= mask
+        self.everything &= mask
+
+    def build(self):
+        """This function (re)builds the whole index from the database"""
+        with self.lock:
+            version = self.__shared_version()
+            self.postings = {facet: {} for facet in self.facets}
+            self.bpm_postings = {}
+            self.rows = {}
+            self.everything = 0
+            for row in self.get_queryset().values_list(*self.__values()).distinct():
+                self.__add(row)
+            self.version = version
+            self.built_at = time.monotonic()
+
+    def ensure_fresh(self):
+        """This function rebuilds the index if it is missing, expired or outdated by another process"""
+        if (self.rows is None or time.monotonic() - self.built_at > self.ttl
+                or self.version != self.__shared_version()):
+            self.build()
+
+    def refresh(self, file_ids):
+        """This function re-reads the given audio files and adds, updates or drops them in the index"""
+        file_ids = {int(file_id) for file_id in file_ids if file_id is not None}
+        if not file_ids:
+            return
+        with self.lock:
+            if self.rows is not None:
+                rows = self.get_queryset().filter(id__in=file_ids).values_list(*self.__values()).distinct()
+                for file_id in file_ids:
+                    self.__remove(file_id)
+                for row in rows:
+                    self.__add(row)
+            self.__bump_version()
+
+    def refresh_on_commit(self, file_ids):
+        """This function refreshes the given audio files once, after the current transaction commits
+
+        Rows are read back after the commit, so no process can rebuild from rows that are rolled back and
+        files deleted by the transaction are dropped as they are not found.
+        """
+        self.changes.add(int(file_id) for file_id in file_ids if file_id is not None)
+
+    def remove(self, file_ids):
+        """This function drops the given audio files from the index"""
+        with self.lock:
+            if self.rows is not None:
+                for file_id in file_ids:
+                    self.__remove(int(file_id))
+            self.__bump_version()
+
+    def invalidate(self):
+        """This function drops the whole index so every process rebuilds it on its next search"""
+        with self.lock:
+            self.rows = None
+            self.__bump_version()
+
+    def __match(self, facet, values):
+        postings = self.postings[facet]
+        bitmap = 0
+        for value in values:
+            bitmap |= postings.get(value, 0)
+        return bitmap
+
+    def __match_bpm(self, bpm_min, bpm_max):
+        bpm_min = self.min_bpm if bpm_min is None else max(bpm_min, self.min_bpm)
+        bpm_max = self.max_bpm if bpm_max is None else min(bpm_max, self.max_bpm)
+        bitmap = 0
+        for value in range(bpm_min, bpm_max + 1):
+            bitmap |= self.bpm_postings.get(value, 0)
+        return bitmap
+
+    @staticmethod
+    def __ids(bitmap, offset, limit):
+        """This function returns the set bit positions of the bitmap from the highest down"""
+        bits = bin(bitmap)[2:]
+        ids = []
+        position = bits.find("1")
+        while position != -1 and len(ids) < offset + limit:
+            ids.append(len(bits) - 1 - position)
+            position = bits.find("1", position + 1)
+        return ids[offset:]
+
+    def search(self, filters: dict, bpm_min=None, bpm_max=None, offset=0, limit=20):
+        """This function returns the matching audio file ids (newest first), their total and the facet counts
+
+        Values of one facet are OR-ed, different facets are AND-ed. The counts of a facet apply every
+        filter except its own, so the client can still offer the sibling values of a selected one.
+        """
+        self.ensure_fresh()
+        with self.lock:
+            matches = {facet: self.__match(facet, values) for facet, values in filters.items() if values}
+            bpm = self.__match_bpm(bpm_min, bpm_max) if bpm_min is not None or bpm_max is not None else None
+
+            result = self.everything
+            for bitmap in matches.values():
+                result &= bitmap
+            if bpm is not None:
+                result &= bpm
+
+            counts = {}
+            for facet in self.facets:
+                base = self.everything if bpm is None else bpm
+                for other, bitmap in matches.items():
+                    if other != facet:
+                        base &= bitmap
+                counts[facet] = sorted(
+                    ({"value": value, "count": (bitmap & base).bit_count()}
+                     for value, bitmap in self.postings[facet].items() if bitmap & base),
+                    key=lambda item: (-item["count"], item["value"]))
+
+        return self.__ids(result, offset, limit), result.bit_count(), counts
@@ -0,0 +1,72 @@
+from importlib import import_module
+
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.test import APIClient
+
+from Utilities.QueryCounter import QueryCounter
+
+
+class QueryCountRegressionMixin:
+    """Test case mixin checking that the GET routes of an app urlconf run as many queries on a large
+    fixture as on a small one, so a serializer that starts querying per row fails the tests.
+
+    ``urlconf`` is the module of the routes and ``prefix`` the path it is included under. ``seed(size)``
+    fills the database with a fixture whose result sets grow with ``size`` and returns a dict of the users
+    and rows the requests need. ``routes`` maps every route with a GET handler to the fixture key of the
+    user sending the request and a function building its query parameters from the fixture, None when it
+    takes none. ``skipped`` maps the GET routes that cannot be measured to the reason. Each fixture is
+    rolled back after its requests, and every request starts from an empty cache.
+    """
+
+    urlconf = None
+    prefix = "/"
+    sizes = (2, 6)
+    routes = {}
+    skipped = {}
+
+    def seed(self, size):
+        raise NotImplementedError
+
+    def get_routes(self):
+        """This function returns the routes of the urlconf that have a GET handler"""
+        return [str(pattern.pattern) for pattern in import_module(self.urlconf).urlpatterns
+                if hasattr(getattr(pattern.callback, "view_class", None), "get")]
+
+    def request(self, route, user, params):
+        client = APIClient(raise_request_exception=False)
+        client.force_authenticate(user)
+        cache.clear()
+        with QueryCounter() as queries:
+            response = client.get(self.prefix + route, params)
+            if response.streaming:
+                b"".join(response.streaming_content)
+        return response.status_code, queries
+
+    def measure(self, size):
+        """This function seeds the fixture of the size and returns {route: (status, QueryCounter)}"""
+        with transaction.atomic():
+            fixture = self.seed(size)
+            results = {route: self.request(route, fixture[user], params(fixture) if params else None)
+                       for route, (user, params) in self.routes.items()}
+            transaction.set_rollback(True)
+        return results
+
+    def test_every_get_route_is_measured(self):
+        routes = self.get_routes()
+        self.assertEqual([route for route in routes if route not in self.routes and route not in self.skipped], [],
+                         "these routes have no query count case")
+        self.assertEqual([route for route in self.routes if route not in routes], [],
+                         "these routes are not in the urlconf")
+
+    def test_query_count_does_not_grow_with_result_size(self):
+        small_size, large_size = self.sizes
+        small, large = self.measure(small_size), self.measure(large_size)
+        for route in self.routes:
+            (small_status, small_queries), (large_status, large_queries) = small[route], large[route]
+            with self.subTest(route=route):
+                self.assertEqual((small_status, large_status), (200, 200))
+                self.assertLessEqual(
+                    large_queries.count, small_queries.count,
+                    f"{self.prefix}{route} ran {small_queries.count} queries with size {small_size} and "
+                    f"{large_queries.count} with size {large_size}, repeated: {large_queries.repeated()}")
@@ -0,0 +1,55 @@
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.db import connections
+
+LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+PLACEHOLDER_LISTS = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+SPACES = re.compile(r"\s+")
+
+
+def fingerprint(sql):
+    """This function reduces a statement to its shape, so the same query with other values compares equal"""
+    sql = LITERALS.sub("%s", sql)
+    sql = PLACEHOLDER_LISTS.sub("(%s)", sql)
+    return SPACES.sub(" ", sql).strip()
+
+
+class QueryCounter:
+    """Context manager counting the SQL statements run on every database connection of the current thread.
+
+    It records the number of statements, their total duration and how often each statement shape ran.
+    A shape that runs many times in one request is usually an N+1 query. Unlike
+    ``CaptureQueriesContext`` it does not need DEBUG and keeps no copy of the statements.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+        self.stack = None
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    def __enter__(self):
+        self.stack = ExitStack()
+        for connection in connections.all():
+            self.stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stack.close()
+        return False
+
+    def repeated(self, threshold=2):
+        """This function returns the {statement shape: times} of the shapes that ran at least ``threshold`` times"""
+        return {sql: times for sql, times in self.fingerprints.most_common() if times >= threshold}
@@ -0,0 +1,86 @@
+import heapq
+import threading
+import time
+
+from Utilities.CommitBatch import CommitBatch
+
+
+class ReviewerPool:
+    """Min-heap of staff members keyed by (open submissions, last assignment) for reviewer assignment.
+
+    ``pick`` hands out the least loaded staff member in O(log n), the one who waited longest on
+    ties, and refuses once everybody holds ``capacity`` open submissions. The heap is loaded from the
+    reviewer load table every ``ttl`` seconds. Between reloads ``refresh_loads`` recounts the staff
+    whose submissions changed state and moves them in the heap; superseded entries are skipped
+    when they reach the top.
+    """
+
+    def __init__(self, staff_loads, recount, capacity, ttl=60):
+        self.staff_loads = staff_loads
+        self.recount = recount
+        self.capacity = capacity
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.heap = []
+        self.current = None
+        self.loaded_at = 0
+        self.sequence = 0
+        self.changes = CommitBatch(self.refresh_loads)
+
+    def __ensure_fresh(self):
+        if self.current is not None and time.monotonic() - self.loaded_at <= self.ttl:
+            return
+        last_assigned = {staff_id: entry[1] for staff_id, entry in (self.current or {}).items()}
+        self.current = {staff_id: (load, last_assigned.get(staff_id, 0)) for staff_id, load in self.staff_loads()}
+        self.__rebuild()
+        self.loaded_at = time.monotonic()
+
+    def __rebuild(self):
+        self.heap = [(load, assigned, staff_id) for staff_id, (load, assigned) in self.current.items()]
+        heapq.heapify(self.heap)
+
+    def __set(self, staff_id, load, assigned):
+        if self.current.get(staff_id) == (load, assigned):
+            return
+        self.current[staff_id] = (load, assigned)
+        heapq.heappush(self.heap, (load, assigned, staff_id))
+        if len(self.heap) > 4 * len(self.current) + 16:
+            self.__rebuild()
+
+    def pick(self):
+        """This function returns the id of the staff member to assign the next submission to, None if all are full"""
+        with self.lock:
+            self.__ensure_fresh()
+            while self.heap:
+                load, assigned, staff_id = self.heap[0]
+                if self.current.get(staff_id) != (load, assigned):
+                    heapq.heappop(self.heap)
+                    continue
+                if load >= self.capacity:
+                    return None
+                self.sequence += 1
+                self.__set(staff_id, load + 1, self.sequence)
+                return staff_id
+            return None
+
+    def refresh_loads(self, staff_ids):
+        """This function recounts the open submissions of the staff and updates their place in the heap"""
+        staff_ids = [staff_id for staff_id in staff_ids if staff_id is not None]
+        if not staff_ids:
+            return
+        loads = self.recount(staff_ids)
+        with self.lock:
+            if self.current is None:
+                return
+            for staff_id, load in loads.items():
+                if staff_id in self.current:
+                    self.__set(staff_id, load, self.current[staff_id][1])
+
+    def refresh_loads_on_commit(self, staff_ids):
+        """This function recounts the given staff once, after the current transaction commits"""
+        self.changes.add(staff_ids)
+
+    def invalidate(self):
+        """This function makes the next pick reload the staff list and their loads"""
+        with self.lock:
+            self.current = None
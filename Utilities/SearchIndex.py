@@ -0,0 +1,290 @@
+import bisect
+import json
+import math
+import os
+import re
+import threading
+
+from django.conf import settings
+from django.db import connection
+
+from Utilities.CommitBatch import CommitBatch
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text):
+    """This function splits a text into lower cased word tokens"""
+    return TOKEN_RE.findall((text or "").lower())
+
+
+class InvertedIndex:
+    """Pure-Python inverted index persisted as JSON, used when FTS5 is not available.
+
+    Postings map a term to {document id: weight}, title tokens weighing more than description
+    tokens. The sorted term list answers prefix lookups with a bisect. Other processes pick up
+    changes by reloading the file when its modification time moves.
+    """
+
+    title_weight = 3
+    description_weight = 1
+    max_prefix_terms = 50
+
+    def __init__(self, path):
+        self.path = path
+        self.docs = None
+        self.postings = None
+        self.terms = None
+        self.mtime = None
+        self.lock = threading.RLock()
+
+    @property
+    def is_loaded(self):
+        return self.docs is not None
+
+    def __file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def load(self):
+        """This function loads the index from disk, returns False if there is nothing persisted yet"""
+        with self.lock:
+            try:
+                with open(self.path, "r", encoding="utf-8") as index_file:
+                    data = json.load(index_file)
+            except (FileNotFoundError, ValueError):
+                return False
+            self.docs = {int(doc_id): doc for doc_id, doc in data["docs"].items()}
+            self.postings = {term: {int(doc_id): weight for doc_id, weight in postings.items()}
+                             for term, postings in data["postings"].items()}
+            self.terms = sorted(self.postings)
+            self.mtime = self.__file_mtime()
+            return True
+
+    def save(self):
+        """This function atomically writes the index to disk"""
+        with self.lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as index_file:
+                json.dump({"docs": self.docs, "postings": self.postings}, index_file)
+            os.replace(temp_path, self.path)
+            self.mtime = self.__file_mtime()
+
+    def reset(self):
+        with self.lock:
+            self.docs, self.postings, self.terms = {}, {}, []
+
+    def reload_if_changed(self):
+        if self.is_loaded and self.__file_mtime() not in (None, self.mtime):
+            self.load()
+
+    def add(self, doc_id, title, description, type_):
+        with self.lock:
+            self.remove(doc_id)
+            weights = {}
+            for token in tokenize(title):
+                weights[token] = weights.get(token, 0) + self.title_weight
+            for token in tokenize(description):
+                weights[token] = weights.get(token, 0) + self.description_weight
+            for token, weight in weights.items():
+                if token not in self.postings:
+                    bisect.insort(self.terms, token)
+                    self.postings[token] = {}
+                self.postings[token][doc_id] = weight
+            self.docs[doc_id] = [title or "", type_, list(weights)]
+
+    def remove(self, doc_id):
+        with self.lock:
+            doc = self.docs.pop(doc_id, None)
+            if doc is None:
+                return
+            for token in doc[2]:
+                postings = self.postings.get(token)
+                if postings is None:
+                    continue
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self.postings[token]
+                    del self.terms[bisect.bisect_left(self.terms, token)]
+
+    def __expand(self, prefix):
+        start = bisect.bisect_left(self.terms, prefix)
+        terms = []
+        for term in self.terms[start:start + self.max_prefix_terms]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, tokens, type_=None):
+        """This function returns the ids of the documents holding every token (the last one as a prefix), best first"""
+        with self.lock:
+            total = len(self.docs) or 1
+            scores = None
+            for position, token in enumerate(tokens):
+                terms = self.__expand(token) if position == len(tokens) - 1 else [token]
+                matched = {}
+                for term in terms:
+                    postings = self.postings.get(term, {})
+                    idf = math.log(1 + total / len(postings)) if postings else 0
+                    for doc_id, weight in postings.items():
+                        matched[doc_id] = max(matched.get(doc_id, 0), weight * idf)
+                if scores is None:
+                    scores = matched
+                else:
+                    scores = {doc_id: score + matched[doc_id] for doc_id, score in scores.items() if doc_id in matched}
+                if not scores:
+                    return []
+            if type_:
+                scores = {doc_id: score for doc_id, score in scores.items() if self.docs[doc_id][1] == type_}
+            return sorted(scores, key=lambda doc_id: (-scores[doc_id], -doc_id))
+
+    def title(self, doc_id):
+        return self.docs[doc_id][0]
+
+
+class TextSearchIndex:
+    """Ranked title/description search over approved submissions.
+
+    On SQLite builds with FTS5 the documents live in a virtual table created by the app migrations
+    (rowid = submission id) and are ranked with bm25. Everywhere else an InvertedIndex persisted
+    under ``SEARCH_INDEX_DIR`` is used. Either way the index is kept in sync by the app signals, which
+    refresh the submissions a transaction touched once it commits.
+    """
+
+    title_rank_weight = 10.0
+    description_rank_weight = 1.0
+
+    def __init__(self, table, get_queryset, fields: dict):
+        self.table = table
+        self.get_queryset = get_queryset
+        self.fields = fields
+        self.__has_fts_table = None
+        self.fallback = InvertedIndex(os.path.join(settings.SEARCH_INDEX_DIR, f"{table}.json"))
+        self.changes = CommitBatch(self.refresh)
+
+    @property
+    def uses_fts(self):
+        if connection.vendor != "sqlite":
+            return False
+        if self.__has_fts_table is None:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [self.table])
+                self.__has_fts_table = cursor.fetchone() is not None
+        return self.__has_fts_table
+
+    def __rows(self, ids=None):
+        queryset = self.get_queryset()
+        if ids is not None:
+            queryset = queryset.filter(id__in=ids)
+        return queryset.values_list("id", self.fields["title"], self.fields["description"], self.fields["type"])
+
+    def __ensure_fallback(self):
+        if not self.fallback.is_loaded and not self.fallback.load():
+            self.rebuild()
+        else:
+            self.fallback.reload_if_changed()
+
+    def rebuild(self):
+        """This function re-indexes every approved submission"""
+        if self.uses_fts:
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM "{self.table}"')
+                cursor.executemany(
+                    f'INSERT INTO "{self.table}" (rowid, title, description, type) VALUES (%s, %s, %s, %s)',
+                    [(doc_id, title or "", description or "", type_) for doc_id, title, description, type_
+                     in self.__rows()])
+            return
+        self.fallback.reset()
+        for row in self.__rows():
+            self.fallback.add(*row)
+        self.fallback.save()
+
+    def refresh(self, ids):
+        """This function re-reads the given submissions and adds, updates or drops them in the index"""
+        ids = {int(id_) for id_ in ids if id_ is not None}
+        if not ids:
+            return
+        rows = list(self.__rows(ids))
+        if self.uses_fts:
+            with connection.cursor() as cursor:
+                cursor.executemany(f'DELETE FROM "{self.table}" WHERE rowid = %s', [(id_,) for id_ in ids])
+                cursor.executemany(
+                    f'INSERT INTO "{self.table}" (rowid, title, description, type) VALUES (%s, %s, %s, %s)',
+                    [(doc_id, title or "", description or "", type_) for doc_id, title, description, type_ in rows])
+            return
+        with self.fallback.lock:
+            self.__ensure_fallback()
+            for id_ in ids:
+                self.fallback.remove(id_)
+            for row in rows:
+                self.fallback.add(*row)
+            self.fallback.save()
+
+    def remove(self, ids):
+        self.refresh(ids)
+
+    def refresh_on_commit(self, ids):
+        """This function refreshes the given submissions once, after the current transaction commits
+
+        Rows are only read back once committed, and the fallback file is written once per transaction
+        instead of once per saved row.
+        """
+        self.changes.add(int(id_) for id_ in ids if id_ is not None)
+
+    @staticmethod
+    def __completes(title, tokens):
+        title_tokens = set(tokenize(title))
+        return (all(token in title_tokens for token in tokens[:-1])
+                and any(title_token.startswith(tokens[-1]) for title_token in title_tokens))
+
+    @staticmethod
+    def __match_expression(tokens):
+        return " ".join(f'"{token}"' for token in tokens[:-1]) + f' "{tokens[-1]}"*'
+
+    def search(self, query, type_=None, offset=0, limit=20):
+        """This function returns the ids of the matching submissions, best first, and their total"""
+        tokens = tokenize(query)
+        if not tokens:
+            return [], 0
+        if self.uses_fts:
+            type_filter = "AND type = %s" if type_ else ""
+            params = [self.__match_expression(tokens), *([type_] if type_ else [])]
+            with connection.cursor() as cursor:
+                cursor.execute(f'SELECT count(*) FROM "{self.table}" WHERE "{self.table}" MATCH %s {type_filter}',
+                               params)
+                total = cursor.fetchone()[0]
+                cursor.execute(
+                    f'SELECT rowid FROM "{self.table}" WHERE "{self.table}" MATCH %s {type_filter} '
+                    f'ORDER BY bm25("{self.table}", {self.title_rank_weight}, {self.description_rank_weight}), '
+                    f'rowid DESC LIMIT %s OFFSET %s', [*params, limit, offset])
+                return [row[0] for row in cursor.fetchall()], total
+
+        with self.fallback.lock:
+            self.__ensure_fallback()
+            ids = self.fallback.search(tokens, type_)
+        return ids[offset:offset + limit], len(ids)
+
+    def typeahead(self, query, type_=None, limit=8):
+        """This function returns the distinct titles completing the query, best first"""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        if self.uses_fts:
+            type_filter = "AND type = %s" if type_ else ""
+            params = [f'title : ({self.__match_expression(tokens)})', *([type_] if type_ else [])]
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'SELECT title FROM "{self.table}" WHERE "{self.table}" MATCH %s {type_filter} '
+                    f'ORDER BY bm25("{self.table}", {self.title_rank_weight}, {self.description_rank_weight}) '
+                    f'LIMIT %s', [*params, limit * 4])
+                titles = [row[0] for row in cursor.fetchall()]
+        else:
+            with self.fallback.lock:
+                self.__ensure_fallback()
+                titles = [self.fallback.title(doc_id) for doc_id in self.fallback.search(tokens, type_)]
+            titles = [title for title in titles if self.__completes(title, tokens)][:limit * 4]
+        return list(dict.fromkeys(titles))[:limit]
@@ -0,0 +1,244 @@
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from Utilities.Enums import FileStatus, SubmissionStatus
+from Utilities.Enums.BPMTypes import BPMTypes
+from Utilities.Enums.KeyTypes import KeyScaleTypes, KeyTypes, FlatKeys, SharpKeys
+from Utilities.Enums.SourceTypes import SourceTypes
+
+WORDS = ("Midnight", "Golden", "Velvet", "Neon", "Analog", "Dusty", "Crystal", "Urban", "Lunar", "Electric", "Silk",
+         "Hollow", "Solar", "Vintage", "Deep", "Frozen", "Wild", "Smoky", "Cosmic", "Raw")
+NOUNS = ("Drums", "Keys", "Vocals", "Textures", "Grooves", "Chops", "Loops", "Strings", "Bass", "Pads", "Horns",
+         "Guitars", "Bells", "Synths", "Percussion")
+OPEN_STATUSES = (SubmissionStatus.UPLOADED.value, SubmissionStatus.PROCESS.value, SubmissionStatus.SUBMITTED.value)
+
+
+def bulk_insert(model, rows, batch_size):
+    """This function inserts the unsaved rows in batches and returns them with their primary keys set"""
+    return model.objects.bulk_create(rows, batch_size=batch_size)
+
+
+def m2m_columns(field):
+    """This function returns the names of the (source, target) id columns of the through model of a many-to-many"""
+    return f"{field.m2m_field_name()}_id", f"{field.m2m_reverse_field_name()}_id"
+
+
+def m2m_rows(field, pairs):
+    """This function builds the through rows linking the (source id, target id) pairs of a many-to-many field"""
+    source, target = m2m_columns(field)
+    return [field.remote_field.through(**{source: source_id, target: target_id}) for source_id, target_id in pairs]
+
+
+def count_of(related_model, related_field):
+    """This function returns the number of related rows pointing at the outer row, as a subquery expression"""
+    return Coalesce(Subquery(related_model.objects.filter(**{related_field: OuterRef("pk")}).order_by().
+                             values(related_field).annotate(count=Count("id")).values("count")), Value(0))
+
+
+class SyntheticCatalog:
+    """Generates a random but realistic catalog (taxonomy, products, audio files, submissions, likes and
+    downloads) for one of the product apps, with bulk inserts only.
+
+    The models of the app are given as keyword arguments, ``product_field`` is the name of the foreign
+    key to the product (``pack`` or ``beat``) on the submission, like and download models, and
+    ``type_field`` the name of the product type field of the submissions. Bulk inserts skip the signals,
+    so the counters and catalog cards are computed once at the end and ``after_generate`` rebuilds the
+    app's indexes and caches.
+    """
+
+    def __init__(self, name, product_field, type_field, product_types, file_type_field, file_types, after_generate,
+                 **models):
+        self.name = name
+        self.product_field = product_field
+        self.type_field = type_field
+        self.product_types = product_types
+        self.file_type_field = file_type_field
+        self.file_types = file_types
+        self.after_generate = after_generate
+        self.models = models
+
+    def generate(self, rng, suppliers, members, staff, products, files_per_product, likes, downloads,
+                 batch_size=2000, approved=0.9, log=lambda message: None):
+        """This function generates the catalog and returns the number of rows created per model
+
+        ``suppliers`` is a list of (supplier id, artist name), ``members`` and ``staff`` are lists of user ids,
+        ``approved`` is the share of the submissions that are approved, the others are still open.
+        """
+        self.rng, self.batch_size, self.approved, self.created = rng, batch_size, approved, {}
+        taxonomy = self.__generate_taxonomy()
+        log(f"{self.name}: taxonomy generated")
+        product_files, submissions = self.__generate_products(taxonomy, suppliers, staff, products,
+                                                              files_per_product, log)
+        self.__generate_likes(product_files, members, likes, log)
+        self.__generate_downloads(product_files, members, downloads, log)
+        self.__recount()
+        log(f"{self.name}: counters recomputed")
+        self.__generate_cards(submissions, taxonomy, dict(suppliers))
+        log(f"{self.name}: catalog cards generated")
+        self.after_generate()
+        return self.created
+
+    def __insert(self, model_name, rows):
+        model = self.models[model_name] if isinstance(model_name, str) else model_name
+        rows = bulk_insert(model, rows, self.batch_size)
+        self.created[model.__name__] = self.created.get(model.__name__, 0) + len(rows)
+        return rows
+
+    def __generate_taxonomy(self):
+        genres = self.__insert("genre", [self.models["genre"](name=f"{word} Genre") for word in WORDS[:12]])
+        sub_genres = self.__insert("sub_genre", [self.models["sub_genre"](name=f"{genre.name} {index}", genre=genre)
+                                                 for genre in genres for index in range(4)])
+        instruments = self.__insert("instrument", [self.models["instrument"](name=noun) for noun in NOUNS[:10]])
+        sub_instruments = self.__insert("sub_instrument", [
+            self.models["sub_instrument"](name=f"{instrument.name} {index}", instrument=instrument)
+            for instrument in instruments for index in range(4)])
+        moods = self.__insert("mood", [self.models["mood"](name=f"{word} Mood") for word in WORDS[:15]])
+        bpms = []
+        for _ in range(60):
+            start = self.rng.randint(60, 180)
+            exact = self.rng.random() < 0.7
+            bpms.append(self.models["bpm"](start_value=start, end_value=start if exact else start + 4,
+                                           bpm_type=BPMTypes.EXACT.value if exact else BPMTypes.RANGE.value))
+        bpms = self.__insert("bpm", bpms)
+        keys = self.__insert("key", [self.models["key"](key=key, key_scale=scale, key_type=key_type)
+                                     for key_type, keys in ((KeyTypes.SHARP.value, SharpKeys.list()),
+                                                            (KeyTypes.FLAT.value, FlatKeys.list()))
+                                     for key in keys for scale in KeyScaleTypes.list()])
+        return {"genres": genres, "sub_genres": {genre.id: [sub_genre for sub_genre in sub_genres
+                                                            if sub_genre.genre_id == genre.id] for genre in genres},
+                "instruments": instruments,
+                "sub_instruments": {instrument.id: [sub_instrument for sub_instrument in sub_instruments
+                                                    if sub_instrument.instrument_id == instrument.id]
+                                    for instrument in instruments},
+                "moods": moods, "bpms": bpms, "keys": keys}
+
+    def __audio_file(self, file, taxonomy):
+        rng = self.rng
+        genre = rng.choice(taxonomy["genres"])
+        instrument = rng.choice(taxonomy["instruments"])
+        return self.models["audio_file"](**{
+            "file": file, "genre": genre, "sub_genre": rng.choice(taxonomy["sub_genres"][genre.id]),
+            "instrument": instrument, "sub_instrument": rng.choice(taxonomy["sub_instruments"][instrument.id]),
+            "mood": rng.choice(taxonomy["moods"]), "bpm": rng.choice(taxonomy["bpms"]),
+            "key": rng.choice(taxonomy["keys"]), self.file_type_field: rng.choice(self.file_types),
+            "source": rng.choice(SourceTypes.list()), "status": FileStatus.APPROVED.value,
+        })
+
+    def __generate_products(self, taxonomy, suppliers, staff, count, files_per_product, log):
+        rng = self.rng
+        product_files, submissions = [], []
+        chunk = max(1, self.batch_size // max(files_per_product, 1))
+        for first in range(0, count, chunk):
+            size = min(chunk, count - first)
+            files = self.__insert("file", [self.models["file"](file_name=f"{rng.choice(WORDS)} {rng.choice(NOUNS)} "
+                                                                         f"{first * files_per_product + index}.wav",
+                                                               file_size=str(rng.randint(100, 20000)))
+                                           for index in range(size * files_per_product)])
+            audio_files = self.__insert("audio_file", [self.__audio_file(file, taxonomy) for file in files])
+
+            products = []
+            for index in range(size):
+                genre = rng.choice(taxonomy["genres"])
+                products.append(self.models["product"](
+                    title=f"{rng.choice(WORDS)} {rng.choice(NOUNS)} {first + index}",
+                    description=f"{rng.choice(WORDS)} {rng.choice(NOUNS).lower()} for {genre.name.lower()}",
+                    genre=genre, sub_genre=rng.choice(taxonomy["sub_genres"][genre.id])))
+            products = self.__insert("product", products)
+
+            links, moods = [], []
+            for index, product in enumerate(products):
+                files_of_product = [audio_file.id for audio_file in
+                                    audio_files[index * files_per_product:(index + 1) * files_per_product]]
+                product_files.append((product.id, files_of_product))
+                links += [(product.id, file_id) for file_id in files_of_product]
+                moods += [(product.id, mood.id) for mood in rng.sample(taxonomy["moods"], 3)]
+            product_model = self.models["product"]
+            self.__insert(product_model.audio_files.through,
+                          m2m_rows(product_model._meta.get_field("audio_files"), links))
+            self.__insert(product_model.mood.through, m2m_rows(product_model._meta.get_field("mood"), moods))
+
+            rows = []
+            for product in products:
+                approved = rng.random() < self.approved
+                rows.append(self.models["submission"](**{
+                    self.product_field: product, "supplier_id": rng.choice(suppliers)[0],
+                    "approval_person_id": rng.choice(staff) if staff else None,
+                    self.type_field: rng.choice(self.product_types),
+                    "status": SubmissionStatus.APPROVED.value if approved else rng.choice(OPEN_STATUSES),
+                }))
+            submissions += self.__insert("submission", rows)
+            log(f"{self.name}: {first + size}/{count} products generated")
+        return product_files, submissions
+
+    def __generate_likes(self, product_files, members, count, log):
+        files = [(product_id, file_id) for product_id, file_ids in product_files for file_id in file_ids]
+        if not files or not members:
+            return
+        per_member, extra = divmod(count, len(members))
+        rows = []
+        for index, member_id in enumerate(members):
+            liked = min(per_member + (index < extra), len(files))
+            for product_id, file_id in (files[position] for position in self.rng.sample(range(len(files)), liked)):
+                rows.append(self.models["like"](**{self.product_field + "_id": product_id, "file_id": file_id,
+                                                   "member_id": member_id}))
+            if len(rows) >= self.batch_size * 10:
+                self.__insert("like", rows)
+                rows = []
+        self.__insert("like", rows)
+        log(f"{self.name}: {self.created.get(self.models['like'].__name__, 0)} likes generated")
+
+    def __generate_downloads(self, product_files, members, count, log):
+        if not product_files or not members:
+            return
+        per_member, extra = divmod(count, len(members))
+        pending = []
+        for index, member_id in enumerate(members):
+            downloaded = min(per_member + (index < extra), len(product_files))
+            for position in self.rng.sample(range(len(product_files)), downloaded):
+                pending.append((member_id, product_files[position]))
+            if len(pending) >= self.batch_size * 5 or index == len(members) - 1:
+                downloads = self.__insert("download", [
+                    self.models["download"](**{self.product_field + "_id": product_id, "member_id": member_id})
+                    for member_id, (product_id, _) in pending])
+                self.__insert("file_download", [
+                    self.models["file_download"](download=download, audio_file_id=file_id)
+                    for download, (_, (_, file_ids)) in zip(downloads, pending)
+                    for file_id in self.rng.sample(file_ids, min(len(file_ids), self.rng.randint(1, 3)))])
+                pending = []
+        log(f"{self.name}: {self.created.get(self.models['download'].__name__, 0)} downloads generated")
+
+    def __recount(self):
+        with transaction.atomic():
+            self.models["audio_file"].objects.update(
+                likes_count=count_of(self.models["like"], "file"),
+                downloads_count=count_of(self.models["file_download"], "audio_file"))
+            self.models["product"].objects.update(
+                downloads_count=count_of(self.models["download"], self.product_field))
+
+    def __generate_cards(self, submissions, taxonomy, artists):
+        approved = [submission for submission in submissions if submission.status == SubmissionStatus.APPROVED.value]
+        first_id = min((getattr(submission, f"{self.product_field}_id") for submission in submissions), default=0)
+        # the generated products are the newest ones, so id ranges select them without long IN lists
+        products = self.models["product"].objects.filter(id__gte=first_id). \
+            annotate(files_count=Count("audio_files"), likes_count=Sum("audio_files__likes_count")). \
+            select_related("genre", "sub_genre").in_bulk()
+        mood_names = {mood.id: mood.name for mood in taxonomy["moods"]}
+        mood_field = self.models["product"]._meta.get_field("mood")
+        source, target = m2m_columns(mood_field)
+        moods = {}
+        for product_id, mood_id in mood_field.remote_field.through.objects.filter(**{f"{source}__gte": first_id}). \
+                values_list(source, target):
+            moods.setdefault(product_id, []).append(mood_names.get(mood_id, ""))
+
+        cards = []
+        for submission in approved:
+            product = products[getattr(submission, f"{self.product_field}_id")]
+            cards.append(self.models["card"](**{
+                "submission": submission, self.type_field: getattr(submission, self.type_field),
+                "title": product.title, "artist": artists.get(submission.supplier_id, ""),
+                "genre": product.genre.name, "sub_genre": product.sub_genre.name,
+                "moods": moods.get(product.id, []), "files_count": product.files_count,
+                "likes_count": product.likes_count or 0, "downloads_count": product.downloads_count,
+            }))
+        self.__insert("card", cards)
@@ -0,0 +1,74 @@
+import threading
+import time
+
+from django.core.cache import cache
+
+from Utilities.TaxonomyLookup import TaxonomyLookup
+
+
+class TaxonomyCache:
+    """Versioned in-process cache of the genre, sub-genre, instrument, sub-instrument and mood tables.
+
+    It holds the name lookups used by the submission validators and the serialized dropdown trees.
+    Any committed write to those tables bumps a version stored in the Django cache, which makes every
+    process drop its copy on the next read. ``ttl`` bounds staleness when the cache backend is not shared.
+    """
+
+    def __init__(self, name, genre_model, sub_genre_model, instrument_model, sub_instrument_model, mood_model,
+                 ttl=60):
+        self.name = name
+        self.models = (genre_model, sub_genre_model, instrument_model, sub_instrument_model, mood_model)
+        self.ttl = ttl
+        self.version = None
+        self.loaded_at = 0
+        self.taxonomy = None
+        self.dropdowns = {}
+        self.lock = threading.RLock()
+
+    @property
+    def version_key(self):
+        return f"taxonomy:{self.name}:version"
+
+    def __shared_version(self):
+        version = cache.get(self.version_key)
+        if version is None:
+            cache.add(self.version_key, 1, timeout=None)
+            version = cache.get(self.version_key, 1)
+        return version
+
+    def __ensure_fresh(self):
+        version = self.__shared_version()
+        if version != self.version or time.monotonic() - self.loaded_at > self.ttl:
+            self.taxonomy = None
+            self.dropdowns = {}
+            self.version = version
+            self.loaded_at = time.monotonic()
+
+    def lookup(self):
+        """This function returns the TaxonomyLookup of the whole taxonomy"""
+        with self.lock:
+            self.__ensure_fresh()
+            if self.taxonomy is None:
+                self.taxonomy = TaxonomyLookup(*self.models)
+            return self.taxonomy
+
+    def dropdown(self, key, build):
+        """This function returns the cached dropdown data of the given key, building it on a miss"""
+        with self.lock:
+            self.__ensure_fresh()
+            if key not in self.dropdowns:
+                self.dropdowns[key] = build()
+            return self.dropdowns[key]
+
+    def invalidate(self):
+        """This function makes every process reload the taxonomy on its next read
+
+        Signals call it once their transaction commits: bumped earlier, a concurrent read could cache the
+        rows the transaction is about to replace under the new version.
+        """
+        with self.lock:
+            try:
+                cache.incr(self.version_key)
+            except ValueError:
+                cache.add(self.version_key, 1, timeout=None)
+            self.version = None
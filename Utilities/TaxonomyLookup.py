@@ -0,0 +1,42 @@
+class TaxonomyLookup:
+    """Name lookups over the genre, sub-genre, instrument, sub-instrument and mood tables, one query per table.
+
+    Lookups keep the semantics of ``Model.objects.filter(name=...).first()``: when several rows share
+    a name, the one with the lowest id wins.
+    """
+
+    def __init__(self, genre_model, sub_genre_model, instrument_model, sub_instrument_model, mood_model):
+        self.genres = self.__by_name(genre_model.objects.all())
+        self.sub_genres = self.__by_parent_and_name(sub_genre_model.objects.all(), "genre_id")
+        self.instruments = self.__by_name(instrument_model.objects.all())
+        self.sub_instruments = self.__by_parent_and_name(sub_instrument_model.objects.all(), "instrument_id")
+        self.moods = self.__by_name(mood_model.objects.all())
+
+    @staticmethod
+    def __by_name(queryset):
+        rows = {}
+        for row in queryset.order_by("id"):
+            rows.setdefault(row.name, row)
+        return rows
+
+    @staticmethod
+    def __by_parent_and_name(queryset, parent_field):
+        rows = {}
+        for row in queryset.order_by("id"):
+            rows.setdefault((getattr(row, parent_field), row.name), row)
+        return rows
+
+    def genre(self, name):
+        return self.genres.get(name)
+
+    def sub_genre(self, genre, name):
+        return self.sub_genres.get((genre.id, name))
+
+    def instrument(self, name):
+        return self.instruments.get(name)
+
+    def sub_instrument(self, instrument, name):
+        return self.sub_instruments.get((instrument.id, name))
+
+    def mood(self, name):
+        return self.moods.get(name)
@@ -0,0 +1,57 @@
+import threading
+import time
+
+from django.core.cache import cache
+
+
+class UserSnapshotCache:
+    """In-process cache of the users behind the JWTs this process validated, keyed by user id.
+
+    A snapshot holds the concrete field values of the user, which is rebuilt from them without a
+    query. ``invalidate`` bumps a per-user version stored in the Django cache, which drops the
+    snapshot in every process sharing that cache. Processes that do not share it (the default local
+    memory backend) only drop the snapshot after ``ttl`` seconds.
+    """
+
+    def __init__(self, name, model, ttl=30):
+        self.name = name
+        self.model = model
+        self.ttl = ttl
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.field_names = [field.attname for field in model._meta.concrete_fields]
+
+    def version_key(self, user_id):
+        return f"users:{self.name}:{user_id}:version"
+
+    def version(self, user_id):
+        """This function returns the current version of the user, to read before loading it from the database"""
+        return cache.get(self.version_key(user_id), 0)
+
+    def get(self, user_id):
+        """This function returns the cached user, None when it is not cached or stale"""
+        with self.lock:
+            entry = self.entries.get(str(user_id))
+        if entry is None:
+            return None
+        version, loaded_at, values = entry
+        if time.monotonic() - loaded_at > self.ttl or self.version(user_id) != version:
+            with self.lock:
+                self.entries.pop(str(user_id), None)
+            return None
+        return self.model.from_db("default", self.field_names, values)
+
+    def put(self, user, version):
+        """This function caches the snapshot of a user loaded after reading the given version"""
+        values = [getattr(user, field_name) for field_name in self.field_names]
+        with self.lock:
+            self.entries[str(user.pk)] = (version, time.monotonic(), values)
+
+    def invalidate(self, user_id):
+        """This function drops the snapshot of the user in every process"""
+        with self.lock:
+            self.entries.pop(str(user_id), None)
+        try:
+            cache.incr(self.version_key(user_id))
+        except ValueError:
+            cache.add(self.version_key(user_id), 1, timeout=None)
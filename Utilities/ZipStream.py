@@ -0,0 +1,79 @@
+import os
+import time
+import zipfile
+
+
+class _ZipSink:
+    """Write-only file object collecting what zipfile writes until the generator hands it out.
+
+    It has ``tell`` but no ``seek``, so zipfile writes data descriptors after each entry instead of
+    seeking back to patch the local headers.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.offset = 0
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.offset += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.offset
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        """This function yields what was written since the last drain, if anything"""
+        if self.chunks:
+            chunks, self.chunks = self.chunks, []
+            yield b"".join(chunks)
+
+
+def unique_archive_name(name, used_names):
+    """This function returns the name, suffixed with a counter if the archive already holds it"""
+    base, ext = os.path.splitext(name)
+    candidate, counter = name, 1
+    while candidate in used_names:
+        counter += 1
+        candidate = f"{base} ({counter}){ext}"
+    used_names.add(candidate)
+    return candidate
+
+
+def stream_zip(entries, chunk_size=64 * 1024):
+    """This function yields a ZIP archive of the given (archive name, file path) entries as it is built
+
+    Entries are stored without compression, audio being compressed already, and every file is read
+    in chunk_size blocks, so memory stays constant whatever the size of the archive. Files over 4 GiB
+    get ZIP64 headers.
+    """
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for name, path in entries:
+            stat = os.stat(path)
+            info = zipfile.ZipInfo(name, date_time=time.localtime(stat.st_mtime)[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            info.file_size = stat.st_size
+            with open(path, "rb") as source, archive.open(info, mode="w") as target:
+                for block in iter(lambda: source.read(chunk_size), b""):
+                    target.write(block)
+                    yield from sink.drain()
+            yield from sink.drain()
+    yield from sink.drain()
+
+
+def audio_file_entries(audio_files):
+    """This function returns the (archive name, file path) entries of the audio files stored on disk"""
+    entries, used_names = [], set()
+    for audio_file in audio_files:
+        stored = audio_file.file.file if audio_file.file else None
+        if not stored or not os.path.isfile(stored.path):
+            continue
+        name = os.path.basename(audio_file.file.file_name or stored.name)
+        if not os.path.splitext(name)[1]:
+            name += os.path.splitext(stored.name)[1]
+        entries.append((unique_archive_name(name, used_names), stored.path))
+    return entries
@@ -7,8 +7,9 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 
 def generate_token(user):
-    refresh = RefreshToken.for_user(user)
-    return f"{refresh.access_token}"
+    access_token = RefreshToken.for_user(user).access_token
+    access_token[user.TOKEN_VERSION_CLAIM] = user.token_version
+    return f"{access_token}"
 
 
 def extract_error_messages(error_messages: []):